@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Compare reparsing a pattern corpus with loading its columnar export.
+
+Loads --patterns-dir with PatternRegistry (no parse cache), writes the
+table in each available format, then times read_table() + to_patterns()
+and the generate_report aggregation over the loaded registry:
+
+    python benchmarks/bench_columnar_export.py --patterns-dir /path/to/patterns
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent / "src"))
+
+from best_practices_mcp.resources.columnar import read_table, write_table  # noqa: E402
+from best_practices_mcp.resources.pattern_registry import PatternRegistry  # noqa: E402
+from best_practices_mcp.tools.sync_documentation import _generate_report  # noqa: E402
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, round((time.perf_counter() - start) * 1000, 1)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--patterns-dir", type=Path, default=HERE.parents[1] / "patterns-v1")
+    ap.add_argument("--repeat", type=int, default=5, help="report runs to average")
+    args = ap.parse_args()
+
+    registry = PatternRegistry(args.patterns_dir)
+    patterns, parse_ms = timed(registry.get_all)
+    table, table_ms = timed(registry.to_table)
+    result = {"patterns": len(patterns), "reparse_ms": parse_ms, "build_table_ms": table_ms}
+
+    formats = ["json"]
+    try:
+        import pyarrow  # noqa: F401
+        formats.append("parquet")
+    except ImportError:
+        pass
+    for fmt in formats:
+        directory = Path(tempfile.mkdtemp()) / fmt
+        _, result[f"{fmt}_write_ms"] = timed(write_table, table, directory, format=fmt)
+        loaded, result[f"{fmt}_read_ms"] = timed(read_table, directory)
+        _, result[f"{fmt}_to_patterns_ms"] = timed(loaded.to_patterns)
+
+    sources = MagicMock()
+    sources.get_all.return_value = []
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        _generate_report(registry, sources, args.patterns_dir, args.patterns_dir / "INDEX.md")
+    result["report_ms"] = round((time.perf_counter() - start) * 1000 / args.repeat, 1)
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
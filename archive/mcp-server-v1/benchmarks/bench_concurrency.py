@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Fire parallel call_tool requests at a stdio server and report p50/p99 latency.
+
+Starts the server as a subprocess, waits for the registries to load, then
+sends --requests quick validate_single calls at once alongside --slow
+corpus-wide requests. A server that blocks its event loop makes the quick
+calls wait for the slow ones. With --compare-rev the server source at that
+git revision is measured the same way first:
+
+    python benchmarks/bench_concurrency.py --patterns-dir /path/to/patterns --compare-rev HEAD~1
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+HERE = Path(__file__).resolve().parent
+SLOW_CALL = ("validate_patterns", {"action": "validate_all", "validation_type": "cross-refs"})
+
+
+def source_at(rev):
+    """Extract src/ as it was at a git revision and return its path."""
+    tmp = Path(tempfile.mkdtemp())
+    archive = subprocess.run(
+        ["git", "archive", rev, "src"], cwd=HERE.parent, check=True, capture_output=True,
+    ).stdout
+    subprocess.run(["tar", "-x", "-C", str(tmp)], input=archive, check=True)
+    return tmp / "src"
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def timed(session, name, arguments):
+    start = time.perf_counter()
+    await session.call_tool(name, arguments)
+    return time.perf_counter() - start
+
+
+async def measure(src, args):
+    env = dict(
+        os.environ,
+        PYTHONPATH=str(src),
+        REPO_ROOT=str(args.repo_root),
+        PATTERNS_DIR=str(args.patterns_dir),
+        WATCH_MODE="off",
+    )
+    params = StdioServerParameters(
+        command=sys.executable, args=["-m", "best_practices_mcp.server"], env=env,
+    )
+    async with stdio_client(params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            # The first call loads the registries; keep it out of the numbers
+            listing = await session.call_tool(
+                "validate_patterns", {"action": "validate_all", "validation_type": "structure"}
+            )
+            ids = [r["pattern_id"] for r in json.loads(listing.content[0].text)["results"]]
+
+            quick = [
+                timed(session, "validate_patterns", {
+                    "action": "validate_single",
+                    "pattern_id": ids[i % len(ids)],
+                    "validation_type": "structure",
+                })
+                for i in range(args.requests)
+            ]
+            slow = [timed(session, *SLOW_CALL) for _ in range(args.slow)]
+            start = time.perf_counter()
+            latencies = await asyncio.gather(*slow, *quick)
+            wall = time.perf_counter() - start
+
+    slow_latencies, quick_latencies = latencies[:args.slow], latencies[args.slow:]
+    result = {
+        "requests": args.requests,
+        "slow": args.slow,
+        "wall_s": round(wall, 3),
+        "quick_p50_ms": round(percentile(quick_latencies, 50) * 1000, 1),
+        "quick_p99_ms": round(percentile(quick_latencies, 99) * 1000, 1),
+    }
+    if slow_latencies:
+        result["slow_mean_ms"] = round(statistics.mean(slow_latencies) * 1000, 1)
+    return result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repo-root", type=Path, default=HERE.parents[2])
+    ap.add_argument("--patterns-dir", type=Path, default=HERE.parents[1] / "patterns-v1")
+    ap.add_argument("--requests", "-n", type=int, default=50)
+    ap.add_argument("--slow", type=int, default=1,
+                    help="corpus-wide validate_all requests sent with the quick ones")
+    ap.add_argument("--compare-rev", help="also benchmark the server at this git revision")
+    args = ap.parse_args()
+    args.repo_root = args.repo_root.resolve()
+    args.patterns_dir = args.patterns_dir.resolve()
+
+    runs = [("current", HERE.parent / "src")]
+    if args.compare_rev:
+        runs.insert(0, (args.compare_rev, source_at(args.compare_rev)))
+    for label, src in runs:
+        result = asyncio.run(measure(src, args))
+        print(f"{label:>12}: {json.dumps(result)}")
+
+
+if __name__ == "__main__":
+    main()
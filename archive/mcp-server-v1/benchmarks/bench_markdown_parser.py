@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Benchmark MarkdownParser throughput in ms per MB of pattern markdown.
+
+Parses every *.md file in a patterns directory (default: archive/patterns-v1)
+several times and reports the best run. With --compare-rev, the parser module
+is also loaded from that git revision and benchmarked on the same input, so
+before/after numbers come from one invocation:
+
+    python benchmarks/bench_markdown_parser.py --compare-rev HEAD~1
+"""
+import argparse
+import importlib.util
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent / "src"))
+
+from best_practices_mcp.parsers.markdown_parser import MarkdownParser  # noqa: E402
+
+PARSER_PATH = "src/best_practices_mcp/parsers/markdown_parser.py"
+
+
+def load_parser_at(rev):
+    """Import markdown_parser.py as it was at a git revision."""
+    source = subprocess.run(
+        ["git", "show", f"{rev}:./{PARSER_PATH}"],
+        cwd=HERE.parent, check=True, capture_output=True, text=True,
+    ).stdout
+    tmp = Path(tempfile.mkdtemp()) / "markdown_parser_ref.py"
+    tmp.write_text(source)
+    spec = importlib.util.spec_from_file_location("markdown_parser_ref", tmp)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.MarkdownParser
+
+
+def bench(parser_cls, patterns_dir, texts, repeat):
+    parser = parser_cls(patterns_dir)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for path, text in texts:
+            parser.parse_text(path, text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--patterns-dir", type=Path, default=HERE.parents[1] / "patterns-v1")
+    ap.add_argument("--copies", type=int, default=20,
+                    help="parse each file this many times per run to smooth timings")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--compare-rev", help="also benchmark the parser at this git revision")
+    args = ap.parse_args()
+
+    files = sorted(args.patterns_dir.glob("*.md"))
+    texts = [(p, p.read_text(encoding="utf-8")) for p in files] * args.copies
+    mb = sum(len(t.encode("utf-8")) for _, t in texts) / 1e6
+    print(f"{len(files)} files x {args.copies} = {mb:.2f} MB")
+
+    runs = [("current", MarkdownParser)]
+    if args.compare_rev:
+        runs.insert(0, (args.compare_rev, load_parser_at(args.compare_rev)))
+
+    for label, parser_cls in runs:
+        if not hasattr(parser_cls, "parse_text"):
+            print(f"{label:>12}: no parse_text(); revision predates this benchmark")
+            continue
+        seconds = bench(parser_cls, args.patterns_dir, texts, args.repeat)
+        print(f"{label:>12}: {seconds / mb * 1000:7.1f} ms/MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Measure the memory held by loaded registries on a synthetic corpus.
+
+Generates --patterns pattern files that cite sources from a shared pool,
+plus a SOURCES.md listing that pool, then loads PatternRegistry and
+SourceRegistry in a fresh interpreter under tracemalloc and reports the
+memory still allocated once loading finishes. With --compare-rev the
+registries at that git revision are measured on the same corpus:
+
+    python benchmarks/bench_registry_memory.py --patterns 50000 --compare-rev HEAD~1
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+
+PHASES = ["foundational", "specify", "plan", "tasks", "implement", "cross-phase"]
+SECTIONS = ["Overview", "Problem", "Solution", "Implementation", "Example", "Anti-Patterns", "Related Patterns"]
+
+MEASURE = """
+import gc, json, sys, tracemalloc
+from pathlib import Path
+from best_practices_mcp.resources.pattern_registry import PatternRegistry
+from best_practices_mcp.resources.source_registry import SourceRegistry
+
+corpus = Path(sys.argv[1])
+gc.collect()
+tracemalloc.start()
+patterns = PatternRegistry(corpus / "patterns")
+count = len(patterns.get_all())
+gc.collect()
+pattern_bytes = tracemalloc.get_traced_memory()[0]
+sources = SourceRegistry(corpus / "SOURCES.md")
+source_count = len(sources.get_all())
+gc.collect()
+source_bytes = tracemalloc.get_traced_memory()[0] - pattern_bytes
+print(json.dumps({
+    "patterns": count,
+    "pattern_registry_mb": round(pattern_bytes / 1e6, 1),
+    "bytes_per_pattern": pattern_bytes // max(count, 1),
+    "sources": source_count,
+    "source_registry_mb": round(source_bytes / 1e6, 2),
+}))
+"""
+
+
+def generate(corpus, count, source_pool, seed=0):
+    """Write count pattern files and a SOURCES.md for a pool of sources."""
+    rng = random.Random(seed)
+    patterns_dir = corpus / "patterns"
+    patterns_dir.mkdir(parents=True)
+    ids = [f"pattern-{i:06d}" for i in range(count)]
+    pool = [(f"Source {i}", f"https://example{i % 200}.com/articles/{i}") for i in range(source_pool)]
+
+    for pattern_id in ids:
+        lines = [
+            f"# {pattern_id.replace('-', ' ').title()}",
+            "",
+            f"**Evidence Tier**: {rng.choice('ABCD')}",
+            f"**SDD Phase**: {rng.choice(PHASES).title()}",
+            "",
+        ]
+        for section in rng.sample(SECTIONS, 5):
+            lines += [f"## {section}", "", "Some text about the pattern.", ""]
+        lines += ["## Related Patterns", ""]
+        for related in rng.sample(ids, 3):
+            lines.append(f"- [{related}](./{related}.md)")
+        lines += ["", "## Sources", ""]
+        for title, url in rng.sample(pool, 5):
+            lines.append(f"- [{title}]({url}) (Evidence Tier {rng.choice('AB')})")
+        (patterns_dir / f"{pattern_id}.md").write_text("\n".join(lines) + "\n")
+
+    entries = ["# Sources", "", "## Primary Sources (Tier A)", ""]
+    for i, (title, url) in enumerate(pool):
+        entries += [
+            f"### {title}",
+            f"**URL**: {url}",
+            "**Type**: Article",
+            "**Key Insights**:",
+            "- One insight",
+            "- Another insight",
+            f"**Used in**: patterns/{ids[i % count]}.md",
+            "",
+        ]
+    (corpus / "SOURCES.md").write_text("\n".join(entries) + "\n")
+
+
+def source_at(rev):
+    """Extract src/ as it was at a git revision and return its path."""
+    tmp = Path(tempfile.mkdtemp())
+    archive = subprocess.run(
+        ["git", "archive", rev, "src"], cwd=HERE.parent, check=True, capture_output=True,
+    ).stdout
+    subprocess.run(["tar", "-x", "-C", str(tmp)], input=archive, check=True)
+    return tmp / "src"
+
+
+def measure(src, corpus):
+    env = dict(os.environ, PYTHONPATH=str(src))
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE, str(corpus)],
+        env=env, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--patterns", type=int, default=50000)
+    ap.add_argument("--sources", type=int, default=2000, help="size of the shared source pool")
+    ap.add_argument("--corpus-dir", type=Path,
+                    help="reuse or create the corpus here instead of a temporary directory")
+    ap.add_argument("--compare-rev", help="also measure the registries at this git revision")
+    args = ap.parse_args()
+
+    corpus = args.corpus_dir or Path(tempfile.mkdtemp()) / "corpus"
+    if not (corpus / "patterns").exists():
+        generate(corpus, args.patterns, args.sources)
+
+    runs = [("current", HERE.parent / "src")]
+    if args.compare_rev:
+        runs.insert(0, (args.compare_rev, source_at(args.compare_rev)))
+    for label, src in runs:
+        print(f"{label:>12}: {json.dumps(measure(src, corpus))}")
+
+
+if __name__ == "__main__":
+    main()
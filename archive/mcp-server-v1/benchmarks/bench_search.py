@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Measure search_patterns query latency on a synthetic corpus.
+
+Generates --patterns pattern files whose words follow a Zipf distribution
+over a fixed vocabulary, loads them into PatternRegistry, builds the search
+index and times --queries random one- to three-word queries:
+
+    python benchmarks/bench_search.py --patterns 10000 --top-k 10
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent / "src"))
+
+from best_practices_mcp.resources.pattern_registry import PatternRegistry  # noqa: E402
+
+SECTIONS = ["Overview", "Problem", "Solution", "Implementation", "Example", "Anti-Patterns"]
+
+
+def vocabulary(size, rng):
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(letters) for _ in range(rng.randint(3, 10))))
+    return sorted(words)
+
+
+def generate(directory, count, words, rng):
+    weights = [1 / (rank + 1) for rank in range(len(words))]
+    directory.mkdir(parents=True)
+    for i in range(count):
+        lines = [f"# {' '.join(rng.choices(words, weights, k=3)).title()}", ""]
+        for section in rng.sample(SECTIONS, 4):
+            lines += [f"## {section}", ""]
+            for _ in range(3):
+                lines.append(" ".join(rng.choices(words, weights, k=30)) + ".")
+            lines.append("")
+        (directory / f"pattern-{i:05d}.md").write_text("\n".join(lines))
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--patterns", type=int, default=10000)
+    ap.add_argument("--vocabulary", type=int, default=20000)
+    ap.add_argument("--queries", type=int, default=1000)
+    ap.add_argument("--top-k", type=int, default=10)
+    ap.add_argument("--patterns-dir", type=Path,
+                    help="reuse or create the corpus here instead of a temporary directory")
+    args = ap.parse_args()
+
+    rng = random.Random(0)
+    words = vocabulary(args.vocabulary, rng)
+    directory = args.patterns_dir or Path(tempfile.mkdtemp()) / "patterns"
+    if not directory.exists():
+        generate(directory, args.patterns, words, rng)
+
+    registry = PatternRegistry(directory)
+    count = len(registry.get_all())
+    start = time.perf_counter()
+    registry.search("warm")
+    build_ms = (time.perf_counter() - start) * 1000
+
+    # Favour common words, as real queries do, but reach into the tail too
+    queries = [
+        " ".join(rng.choice(words[:rng.choice((50, 500, len(words)))]) for _ in range(rng.randint(1, 3)))
+        for _ in range(args.queries)
+    ]
+    for query in queries:
+        # First use of a term computes its scores; time the steady state
+        registry.search(query, args.top_k)
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        registry.search(query, args.top_k)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    print(json.dumps({
+        "patterns": count,
+        "index_build_ms": round(build_ms, 1),
+        "top_k": args.top_k,
+        "query_p50_ms": round(percentile(latencies, 50), 3),
+        "query_p99_ms": round(percentile(latencies, 99), 3),
+        "query_mean_ms": round(statistics.mean(latencies), 3),
+    }))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Measure the tools/list payload the server sends, and fail past a budget.
+
+Starts the server over stdio once per TOOL_SCHEMA mode, performs the
+initialize handshake, and sizes the tools/list result the same way as
+research/artifacts/2026-07-18-mcp-wire/mcp_wire_measure.py (JSON characters,
+tokens estimated as chars/4). Exits non-zero if a mode exceeds its budget:
+
+    python benchmarks/bench_tools_list.py --budget-full 2500 --budget-compact 1500
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+
+# Budgets in JSON characters; raise them deliberately, not by accident
+DEFAULT_BUDGETS = {"full": 2900, "compact": 1800}
+
+
+def rpc(proc, obj):
+    proc.stdin.write((json.dumps(obj) + "\n").encode())
+    proc.stdin.flush()
+
+
+def read_msg(proc, want_id, deadline):
+    while time.time() < deadline:
+        line = proc.stdout.readline()
+        if not line:
+            time.sleep(0.05)
+            continue
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            m = json.loads(line)
+        except ValueError:
+            continue
+        if m.get("id") == want_id:
+            return m
+    return None
+
+
+def measure(mode):
+    env = dict(
+        os.environ,
+        TOOL_SCHEMA=mode,
+        WARM_UP="0",
+        WATCH_MODE="off",
+        PYTHONPATH=str(HERE.parent / "src"),
+    )
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "best_practices_mcp.server"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env,
+    )
+    deadline = time.time() + 60
+    try:
+        rpc(proc, {"jsonrpc": "2.0", "id": 1, "method": "initialize",
+                   "params": {"protocolVersion": "2025-06-18",
+                              "capabilities": {},
+                              "clientInfo": {"name": "measure", "version": "0.0.1"}}})
+        if not read_msg(proc, 1, deadline):
+            return {"mode": mode, "error": "no initialize response"}
+        rpc(proc, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        rpc(proc, {"jsonrpc": "2.0", "id": 2, "method": "tools/list", "params": {}})
+        resp = read_msg(proc, 2, deadline)
+    finally:
+        proc.kill()
+    if not resp or "result" not in resp:
+        return {"mode": mode, "error": f"no tools/list result: {str(resp)[:200]}"}
+
+    tools = resp["result"].get("tools", [])
+    total = len(json.dumps(tools))
+    per = sorted(
+        ({"name": t.get("name"), "json_chars": len(json.dumps(t))} for t in tools),
+        key=lambda x: -x["json_chars"],
+    )
+    return {"mode": mode, "n_tools": len(tools), "total_json_chars": total,
+            "est_tokens_chars4": total // 4, "tools": per}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--budget-full", type=int, default=DEFAULT_BUDGETS["full"])
+    ap.add_argument("--budget-compact", type=int, default=DEFAULT_BUDGETS["compact"])
+    args = ap.parse_args()
+    budgets = {"full": args.budget_full, "compact": args.budget_compact}
+
+    failed = False
+    for mode, budget in budgets.items():
+        result = measure(mode)
+        print(json.dumps(result, indent=1))
+        if "error" in result:
+            failed = True
+        elif result["total_json_chars"] > budget:
+            print(f"{mode}: {result['total_json_chars']} chars exceeds budget of {budget}")
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
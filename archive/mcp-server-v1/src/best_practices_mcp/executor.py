@@ -0,0 +1,60 @@
+"""Bounded thread pool for blocking registry and validation work."""
+
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Same default as ThreadPoolExecutor: work here is file I/O as much as CPU
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_max_workers = DEFAULT_WORKERS
+_lock = threading.Lock()
+
+
+def configure(max_workers: int) -> None:
+    """Set the pool size; takes effect when the pool is next created."""
+    global _max_workers
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    _max_workers = max_workers
+
+
+def max_workers() -> int:
+    """The configured pool size."""
+    return _max_workers
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the shared pool, creating it on first use."""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_max_workers, thread_name_prefix="best-practices-blocking"
+            )
+        return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking call on the shared pool so the event loop keeps serving requests.
+
+    The pool bounds how many blocking calls run at once; further calls wait
+    for a free worker without holding up the loop.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(func, *args, **kwargs))
+
+
+def shutdown() -> None:
+    """Stop the pool, waiting for running calls."""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
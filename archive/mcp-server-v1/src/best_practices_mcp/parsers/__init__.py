@@ -1,6 +1,7 @@
 """Parsers for markdown pattern files and SOURCES.md."""
 
 from .markdown_parser import MarkdownParser
+from .parse_cache import ParseCache
 from .sources_parser import SourcesParser
 
-__all__ = ["MarkdownParser", "SourcesParser"]
+__all__ = ["MarkdownParser", "ParseCache", "SourcesParser"]
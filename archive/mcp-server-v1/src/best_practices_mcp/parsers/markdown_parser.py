@@ -1,42 +1,115 @@
 """Parser for pattern markdown files."""
 
+import io
+import multiprocessing
+import os
 import re
-from dataclasses import dataclass, field
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Sequence
 
+# Bump when parse output changes so cached results are invalidated
+PARSER_VERSION = "2"
 
-@dataclass
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Share one copy of strings that repeat across many records."""
+    return sys.intern(value) if value is not None else None
+
+
+@dataclass(frozen=True, slots=True)
+class SourceRef:
+    """A source cited by a pattern."""
+    title: str
+    url: Optional[str] = None
+    tier: Optional[str] = None
+
+    def __post_init__(self):
+        # The same sources are cited by many patterns
+        object.__setattr__(self, "title", sys.intern(self.title))
+        object.__setattr__(self, "url", _intern(self.url))
+        object.__setattr__(self, "tier", _intern(self.tier))
+
+    def to_dict(self) -> dict:
+        return {"title": self.title, "url": self.url, "tier": self.tier}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SourceRef":
+        return cls(data["title"], data.get("url"), data.get("tier"))
+
+
+@dataclass(frozen=True, slots=True)
 class PatternMetadata:
-    """Metadata extracted from a pattern file."""
+    """Metadata extracted from a pattern file.
+
+    Immutable: list fields are stored as tuples, and sources given as dicts
+    are converted to SourceRef. Tiers, phases, section names, links and
+    pattern ids are interned, since they repeat across the corpus.
+    """
     id: str
     name: str
     file_path: str
-    sources: list[dict] = field(default_factory=list)
+    sources: tuple[SourceRef, ...] = ()
     evidence_tier: Optional[str] = None
     sdd_phase: Optional[str] = None
-    related_patterns: list[str] = field(default_factory=list)
-    sections: list[str] = field(default_factory=list)
-    internal_links: list[str] = field(default_factory=list)
-    external_links: list[str] = field(default_factory=list)
+    related_patterns: tuple[str, ...] = ()
+    sections: tuple[str, ...] = ()
+    internal_links: tuple[str, ...] = ()
+    external_links: tuple[str, ...] = ()
+
+    def __post_init__(self):
+        set_field = object.__setattr__
+        set_field(self, "id", sys.intern(self.id))
+        set_field(self, "sources", tuple(
+            s if isinstance(s, SourceRef) else SourceRef.from_dict(s) for s in self.sources
+        ))
+        set_field(self, "evidence_tier", _intern(self.evidence_tier))
+        set_field(self, "sdd_phase", _intern(self.sdd_phase))
+        for name in ("related_patterns", "sections", "internal_links", "external_links"):
+            set_field(self, name, tuple(map(sys.intern, getattr(self, name))))
 
     def to_dict(self) -> dict:
         return {
             "id": self.id,
             "name": self.name,
             "file_path": self.file_path,
-            "sources": self.sources,
+            "sources": [s.to_dict() for s in self.sources],
             "evidence_tier": self.evidence_tier,
             "sdd_phase": self.sdd_phase,
-            "related_patterns": self.related_patterns,
-            "sections": self.sections,
-            "internal_links": self.internal_links,
-            "external_links": self.external_links,
+            "related_patterns": list(self.related_patterns),
+            "sections": list(self.sections),
+            "internal_links": list(self.internal_links),
+            "external_links": list(self.external_links),
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "PatternMetadata":
+        return cls(**data)
+
+
+# Scanner states for multi-line source blocks
+_IDLE, _ARMED, _COLLECTING, _DONE = range(4)
+
+# Below this many bytes of input, parsing in worker processes costs more
+# than it saves
+PARALLEL_THRESHOLD_BYTES = 4 * 1024 * 1024
+
+# Chunks handed out per worker; more chunks even out uneven file sizes
+CHUNKS_PER_WORKER = 4
+
+# Batches are parsed from executor threads of a multi-threaded server, where
+# forking could copy locks held by other threads into the workers
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
 
 class MarkdownParser:
-    """Parser for pattern markdown files."""
+    """Parser for pattern markdown files.
+
+    Files are parsed in a single line-oriented pass that tracks code fence
+    state, so headings, markers and links inside fenced code are ignored.
+    """
 
     # Evidence tier pattern: (Evidence Tier A) or **Evidence Tier**: A
     EVIDENCE_TIER_PATTERN = re.compile(
@@ -53,147 +126,291 @@ class MarkdownParser:
     # Source link pattern: [title](url)
     LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
 
-    # Section header pattern: ## Header
-    SECTION_PATTERN = re.compile(r'^##\s+(.+)$', re.MULTILINE)
+    # Title line: # Title
+    TITLE_LINE = re.compile(r'#\s+(.+)')
+
+    # Section header line: ## Header
+    SECTION_LINE = re.compile(r'##\s+(.+)')
 
     # Related patterns pattern: patterns/xxx.md or ./xxx.md or [Pattern Name](./xxx.md)
     RELATED_PATTERN = re.compile(r'(?:patterns/|\./|/)([a-z0-9-]+)\.md')
 
-    def __init__(self, patterns_dir: Path):
+    # Inline code span: `...`
+    INLINE_CODE = re.compile(r'`[^`]+`')
+
+    # List item line: - item or * item
+    LIST_ITEM = re.compile(r'[-*]\s+.+')
+
+    # Source section markers
+    SOURCES_HEADING = re.compile(r'##\s+Sources?\s*')
+    FURTHER_READING_HEADING = re.compile(r'##\s+Further Reading\s*')
+    INLINE_SOURCES = re.compile(r'\*\*Sources?\*\*:')
+    TIER_SOURCES = re.compile(r'\*\*Tier ([A-D]) Sources?\*\*:\s*$')
+    HEADER_SOURCE = '**Source**:'
+
+    def __init__(
+        self,
+        patterns_dir: Path,
+        workers: int = 1,
+        parallel_threshold: int = PARALLEL_THRESHOLD_BYTES,
+    ):
+        """
+        Args:
+            patterns_dir: Directory containing the pattern files
+            workers: Worker processes for batch parsing; 1 parses serially
+                and 0 uses one process per CPU
+            parallel_threshold: Minimum batch size in bytes before worker
+                processes are used
+        """
         self.patterns_dir = patterns_dir
-
-    def _strip_code_blocks(self, content: str) -> str:
-        """Remove code blocks from content to avoid false link detection."""
-        # Remove fenced code blocks (```...```)
-        content = re.sub(r'```[\s\S]*?```', '', content)
-        # Remove inline code (`...`)
-        content = re.sub(r'`[^`]+`', '', content)
-        return content
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.parallel_threshold = parallel_threshold
 
     def parse_file(self, file_path: Path) -> PatternMetadata:
         """Parse a single pattern file."""
-        content = file_path.read_text(encoding='utf-8')
+        with file_path.open(encoding='utf-8') as f:
+            return self._parse_lines(file_path, f)
+
+    def parse_text(self, file_path: Path, content: str) -> PatternMetadata:
+        """Parse pattern content that has already been read from file_path."""
+        return self._parse_lines(file_path, io.StringIO(content, newline=None))
 
+    def _parse_lines(self, file_path: Path, lines: Iterable[str]) -> PatternMetadata:
+        """Scan a pattern file once, line by line."""
         # Extract pattern ID from filename
         pattern_id = file_path.stem
 
-        # Extract title from first H1
-        title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-        name = title_match.group(1) if title_match else pattern_id.replace('-', ' ').title()
-
-        # Extract evidence tier
-        tier_match = self.EVIDENCE_TIER_PATTERN.search(content)
+        name = None
         evidence_tier = None
-        if tier_match:
-            evidence_tier = tier_match.group(1) or tier_match.group(2)
-
-        # Extract SDD phase
-        phase_match = self.SDD_PHASE_PATTERN.search(content)
-        sdd_phase = phase_match.group(1).lower() if phase_match else None
-
-        # Extract sources
-        sources = self._extract_sources(content)
-
-        # Extract sections
-        sections = self.SECTION_PATTERN.findall(content)
-
-        # Strip code blocks before extracting links to avoid false positives
-        content_without_code = self._strip_code_blocks(content)
+        sdd_phase = None
+        sections: list[str] = []
+        internal_links: list[str] = []
+        external_links: list[str] = []
+        related: dict[str, None] = {}
+
+        # Source section state. Each format is collected separately and merged
+        # afterwards in a fixed order (see _merge_sources).
+        list_state = _IDLE
+        list_lines: list[str] = []
+        inline_state = _IDLE
+        inline_lines: list[str] = []
+        tier_state = _IDLE
+        tier_blocks: list[tuple[str, list[str]]] = []
+        further_state = _IDLE
+        further_links: list[tuple[str, str]] = []
+        header_state = _IDLE
+        header_source = None
+
+        in_fence = False
+        for line in lines:
+            line = line.rstrip('\n')
+
+            # Code fences: skip fenced content entirely
+            if '```' in line and line.lstrip().startswith('```'):
+                if line.count('```') == 1:
+                    in_fence = not in_fence
+                # Fences interrupt any source block being collected
+                if list_state == _COLLECTING:
+                    list_state = _DONE
+                elif list_state == _ARMED:
+                    list_state = _IDLE
+                if inline_state != _IDLE:
+                    inline_state = _DONE
+                if tier_state == _ARMED:
+                    tier_blocks.pop()
+                tier_state = _IDLE
+                continue
+            if in_fence:
+                continue
+
+            # Blank lines end lists and inline source blocks
+            if not line:
+                if list_state == _COLLECTING:
+                    list_state = _DONE
+                if inline_state == _COLLECTING:
+                    inline_state = _DONE
+                if tier_state == _COLLECTING:
+                    tier_state = _IDLE
+                continue
+
+            first = line[0]
+            is_section = first == '#' and line.startswith('##')
+
+            # Headings
+            if first == '#':
+                if name is None:
+                    title_match = self.TITLE_LINE.match(line)
+                    if title_match:
+                        name = title_match.group(1)
+                section_match = self.SECTION_LINE.match(line)
+                if section_match:
+                    sections.append(section_match.group(1))
+
+            # Evidence tier and SDD phase markers (first occurrence wins).
+            # Both marker forms contain "(" or "**", which is cheap to test.
+            has_bold = '**' in line
+            if evidence_tier is None and (has_bold or '(' in line):
+                tier_match = self.EVIDENCE_TIER_PATTERN.search(line)
+                if tier_match:
+                    evidence_tier = tier_match.group(1) or tier_match.group(2)
+            if sdd_phase is None and has_bold:
+                phase_match = self.SDD_PHASE_PATTERN.search(line)
+                if phase_match:
+                    sdd_phase = phase_match.group(1).lower()
+
+            # Links and related patterns, ignoring inline code
+            if '](' in line or '.md' in line:
+                text = self.INLINE_CODE.sub('', line) if '`' in line else line
+                for _, url in self.LINK_PATTERN.findall(text):
+                    if url.startswith('http://') or url.startswith('https://'):
+                        external_links.append(url)
+                    else:
+                        internal_links.append(url)
+                for related_id in self.RELATED_PATTERN.findall(text):
+                    related[related_id] = None
+
+            # Method 1: "## Sources" heading followed by a list
+            if list_state == _COLLECTING:
+                if self.LIST_ITEM.match(line):
+                    list_lines.append(line)
+                else:
+                    list_state = _DONE
+            elif list_state == _ARMED:
+                if self.LIST_ITEM.match(line):
+                    list_lines.append(line)
+                    list_state = _COLLECTING
+                elif line.strip():
+                    list_state = _IDLE
+            if list_state == _IDLE and is_section and self.SOURCES_HEADING.fullmatch(line):
+                list_state = _ARMED
+
+            # Method 2: "**Sources**: ..." up to the next blank line or ## heading
+            if inline_state == _COLLECTING:
+                if is_section:
+                    inline_state = _DONE
+                else:
+                    inline_lines.append(line)
+            elif inline_state == _ARMED:
+                if line.strip():
+                    inline_lines.append(line.lstrip())
+                    inline_state = _COLLECTING
+            elif inline_state == _IDLE and has_bold and '**Source' in line:
+                inline_match = self.INLINE_SOURCES.search(line)
+                if inline_match:
+                    rest = line[inline_match.end():]
+                    if rest.strip():
+                        inline_lines.append(rest.lstrip())
+                        inline_state = _COLLECTING
+                    else:
+                        inline_state = _ARMED
+
+            # Method 3: "**Tier X Sources**:" followed by a list
+            if tier_state == _COLLECTING:
+                if self.LIST_ITEM.match(line):
+                    tier_blocks[-1][1].append(line)
+                else:
+                    tier_state = _IDLE
+            elif tier_state == _ARMED:
+                if self.LIST_ITEM.match(line):
+                    tier_blocks[-1][1].append(line)
+                    tier_state = _COLLECTING
+                elif line.strip():
+                    tier_blocks.pop()
+                    tier_state = _IDLE
+            if tier_state == _IDLE and has_bold and '**Tier ' in line:
+                tier_match = self.TIER_SOURCES.search(line)
+                if tier_match:
+                    tier_blocks.append((tier_match.group(1), []))
+                    tier_state = _ARMED
+
+            # Method 4: "## Further Reading" section up to the next ## heading
+            if further_state == _COLLECTING:
+                if is_section:
+                    further_state = _DONE
+                elif '](' in line:
+                    further_links.extend(
+                        (title, url) for title, url in self.LINK_PATTERN.findall(line)
+                        if url.startswith('http')
+                    )
+            elif (further_state == _IDLE and is_section
+                    and self.FURTHER_READING_HEADING.fullmatch(line)):
+                further_state = _COLLECTING
+
+            # Method 5: "**Source**: description" header line (fallback)
+            if header_state == _ARMED:
+                if line.strip():
+                    header_source = line.strip()
+                    header_state = _DONE
+            elif header_state == _IDLE and first == '*' and line.startswith(self.HEADER_SOURCE):
+                rest = line[len(self.HEADER_SOURCE):].strip()
+                if rest:
+                    header_source = rest
+                    header_state = _DONE
+                else:
+                    header_state = _ARMED
 
-        # Extract all links (from content without code blocks)
-        all_links = self.LINK_PATTERN.findall(content_without_code)
-        internal_links = []
-        external_links = []
-        for title, url in all_links:
-            if url.startswith('http://') or url.startswith('https://'):
-                external_links.append(url)
-            else:
-                internal_links.append(url)
+        if tier_state == _ARMED:
+            tier_blocks.pop()
 
-        # Extract related patterns (from content without code blocks)
-        related_patterns = list(set(self.RELATED_PATTERN.findall(content_without_code)))
-        # Remove self-reference
-        related_patterns = [p for p in related_patterns if p != pattern_id]
+        sources = self._merge_sources(
+            list_lines, inline_lines, tier_blocks, further_links, header_source
+        )
 
         return PatternMetadata(
             id=pattern_id,
-            name=name,
+            name=name if name is not None else pattern_id.replace('-', ' ').title(),
             file_path=str(file_path.relative_to(self.patterns_dir.parent)),
             sources=sources,
             evidence_tier=evidence_tier,
             sdd_phase=sdd_phase,
-            related_patterns=related_patterns,
+            # Remove self-reference
+            related_patterns=[p for p in related if p != pattern_id],
             sections=sections,
             internal_links=internal_links,
             external_links=external_links,
         )
 
-    def _extract_sources(self, content: str) -> list[dict]:
-        """Extract source references from content."""
+    def _merge_sources(
+        self,
+        sources_list: list[str],
+        inline_lines: list[str],
+        tier_blocks: list[tuple[str, list[str]]],
+        further_links: list[tuple[str, str]],
+        header_source: Optional[str],
+    ) -> list[SourceRef]:
+        """Combine source candidates in priority order, de-duplicating URLs."""
         sources = []
         seen_urls = set()
 
-        # Method 1: Look for ## Sources section (most common format)
-        sources_section_match = re.search(
-            r'^##\s+Sources?\s*\n((?:[-*]\s+.+\n?)+)',
-            content,
-            re.MULTILINE
-        )
-        if sources_section_match:
-            sources_text = sources_section_match.group(1)
-            for line in sources_text.strip().split('\n'):
-                line_text = line.lstrip('-* ').strip()
-                if not line_text:
-                    continue
-                link_match = self.LINK_PATTERN.search(line)
-                if link_match:
-                    title, url = link_match.groups()
-                    if url not in seen_urls:
-                        seen_urls.add(url)
-                        tier_match = self.EVIDENCE_TIER_PATTERN.search(line)
-                        tier = None
-                        if tier_match:
-                            tier = tier_match.group(1) or tier_match.group(2)
-                        sources.append({
-                            "title": title,
-                            "url": url,
-                            "tier": tier
-                        })
-                else:
-                    # Plain text source (no URL)
-                    sources.append({
-                        "title": line_text,
-                        "url": None,
-                        "tier": None
-                    })
-
-        # Method 2: Look for **Sources**: or **Source**: inline format
-        inline_sources_match = re.search(
-            r'\*\*Sources?\*\*:\s*(.+?)(?:\n\n|\n##|\Z)',
-            content,
-            re.DOTALL
-        )
-        if inline_sources_match:
-            sources_text = inline_sources_match.group(1)
-            for link_match in self.LINK_PATTERN.finditer(sources_text):
+        # Method 1: ## Sources section (most common format)
+        for line in sources_list:
+            line_text = line.lstrip('-* ').strip()
+            if not line_text:
+                continue
+            link_match = self.LINK_PATTERN.search(line)
+            if link_match:
                 title, url = link_match.groups()
-                if url.startswith('http') and url not in seen_urls:
+                if url not in seen_urls:
                     seen_urls.add(url)
-                    sources.append({
-                        "title": title,
-                        "url": url,
-                        "tier": None
-                    })
-
-        # Method 3: Look for **Tier X Sources**: format (used in some patterns)
-        tier_sources_matches = re.finditer(
-            r'\*\*Tier ([A-D]) Sources?\*\*:\s*\n((?:[-*]\s+.+\n?)+)',
-            content
-        )
-        for match in tier_sources_matches:
-            tier = match.group(1)
-            sources_text = match.group(2)
-            for line in sources_text.strip().split('\n'):
+                    tier_match = self.EVIDENCE_TIER_PATTERN.search(line)
+                    tier = None
+                    if tier_match:
+                        tier = tier_match.group(1) or tier_match.group(2)
+                    sources.append(SourceRef(title, url, tier))
+            else:
+                # Plain text source (no URL)
+                sources.append(SourceRef(line_text, None, None))
+
+        # Method 2: **Sources**: or **Source**: inline format
+        for link_match in self.LINK_PATTERN.finditer('\n'.join(inline_lines)):
+            title, url = link_match.groups()
+            if url.startswith('http') and url not in seen_urls:
+                seen_urls.add(url)
+                sources.append(SourceRef(title, url, None))
+
+        # Method 3: **Tier X Sources**: format (used in some patterns)
+        for tier, lines in tier_blocks:
+            for line in lines:
                 # Extract title from line (may not have URL)
                 line = line.lstrip('-* ').strip()
                 link_match = self.LINK_PATTERN.search(line)
@@ -201,69 +418,92 @@ class MarkdownParser:
                     title, url = link_match.groups()
                     if url not in seen_urls:
                         seen_urls.add(url)
-                        sources.append({
-                            "title": title,
-                            "url": url,
-                            "tier": tier
-                        })
+                        sources.append(SourceRef(title, url, tier))
                 elif line and ':' in line:
                     # Non-link source like "Author: Title"
-                    sources.append({
-                        "title": line,
-                        "url": None,
-                        "tier": tier
-                    })
-
-        # Method 4: Look for ## Further Reading section
-        further_reading_match = re.search(
-            r'^##\s+Further Reading\s*\n((?:.*\n)*?)(?=^##|\Z)',
-            content,
-            re.MULTILINE
-        )
-        if further_reading_match:
-            section_text = further_reading_match.group(1)
-            for link_match in self.LINK_PATTERN.finditer(section_text):
-                title, url = link_match.groups()
-                if url.startswith('http') and url not in seen_urls:
-                    seen_urls.add(url)
-                    sources.append({
-                        "title": title,
-                        "url": url,
-                        "tier": None
-                    })
+                    sources.append(SourceRef(line, None, tier))
+
+        # Method 4: ## Further Reading section
+        for title, url in further_links:
+            if url not in seen_urls:
+                seen_urls.add(url)
+                sources.append(SourceRef(title, url, None))
 
-        # Method 5: Extract header **Source**: description (no URL, common at file top)
+        # Method 5: header **Source**: description (no URL, common at file top)
         # Only use if no other sources found (fallback)
-        if not sources:
-            header_source_match = re.search(
-                r'^\*\*Source\*\*:\s*(.+?)$',
-                content,
-                re.MULTILINE
-            )
-            if header_source_match:
-                description = header_source_match.group(1).strip()
-                # Check if it contains a link
-                link_match = self.LINK_PATTERN.search(description)
-                if link_match:
-                    title, url = link_match.groups()
-                    sources.append({
-                        "title": title,
-                        "url": url,
-                        "tier": None
-                    })
-                else:
-                    # Plain text source description
-                    sources.append({
-                        "title": description,
-                        "url": None,
-                        "tier": None
-                    })
+        if not sources and header_source:
+            link_match = self.LINK_PATTERN.search(header_source)
+            if link_match:
+                title, url = link_match.groups()
+                sources.append(SourceRef(title, url, None))
+            else:
+                # Plain text source description
+                sources.append(SourceRef(header_source, None, None))
 
         return sources
 
     def parse_all(self) -> list[PatternMetadata]:
         """Parse all pattern files in the directory."""
-        patterns = []
-        for file_path in sorted(self.patterns_dir.glob('*.md')):
-            patterns.append(self.parse_file(file_path))
-        return patterns
+        return self.parse_files(sorted(self.patterns_dir.glob('*.md')))
+
+    def parse_files(self, file_paths: Sequence[Path]) -> list[PatternMetadata]:
+        """Parse files from disk, returning results in the order given."""
+        sizes = [path.stat().st_size for path in file_paths]
+        return self._parse_batch(_parse_file_chunk, list(file_paths), sizes)
+
+    def parse_texts(self, items: Sequence[tuple[Path, str]]) -> list[PatternMetadata]:
+        """Parse (file_path, content) pairs, returning results in the order given."""
+        sizes = [len(content) for _, content in items]
+        return self._parse_batch(_parse_text_chunk, list(items), sizes)
+
+    def _parse_batch(self, parse_chunk, jobs: list, sizes: list[int]) -> list[PatternMetadata]:
+        """Run parse_chunk over jobs, in worker processes when the batch is large."""
+        if self.workers <= 1 or len(jobs) < 2 or sum(sizes) < self.parallel_threshold:
+            return [pattern for _, pattern in parse_chunk(self.patterns_dir, list(enumerate(jobs)))]
+
+        chunks = _chunk_by_size(sizes, self.workers * CHUNKS_PER_WORKER)
+        results: list[Optional[PatternMetadata]] = [None] * len(jobs)
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(chunks)),
+            mp_context=multiprocessing.get_context(START_METHOD),
+        ) as executor:
+            futures = [
+                executor.submit(parse_chunk, self.patterns_dir, [(i, jobs[i]) for i in chunk])
+                for chunk in chunks
+            ]
+            for future in futures:
+                for index, pattern in future.result():
+                    results[index] = pattern
+        return results
+
+
+def _chunk_by_size(sizes: list[int], max_chunks: int) -> list[list[int]]:
+    """Split job indexes into chunks of roughly equal total size.
+
+    Largest jobs are placed first, each into the currently lightest chunk, so
+    one big file does not leave the other workers idle at the end.
+    """
+    chunk_count = max(1, min(max_chunks, len(sizes)))
+    chunks: list[list[int]] = [[] for _ in range(chunk_count)]
+    totals = [0] * chunk_count
+    for index in sorted(range(len(sizes)), key=lambda i: sizes[i], reverse=True):
+        lightest = totals.index(min(totals))
+        chunks[lightest].append(index)
+        totals[lightest] += sizes[index]
+    return [chunk for chunk in chunks if chunk]
+
+
+# Worker entry points live at module level so they can be pickled
+
+
+def _parse_file_chunk(patterns_dir: Path, chunk: list[tuple[int, Path]]) -> list[tuple[int, PatternMetadata]]:
+    parser = MarkdownParser(patterns_dir)
+    return [(index, parser.parse_file(path)) for index, path in chunk]
+
+
+def _parse_text_chunk(
+    patterns_dir: Path, chunk: list[tuple[int, tuple[Path, str]]]
+) -> list[tuple[int, PatternMetadata]]:
+    parser = MarkdownParser(patterns_dir)
+    return [(index, parser.parse_text(path, content)) for index, (path, content) in chunk]
+
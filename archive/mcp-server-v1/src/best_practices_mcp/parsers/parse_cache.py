@@ -0,0 +1,72 @@
+"""Persistent cache of parser output."""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+
+class ParseCache:
+    """SQLite-backed store of serialized parse results.
+
+    Entries are keyed by kind ("pattern" or "sources") and file path, and are
+    only returned when both the content hash and the parser version match, so
+    a restart only re-parses files that changed since they were cached.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS parse_cache (
+            kind TEXT NOT NULL,
+            path TEXT NOT NULL,
+            digest TEXT NOT NULL,
+            version TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            PRIMARY KEY (kind, path)
+        )
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute(self.SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, path: str, digest: str, version: str) -> Optional[Any]:
+        """Return the cached payload, or None if missing or stale."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest, version, payload FROM parse_cache WHERE kind = ? AND path = ?",
+                (kind, path),
+            ).fetchone()
+        if row is None or row[0] != digest or row[1] != version:
+            return None
+        return json.loads(row[2])
+
+    def put(self, kind: str, path: str, digest: str, version: str, payload: Any) -> None:
+        """Store a payload; call commit() to persist a batch of puts."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO parse_cache (kind, path, digest, version, payload) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (kind, path, digest, version, json.dumps(payload)),
+            )
+
+    def delete(self, kind: str, path: str) -> None:
+        """Forget the entry for a deleted file."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM parse_cache WHERE kind = ? AND path = ?", (kind, path)
+            )
+
+    def commit(self) -> None:
+        """Persist pending writes."""
+        with self._lock:
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        with self._lock:
+            self._conn.close()
@@ -1,22 +1,43 @@
 """Parser for SOURCES.md file."""
 
 import re
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
+# Bump when parse output changes so cached results are invalidated
+PARSER_VERSION = "2"
 
-@dataclass
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Share one copy of strings that repeat across many entries."""
+    return sys.intern(value) if value is not None else None
+
+
+@dataclass(frozen=True, slots=True)
 class SourceEntry:
-    """A source entry from SOURCES.md."""
+    """A source entry from SOURCES.md.
+
+    Immutable: list fields are stored as tuples. Tiers, types, sections,
+    URLs and pattern ids are interned, since they repeat across entries and
+    match the same strings in pattern records.
+    """
     id: str
     name: str
     url: Optional[str] = None
     tier: Optional[str] = None
     source_type: Optional[str] = None
     section: Optional[str] = None
-    key_insights: list[str] = field(default_factory=list)
-    pattern_refs: list[str] = field(default_factory=list)
+    key_insights: tuple[str, ...] = ()
+    pattern_refs: tuple[str, ...] = ()
+
+    def __post_init__(self):
+        set_field = object.__setattr__
+        for name in ("url", "tier", "source_type", "section"):
+            set_field(self, name, _intern(getattr(self, name)))
+        set_field(self, "key_insights", tuple(self.key_insights))
+        set_field(self, "pattern_refs", tuple(map(sys.intern, self.pattern_refs)))
 
     def to_dict(self) -> dict:
         return {
@@ -26,22 +47,26 @@ class SourceEntry:
             "tier": self.tier,
             "source_type": self.source_type,
             "section": self.section,
-            "key_insights": self.key_insights,
-            "pattern_refs": self.pattern_refs,
+            "key_insights": list(self.key_insights),
+            "pattern_refs": list(self.pattern_refs),
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "SourceEntry":
+        return cls(**data)
+
 
 class SourcesParser:
     """Parser for SOURCES.md file."""
 
     # Section headers: ## Primary Sources (Tier A)
-    SECTION_PATTERN = re.compile(r'^##\s+(.+?)(?:\s+\(Tier ([A-D])\))?$', re.MULTILINE)
+    SECTION_PATTERN = re.compile(r'##\s+(.+?)(?:\s+\(Tier ([A-D])\))?$')
 
     # Subsection: ### Title
-    SUBSECTION_PATTERN = re.compile(r'^###\s+(.+)$', re.MULTILINE)
+    SUBSECTION_PATTERN = re.compile(r'###\s+(.+)$')
 
     # Sub-subsection: #### Title
-    SUBSUBSECTION_PATTERN = re.compile(r'^####\s+(.+)$', re.MULTILINE)
+    SUBSUBSECTION_PATTERN = re.compile(r'####\s+(.+)$')
 
     # URL pattern
     URL_PATTERN = re.compile(r'\*\*(?:URL|Source)\*\*:\s*(https?://[^\s]+)')
@@ -63,87 +88,64 @@ class SourcesParser:
 
     def parse(self) -> list[SourceEntry]:
         """Parse the SOURCES.md file."""
+        return list(self.iter_entries())
+
+    def iter_entries(self) -> Iterator[SourceEntry]:
+        """Yield entries while reading SOURCES.md incrementally."""
         if not self.sources_file.exists():
-            return []
-
-        content = self.sources_file.read_text(encoding='utf-8')
-        entries = []
-
-        # Split by main sections
-        sections = self._split_by_sections(content)
-
-        for section_name, section_tier, section_content in sections:
-            # Parse each section
-            subsections = self._split_by_subsections(section_content)
-
-            for subsection_name, subsection_content in subsections:
-                # Check for sub-subsections (e.g., individual blog posts)
-                subsubsections = self._split_by_subsubsections(subsection_content)
-
-                if subsubsections:
-                    for subsubsection_name, subsubsection_content in subsubsections:
-                        entry = self._parse_entry(
-                            name=subsubsection_name,
-                            content=subsubsection_content,
-                            section=section_name,
-                            default_tier=section_tier
-                        )
-                        if entry:
-                            entries.append(entry)
-                else:
-                    entry = self._parse_entry(
-                        name=subsection_name,
-                        content=subsection_content,
-                        section=section_name,
-                        default_tier=section_tier
-                    )
-                    if entry:
-                        entries.append(entry)
-
-        return entries
-
-    def _split_by_sections(self, content: str) -> list[tuple[str, Optional[str], str]]:
-        """Split content by ## headers."""
-        sections = []
-        matches = list(self.SECTION_PATTERN.finditer(content))
-
-        for i, match in enumerate(matches):
-            section_name = match.group(1).strip()
-            section_tier = match.group(2)
-            start = match.end()
-            end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
-            section_content = content[start:end]
-            sections.append((section_name, section_tier, section_content))
-
-        return sections
-
-    def _split_by_subsections(self, content: str) -> list[tuple[str, str]]:
-        """Split content by ### headers."""
-        subsections = []
-        matches = list(self.SUBSECTION_PATTERN.finditer(content))
-
-        for i, match in enumerate(matches):
-            subsection_name = match.group(1).strip()
-            start = match.end()
-            end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
-            subsection_content = content[start:end]
-            subsections.append((subsection_name, subsection_content))
-
-        return subsections
-
-    def _split_by_subsubsections(self, content: str) -> list[tuple[str, str]]:
-        """Split content by #### headers."""
-        subsubsections = []
-        matches = list(self.SUBSUBSECTION_PATTERN.finditer(content))
-
-        for i, match in enumerate(matches):
-            subsubsection_name = match.group(1).strip()
-            start = match.end()
-            end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
-            subsubsection_content = content[start:end]
-            subsubsections.append((subsubsection_name, subsubsection_content))
-
-        return subsubsections
+            return
+        with self.sources_file.open(encoding='utf-8') as f:
+            yield from self.parse_lines(f)
+
+    def parse_lines(self, lines: Iterable[str]) -> Iterator[SourceEntry]:
+        """Yield entries from SOURCES.md lines.
+
+        An entry is a ### subsection, or each of its #### sub-subsections when
+        it has any. Only the lines of the entry being read are held in memory.
+        """
+        section: Optional[str] = None
+        section_tier: Optional[str] = None
+        in_subsection = False
+        # Heading, level and body lines of the entry being read
+        name: Optional[str] = None
+        level = 0
+        body: list[str] = []
+
+        for line in lines:
+            if line.startswith('##'):
+                heading = line.rstrip('\n')
+
+                match = self.SECTION_PATTERN.match(heading)
+                if match:
+                    if name is not None:
+                        yield self._parse_entry(name, ''.join(body), section, section_tier)
+                    section = match.group(1).strip()
+                    section_tier = match.group(2)
+                    in_subsection = False
+                    name = None
+                    continue
+
+                match = self.SUBSECTION_PATTERN.match(heading)
+                if match and section is not None:
+                    if name is not None:
+                        yield self._parse_entry(name, ''.join(body), section, section_tier)
+                    in_subsection = True
+                    name, level, body = match.group(1).strip(), 3, [line[len(heading):]]
+                    continue
+
+                match = self.SUBSUBSECTION_PATTERN.match(heading)
+                if match and in_subsection:
+                    # A subsection with sub-subsections is not an entry itself
+                    if name is not None and level == 4:
+                        yield self._parse_entry(name, ''.join(body), section, section_tier)
+                    name, level, body = match.group(1).strip(), 4, [line[len(heading):]]
+                    continue
+
+            if name is not None:
+                body.append(line)
+
+        if name is not None:
+            yield self._parse_entry(name, ''.join(body), section, section_tier)
 
     def _parse_entry(
         self,
@@ -183,8 +185,8 @@ class SourcesParser:
                 if line.startswith(('-', '*')):
                     key_insights.append(line.lstrip('-* ').strip())
 
-        # Extract pattern references
-        pattern_refs = list(set(self.PATTERN_REF.findall(content)))
+        # Extract pattern references, first mention first
+        pattern_refs = list(dict.fromkeys(self.PATTERN_REF.findall(content)))
 
         return SourceEntry(
             id=entry_id,
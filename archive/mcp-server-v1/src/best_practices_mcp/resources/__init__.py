@@ -1,6 +1,21 @@
 """MCP resources for pattern and source registries."""
 
-from .pattern_registry import PatternRegistry
+from .columnar import RegistryTable, read_table, write_table
+from .pattern_registry import PatternRegistry, RegistryDelta, RegistrySnapshot
+from .rendering import RenderedResource, ResourceRenderer
+from .search_index import SearchHit, SearchIndex
 from .source_registry import SourceRegistry
 
-__all__ = ["PatternRegistry", "SourceRegistry"]
+__all__ = [
+    "PatternRegistry",
+    "RegistryDelta",
+    "RegistrySnapshot",
+    "RegistryTable",
+    "RenderedResource",
+    "ResourceRenderer",
+    "SearchHit",
+    "SearchIndex",
+    "SourceRegistry",
+    "read_table",
+    "write_table",
+]
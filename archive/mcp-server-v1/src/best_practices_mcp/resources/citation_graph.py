@@ -0,0 +1,77 @@
+"""Pattern/source citation graph."""
+
+import sys
+from typing import Iterable, Optional
+
+from ..parsers.markdown_parser import PatternMetadata
+from .source_registry import normalize_url
+
+
+class CitationGraph:
+    """Bipartite graph of patterns and the source URLs they cite.
+
+    Keeps an inverted index from normalized URL to citing pattern ids so
+    patterns that share sources are found by walking only actual co-citations. Patterns are
+    added, replaced and removed individually, so the graph can follow a
+    registry's incremental refreshes.
+    """
+
+    def __init__(self):
+        self._urls: dict[str, frozenset[str]] = {}
+        self._citing: dict[str, set[str]] = {}
+        self._phase: dict[str, Optional[str]] = {}
+
+    @classmethod
+    def from_patterns(cls, patterns: Iterable[PatternMetadata]) -> "CitationGraph":
+        graph = cls()
+        for pattern in patterns:
+            graph.add(pattern)
+        return graph
+
+    def copy(self) -> "CitationGraph":
+        """Independent copy that can be updated without affecting this graph."""
+        graph = CitationGraph()
+        graph._urls = dict(self._urls)
+        graph._citing = {url: set(ids) for url, ids in self._citing.items()}
+        graph._phase = dict(self._phase)
+        return graph
+
+    def add(self, pattern: PatternMetadata) -> None:
+        """Add a pattern, replacing any previous version with the same id."""
+        self.remove(pattern.id)
+        # Interned: each URL is cited by many patterns
+        urls = frozenset(sys.intern(normalize_url(s.url)) for s in pattern.sources if s.url)
+        self._urls[pattern.id] = urls
+        self._phase[pattern.id] = pattern.sdd_phase
+        for url in urls:
+            self._citing.setdefault(url, set()).add(pattern.id)
+
+    def remove(self, pattern_id: str) -> None:
+        """Drop a pattern and its citations."""
+        for url in self._urls.pop(pattern_id, ()):
+            citing = self._citing[url]
+            citing.discard(pattern_id)
+            if not citing:
+                del self._citing[url]
+        self._phase.pop(pattern_id, None)
+
+    def citing(self, url: str) -> set[str]:
+        """Ids of patterns that cite a URL."""
+        return set(self._citing.get(normalize_url(url), ()))
+
+    def shared_sources(self, pattern_id: str, same_phase: bool = False) -> dict[str, int]:
+        """Count the sources a pattern shares with each other pattern.
+
+        Only patterns sharing at least one source appear in the result. With
+        same_phase, only patterns in the same SDD phase are counted.
+        """
+        phase = self._phase.get(pattern_id)
+        shared: dict[str, int] = {}
+        for url in self._urls.get(pattern_id, ()):
+            for other in self._citing[url]:
+                if other == pattern_id:
+                    continue
+                if same_phase and self._phase[other] != phase:
+                    continue
+                shared[other] = shared.get(other, 0) + 1
+        return shared
@@ -0,0 +1,212 @@
+"""Columnar export of the pattern registry for analytics."""
+
+import json
+import os
+from collections import Counter
+from dataclasses import dataclass
+from itertools import chain
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from ..parsers.markdown_parser import PatternMetadata, SourceRef
+from .source_registry import normalize_url
+
+# Bump when columns change so stale exports are rejected
+TABLE_VERSION = "1"
+
+PATTERN_COLUMNS = (
+    "id", "name", "file_path", "evidence_tier", "sdd_phase", "source_count",
+    "related_patterns", "sections", "internal_links", "external_links",
+)
+SOURCE_COLUMNS = ("pattern_id", "position", "title", "url", "normalized_url", "tier")
+
+FORMATS = ("json", "parquet")
+
+
+@dataclass(frozen=True)
+class RegistryTable:
+    """The registry as two column-oriented tables.
+
+    patterns holds one row per pattern and sources one row per citation
+    (pattern -> source edge), in the order each pattern cites them. Each
+    table maps a column name to a tuple of values, all of the same length,
+    so aggregates are single passes over one column.
+    """
+    patterns: dict[str, tuple]
+    sources: dict[str, tuple]
+
+    @classmethod
+    def from_patterns(cls, patterns: Iterable[PatternMetadata]) -> "RegistryTable":
+        rows: dict[str, list] = {name: [] for name in PATTERN_COLUMNS}
+        edges: dict[str, list] = {name: [] for name in SOURCE_COLUMNS}
+        # Sources are shared across patterns, so normalize each URL once
+        normalized: dict[str, str] = {}
+        for pattern in patterns:
+            rows["id"].append(pattern.id)
+            rows["name"].append(pattern.name)
+            rows["file_path"].append(pattern.file_path)
+            rows["evidence_tier"].append(pattern.evidence_tier)
+            rows["sdd_phase"].append(pattern.sdd_phase)
+            rows["source_count"].append(len(pattern.sources))
+            rows["related_patterns"].append(list(pattern.related_patterns))
+            rows["sections"].append(list(pattern.sections))
+            rows["internal_links"].append(list(pattern.internal_links))
+            rows["external_links"].append(list(pattern.external_links))
+            for position, source in enumerate(pattern.sources):
+                edges["pattern_id"].append(pattern.id)
+                edges["position"].append(position)
+                edges["title"].append(source.title)
+                edges["url"].append(source.url)
+                url = source.url
+                if url and url not in normalized:
+                    normalized[url] = normalize_url(url)
+                edges["normalized_url"].append(normalized[url] if url else None)
+                edges["tier"].append(source.tier)
+        return cls(_freeze(rows, PATTERN_COLUMNS), _freeze(edges, SOURCE_COLUMNS))
+
+    def __len__(self) -> int:
+        return len(self.patterns["id"])
+
+    def to_patterns(self) -> list[PatternMetadata]:
+        """Rebuild the pattern records, without reparsing any markdown."""
+        cited: dict[str, list[SourceRef]] = {}
+        # Patterns citing the same source share one SourceRef
+        refs: dict[tuple, SourceRef] = {}
+        edges = self.sources
+        for pattern_id, *source in zip(
+            edges["pattern_id"], edges["title"], edges["url"], edges["tier"]
+        ):
+            key = tuple(source)
+            ref = refs.get(key)
+            if ref is None:
+                ref = refs[key] = SourceRef(*key)
+            cited.setdefault(pattern_id, []).append(ref)
+        rows = self.patterns
+        return [
+            PatternMetadata(
+                id=pattern_id,
+                name=name,
+                file_path=file_path,
+                sources=cited.get(pattern_id, ()),
+                evidence_tier=tier,
+                sdd_phase=phase,
+                related_patterns=related,
+                sections=sections,
+                internal_links=internal_links,
+                external_links=external_links,
+            )
+            for pattern_id, name, file_path, tier, phase, related, sections, internal_links, external_links
+            in zip(
+                rows["id"], rows["name"], rows["file_path"], rows["evidence_tier"], rows["sdd_phase"],
+                rows["related_patterns"], rows["sections"], rows["internal_links"], rows["external_links"],
+            )
+        ]
+
+    def value_counts(self, column: str) -> Counter:
+        """Count the patterns having each value of a pattern column."""
+        if column not in self.patterns:
+            raise ValueError(f"Unknown column: {column} (available: {', '.join(PATTERN_COLUMNS)})")
+        return Counter(self.patterns[column])
+
+    def citation_counts(self) -> Counter:
+        """Count the patterns citing each normalized source URL."""
+        edges = self.sources
+        return Counter(url for _, url in dict.fromkeys(
+            zip(edges["pattern_id"], edges["normalized_url"])
+        ) if url)
+
+    def orphans(self) -> list[str]:
+        """Ids of patterns that no other pattern lists as related."""
+        ids, related = self.patterns["id"], self.patterns["related_patterns"]
+        referenced = set(chain.from_iterable(related))
+        listing_self = {pattern_id for pattern_id, targets in zip(ids, related) if pattern_id in targets}
+        if listing_self:
+            # A pattern listing itself only counts when another one lists it too
+            referenced -= listing_self
+            referenced.update(
+                target
+                for pattern_id, targets in zip(ids, related)
+                for target in targets
+                if target in listing_self and target != pattern_id
+            )
+        return [pattern_id for pattern_id in ids if pattern_id not in referenced]
+
+
+def write_table(table: RegistryTable, directory: Path, format: str = "json") -> list[Path]:
+    """Write the patterns and sources tables into a directory.
+
+    "json" writes patterns.json and sources.json with one array per column
+    and needs nothing beyond the standard library. "parquet" writes
+    patterns.parquet and sources.parquet and requires pyarrow.
+
+    Raises:
+        ValueError: For an unknown format, or parquet without pyarrow
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown format: {format} (available: {', '.join(FORMATS)})")
+    directory.mkdir(parents=True, exist_ok=True)
+    written = []
+    for name, columns in (("patterns", table.patterns), ("sources", table.sources)):
+        path = directory / f"{name}.{format}"
+        temp = path.with_name(path.name + ".tmp")
+        if format == "parquet":
+            pa, pq = _pyarrow()
+            pq.write_table(
+                pa.table(dict(columns)).replace_schema_metadata({"version": TABLE_VERSION}),
+                str(temp),
+            )
+        else:
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump({"version": TABLE_VERSION, "columns": columns}, f, separators=(',', ':'))
+        os.replace(temp, path)
+        written.append(path)
+    return written
+
+
+def read_table(directory: Path) -> RegistryTable:
+    """Load a table written by write_table, preferring parquet when present.
+
+    Raises:
+        ValueError: If no export is found or it was written by another version
+    """
+    if (directory / "patterns.parquet").exists():
+        _, pq = _pyarrow()
+        tables = {}
+        for name in ("patterns", "sources"):
+            data = pq.read_table(str(directory / f"{name}.parquet"))
+            metadata = data.schema.metadata or {}
+            _check_version(metadata.get(b"version", b"").decode('utf-8'), directory)
+            tables[name] = data.to_pydict()
+    elif (directory / "patterns.json").exists():
+        tables = {}
+        for name in ("patterns", "sources"):
+            with open(directory / f"{name}.json", encoding='utf-8') as f:
+                data = json.load(f)
+            _check_version(data.get("version"), directory)
+            tables[name] = data["columns"]
+    else:
+        raise ValueError(f"No registry export in {directory}")
+    return RegistryTable(
+        _freeze(tables["patterns"], PATTERN_COLUMNS), _freeze(tables["sources"], SOURCE_COLUMNS)
+    )
+
+
+def _freeze(columns: dict[str, Any], names: tuple[str, ...]) -> dict[str, tuple]:
+    return {name: tuple(columns[name]) for name in names}
+
+
+def _check_version(version: Optional[str], directory: Path) -> None:
+    if version != TABLE_VERSION:
+        raise ValueError(
+            f"Registry export in {directory} has version {version!r}, expected {TABLE_VERSION!r}"
+        )
+
+
+def _pyarrow():
+    """Import pyarrow on demand; it is optional and slow to import."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ValueError("Format 'parquet' requires the pyarrow package")
+    return pyarrow, pyarrow.parquet
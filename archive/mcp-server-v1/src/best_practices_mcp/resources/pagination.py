@@ -0,0 +1,78 @@
+"""Paged, filtered views of registry resources."""
+
+import base64
+import binascii
+import json
+from typing import Optional, Sequence
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(offset: int, etag: str) -> str:
+    """Encode the position of the next page.
+
+    The registry etag is included so a cursor cannot silently skip or repeat
+    entries after the registry changed.
+    """
+    return base64.urlsafe_b64encode(f"{offset}:{etag}".encode('ascii')).decode('ascii')
+
+
+def decode_cursor(cursor: str, etag: str) -> int:
+    """Return the offset stored in a cursor issued for the same registry content."""
+    try:
+        offset_text, cursor_etag = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('ascii').split(':', 1)
+        offset = int(offset_text)
+    except (ValueError, UnicodeError, binascii.Error):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    if cursor_etag != etag:
+        raise ValueError("Registry changed since the cursor was issued; start again without a cursor")
+    return offset
+
+
+def parse_fields(fields: Optional[str], allowed: Sequence[str]) -> Optional[list[str]]:
+    """Split a comma-separated field list, rejecting unknown names."""
+    if not fields:
+        return None
+    names = [name.strip() for name in fields.split(',') if name.strip()]
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)} (available: {', '.join(allowed)})")
+    return names
+
+
+def render_page(
+    items: Sequence,
+    etag: str,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    fields: Optional[list[str]] = None,
+    compact: bool = False,
+) -> str:
+    """Serialize one page of items, which must provide to_dict().
+
+    Only the items on the page are converted, so the cost scales with the
+    page size rather than the registry size.
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    limit = min(limit, MAX_PAGE_SIZE)
+    offset = decode_cursor(cursor, etag) if cursor else 0
+
+    page = []
+    for item in items[offset:offset + limit]:
+        data = item.to_dict()
+        if fields is not None:
+            data = {name: data[name] for name in fields}
+        page.append(data)
+
+    end = offset + len(page)
+    payload = {
+        "etag": etag,
+        "total": len(items),
+        "items": page,
+        "next_cursor": encode_cursor(end, etag) if end < len(items) else None,
+    }
+    if compact:
+        return json.dumps(payload, separators=(',', ':'))
+    return json.dumps(payload, indent=2)
@@ -1,59 +1,389 @@
 """Pattern registry resource."""
 
+import hashlib
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
-from ..parsers.markdown_parser import MarkdownParser, PatternMetadata
+from ..executor import run_blocking
+from ..parsers.markdown_parser import PARSER_VERSION, MarkdownParser, PatternMetadata
+from ..parsers.parse_cache import ParseCache
+from .citation_graph import CitationGraph
+from .columnar import RegistryTable
+from .search_index import SearchHit, SearchIndex
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class FileState:
+    """On-disk state of a pattern file at the time it was parsed."""
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+@dataclass
+class RegistryDelta:
+    """Patterns added, changed or removed by a refresh."""
+    added: list[PatternMetadata] = field(default_factory=list)
+    changed: list[PatternMetadata] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+    def to_dict(self) -> dict:
+        return {
+            "added": [p.id for p in self.added],
+            "changed": [p.id for p in self.changed],
+            "removed": self.removed,
+        }
+
+
+@dataclass(frozen=True)
+class RegistrySnapshot:
+    """A consistent view of the registry's patterns and indexes.
+
+    Snapshots are built by a refresh and never modified once published, so
+    readers can use one without locking.
+    """
+    generation: int
+    patterns: list[PatternMetadata]
+    by_id: dict[str, PatternMetadata]
+    by_tier: dict[str, list[PatternMetadata]]
+    by_phase: dict[str, list[PatternMetadata]]
+    referrers: dict[str, list[PatternMetadata]]
+    graph: CitationGraph
 
 
 class PatternRegistry:
-    """Registry of all documented patterns."""
+    """Registry of all documented patterns.
+
+    Refreshes build a new RegistrySnapshot and publish it by swapping a
+    single reference, so readers always see either the old or the new
+    registry, never a mix. Refresh requests that arrive while another is
+    waiting are answered by one scan.
+    """
 
-    def __init__(self, patterns_dir: Path):
+    def __init__(
+        self,
+        patterns_dir: Path,
+        cache: Optional[ParseCache] = None,
+        parse_workers: int = 1,
+    ):
         self.patterns_dir = patterns_dir
-        self.parser = MarkdownParser(patterns_dir)
-        self._patterns: list[PatternMetadata] = []
-        self._loaded = False
+        self.parser = MarkdownParser(patterns_dir, workers=parse_workers)
+        self.cache = cache
+        self._snapshot: Optional[RegistrySnapshot] = None
+        # Only touched by the refresh holding _lock
+        self._files: dict[Path, FileState] = {}
+        self._by_path: dict[Path, PatternMetadata] = {}
+        self._lock = threading.Lock()
+        # Refresh requests issued, and the newest one a finished scan covered
+        self._requests_lock = threading.Lock()
+        self._requested = 0
+        self._covered = 0
+        self._last_delta = RegistryDelta()
+        # Columnar view of the snapshot with this generation
+        self._table: Optional[tuple[int, RegistryTable]] = None
+        # Built by the first search, then kept current by refreshes
+        self._search: Optional[SearchIndex] = None
+        # Held while a refresh publishes a snapshot and updates the search
+        # index to match, and while a search reads both
+        self._search_lock = threading.Lock()
+
+    async def refresh(self) -> RegistryDelta:
+        """Reload patterns that changed on disk since the last load.
+
+        The scan and parse run on the shared executor, off the event loop.
+        """
+        return await run_blocking(self._sync)
+
+    def _sync(self) -> RegistryDelta:
+        """Reparse added or modified files and drop deleted ones.
+
+        Refreshes are serialized. A request that waited while a later scan
+        ran is answered by that scan's delta instead of scanning again.
+        """
+        with self._requests_lock:
+            self._requested += 1
+            ticket = self._requested
+        with self._lock:
+            if self._covered >= ticket:
+                return self._last_delta
+            with self._requests_lock:
+                covers = self._requested
+            delta = self._sync_locked()
+            self._last_delta = delta
+            self._covered = covers
+            return delta
+
+    def _sync_locked(self) -> RegistryDelta:
+        delta = RegistryDelta()
+        seen: set[Path] = set()
+        pending: list[tuple[Path, str, FileState]] = []
+        existing: set[Path] = set()
+        # Search index changes, applied once the new snapshot is published
+        unindexed: list[str] = []
+        indexed: list[tuple[PatternMetadata, str]] = []
+
+        for file_path in sorted(self.patterns_dir.glob('*.md')):
+            seen.add(file_path)
+            try:
+                stat = file_path.stat()
+            except FileNotFoundError:
+                # Deleted between glob and stat
+                seen.discard(file_path)
+                continue
+
+            previous = self._files.get(file_path)
+            if (previous is not None
+                    and previous.mtime_ns == stat.st_mtime_ns
+                    and previous.size == stat.st_size):
+                continue
+
+            data = file_path.read_bytes()
+            state = FileState(stat.st_mtime_ns, stat.st_size, hashlib.sha256(data).hexdigest())
+            if previous is not None and previous.digest == state.digest:
+                # Touched but not modified
+                self._files[file_path] = state
+                continue
 
-    async def refresh(self) -> None:
-        """Reload patterns from disk."""
-        self._patterns = self.parser.parse_all()
-        self._loaded = True
+            try:
+                text = data.decode('utf-8')
+            except UnicodeDecodeError as e:
+                # Not recorded, so the next refresh tries again
+                logger.warning("Skipping pattern file %s: %s", file_path, e)
+                continue
+            pending.append((file_path, text, state))
+            if previous is not None:
+                existing.add(file_path)
+
+        # File states are only recorded once their files parsed, so a failed
+        # parse is retried by the next refresh
+        for (file_path, text, state), pattern in zip(pending, self._parse(pending)):
+            self._files[file_path] = state
+            replaced = self._by_path.get(file_path)
+            self._by_path[file_path] = pattern
+            if self._search is not None:
+                if replaced is not None and replaced.id != pattern.id:
+                    unindexed.append(replaced.id)
+                indexed.append((pattern, text))
+            if file_path in existing:
+                delta.changed.append(pattern)
+            else:
+                delta.added.append(pattern)
+
+        for file_path in list(self._files):
+            if file_path not in seen:
+                del self._files[file_path]
+                removed = self._by_path.pop(file_path, None)
+                if removed is not None:
+                    delta.removed.append(removed.id)
+                    if self._search is not None:
+                        unindexed.append(removed.id)
+                if self.cache:
+                    self.cache.delete("pattern", str(file_path))
+
+        if self.cache and not delta.is_empty:
+            self.cache.commit()
+
+        if not delta.is_empty or self._snapshot is None:
+            with self._search_lock:
+                self._publish(delta)
+                if self._search is not None:
+                    for pattern_id in unindexed:
+                        self._search.remove(pattern_id)
+                    for pattern, text in indexed:
+                        self._search.add(pattern.id, pattern.name, pattern.sections, text)
+        return delta
+
+    def _publish(self, delta: RegistryDelta) -> None:
+        """Build a snapshot of the current patterns and make it visible to readers."""
+        previous = self._snapshot
+        patterns = [self._by_path[p] for p in sorted(self._by_path)]
+        if previous is None:
+            graph = CitationGraph.from_patterns(patterns)
+        else:
+            graph = previous.graph.copy()
+            for pattern_id in delta.removed:
+                graph.remove(pattern_id)
+            for pattern in delta.added + delta.changed:
+                graph.add(pattern)
+        self._snapshot = RegistrySnapshot(
+            generation=previous.generation + 1 if previous else 1,
+            patterns=patterns,
+            graph=graph,
+            **self._build_indexes(patterns),
+        )
+
+    def _parse(self, files: list[tuple[Path, str, FileState]]) -> list[PatternMetadata]:
+        """Parse (path, text, state) entries, reusing the persistent cache where possible.
+
+        Cache misses are parsed as one batch so the parser can spread large
+        batches across worker processes.
+        """
+        patterns: list[Optional[PatternMetadata]] = [None] * len(files)
+        misses: list[int] = []
+        for i, (file_path, _, state) in enumerate(files):
+            cached = None
+            if self.cache:
+                cached = self.cache.get("pattern", str(file_path), state.digest, PARSER_VERSION)
+            if cached is not None:
+                patterns[i] = PatternMetadata.from_dict(cached)
+            else:
+                misses.append(i)
+
+        parsed = self.parser.parse_texts([(files[i][0], files[i][1]) for i in misses])
+        for i, pattern in zip(misses, parsed):
+            patterns[i] = pattern
+            if self.cache:
+                file_path, _, state = files[i]
+                self.cache.put("pattern", str(file_path), state.digest, PARSER_VERSION, pattern.to_dict())
+        return patterns
+
+    def _build_indexes(self, patterns: list[PatternMetadata]) -> dict[str, dict]:
+        """Index patterns by id, tier, phase and the patterns they link to."""
+        by_id: dict[str, PatternMetadata] = {}
+        by_tier: dict[str, list[PatternMetadata]] = {}
+        by_phase: dict[str, list[PatternMetadata]] = {}
+        referrers: dict[str, list[PatternMetadata]] = {}
+        for pattern in patterns:
+            # First occurrence wins, matching the previous linear scan
+            by_id.setdefault(pattern.id, pattern)
+            if pattern.evidence_tier:
+                by_tier.setdefault(pattern.evidence_tier, []).append(pattern)
+            if pattern.sdd_phase:
+                by_phase.setdefault(pattern.sdd_phase, []).append(pattern)
+            for target in self._link_targets(pattern):
+                referrers.setdefault(target, []).append(pattern)
+        return {"by_id": by_id, "by_tier": by_tier, "by_phase": by_phase, "referrers": referrers}
+
+    def _link_targets(self, pattern: PatternMetadata) -> list[str]:
+        """Ids of the patterns a pattern links to or lists as related."""
+        targets = dict.fromkeys(pattern.related_patterns)
+        patterns_dir = os.path.normpath(self.patterns_dir)
+        for link in pattern.internal_links:
+            target = os.path.normpath(os.path.join(patterns_dir, link.split('#')[0]))
+            if os.path.dirname(target) == patterns_dir and target.endswith('.md'):
+                targets[os.path.basename(target)[:-3]] = None
+        targets.pop(pattern.id, None)
+        return list(targets)
+
+    @property
+    def snapshot(self) -> RegistrySnapshot:
+        """The current snapshot, loading the registry on first use.
+
+        Use one snapshot for reads that must agree with each other.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            self._sync()
+            snapshot = self._snapshot
+        return snapshot
+
+    @property
+    def citation_graph(self) -> CitationGraph:
+        """Graph of the source URLs cited by each pattern."""
+        return self.snapshot.graph
+
+    @property
+    def generation(self) -> int:
+        """Counter that changes whenever the registry's contents change."""
+        return self.snapshot.generation
 
     def get_all(self) -> list[PatternMetadata]:
         """Get all patterns."""
-        if not self._loaded:
-            self._patterns = self.parser.parse_all()
-            self._loaded = True
-        return self._patterns
+        return self.snapshot.patterns
 
     def get_by_id(self, pattern_id: str) -> Optional[PatternMetadata]:
         """Get pattern by ID."""
-        patterns = self.get_all()
-        for pattern in patterns:
-            if pattern.id == pattern_id:
-                return pattern
-        return None
+        return self.snapshot.by_id.get(pattern_id)
 
     def get_by_tier(self, tier: str) -> list[PatternMetadata]:
         """Get patterns by evidence tier."""
-        return [p for p in self.get_all() if p.evidence_tier == tier.upper()]
+        return list(self.snapshot.by_tier.get(tier.upper(), []))
 
     def get_by_phase(self, phase: str) -> list[PatternMetadata]:
         """Get patterns by SDD phase."""
-        return [p for p in self.get_all() if p.sdd_phase == phase.lower()]
+        return list(self.snapshot.by_phase.get(phase.lower(), []))
+
+    def query(self, tier: Optional[str] = None, phase: Optional[str] = None) -> list[PatternMetadata]:
+        """Get patterns matching every given filter, in registry order."""
+        snapshot = self.snapshot
+        if tier:
+            patterns = snapshot.by_tier.get(tier.upper(), [])
+            if phase:
+                return [p for p in patterns if p.sdd_phase == phase.lower()]
+            return list(patterns)
+        if phase:
+            return list(snapshot.by_phase.get(phase.lower(), []))
+        return list(snapshot.patterns)
+
+    def get_referrers(self, pattern_id: str) -> list[PatternMetadata]:
+        """Get patterns that link to a pattern id, whether or not it exists."""
+        return list(self.snapshot.referrers.get(pattern_id, []))
+
+    def search(self, query: str, top_k: int = 10) -> list[tuple[PatternMetadata, SearchHit]]:
+        """Rank patterns against a free-text query with BM25, best first.
+
+        Titles, section headings and the full text are indexed. The index
+        is built from the pattern files on the first search and then updated
+        by each refresh from the files it reparses, so searching costs
+        nothing until it is used.
+        """
+        index = self._search
+        if index is None:
+            index = self._build_search_index()
+        # A refresh swaps the snapshot and updates the index under this lock,
+        # so every hit has metadata from the same version as its text
+        with self._search_lock:
+            snapshot = self._snapshot
+            hits = index.search(query, top_k)
+        return [(snapshot.by_id[hit.doc_id], hit) for hit in hits]
+
+    def _build_search_index(self) -> SearchIndex:
+        if self._snapshot is None:
+            self._sync()
+        with self._lock:
+            if self._search is None:
+                index = SearchIndex()
+                for file_path, pattern in self._by_path.items():
+                    try:
+                        text = file_path.read_text(encoding='utf-8')
+                    except FileNotFoundError:
+                        # Deleted since the last refresh, which will drop it
+                        continue
+                    index.add(pattern.id, pattern.name, pattern.sections, text)
+                self._search = index
+            return self._search
+
+    def to_table(self) -> RegistryTable:
+        """Columnar view of the current snapshot, built once per generation."""
+        snapshot = self.snapshot
+        cached = self._table
+        if cached is None or cached[0] != snapshot.generation:
+            cached = (snapshot.generation, RegistryTable.from_patterns(snapshot.patterns))
+            self._table = cached
+        return cached[1]
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
+        snapshot = self.snapshot
         return {
-            "total_patterns": len(self.get_all()),
-            "patterns": [p.to_dict() for p in self.get_all()],
+            "total_patterns": len(snapshot.patterns),
+            "patterns": [p.to_dict() for p in snapshot.patterns],
             "by_tier": {
-                tier: len(self.get_by_tier(tier))
+                tier: len(snapshot.by_tier.get(tier, []))
                 for tier in ["A", "B", "C", "D"]
             },
             "by_phase": {
-                phase: len(self.get_by_phase(phase))
+                phase: len(snapshot.by_phase.get(phase, []))
                 for phase in ["foundational", "specify", "plan", "tasks", "implement", "cross-phase"]
             }
         }
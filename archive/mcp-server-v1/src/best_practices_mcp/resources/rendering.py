@@ -0,0 +1,76 @@
+"""Cached JSON rendering of registry resources."""
+
+import json
+import secrets
+import threading
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from .pattern_registry import PatternRegistry
+from .source_registry import SourceRegistry
+
+
+@dataclass(frozen=True)
+class RenderedResource:
+    """Serialized registry payload and the etag of its content."""
+    text: str
+    etag: str
+
+
+class ResourceRenderer:
+    """Serialize a registry once per generation.
+
+    The registry's generation counter changes whenever its contents do, so
+    reads of an unchanged registry return the cached text. The etag is the
+    generation plus a token picked when the renderer is created: checking
+    an etag or binding a page cursor to it never needs a render, and etags
+    issued before a restart never match. It is the same for compact and
+    indented output, so a client can send it back and skip downloading an
+    unchanged registry.
+
+    render() may be called from executor threads; concurrent calls share
+    one serialization.
+    """
+
+    def __init__(self, registry: Union[PatternRegistry, SourceRegistry]):
+        self.registry = registry
+        self._token = secrets.token_hex(4)
+        self._generation: Optional[int] = None
+        self._data: Optional[dict] = None
+        self._rendered: dict[bool, RenderedResource] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def etag(self) -> str:
+        """Etag of the registry's current content."""
+        return self._etag(self.registry.generation)
+
+    def render(self, compact: bool = False) -> RenderedResource:
+        """Return the registry as JSON, indented unless compact is set."""
+        with self._lock:
+            self._update()
+            rendered = self._rendered.get(compact)
+            if rendered is None:
+                etag = self._etag(self._generation)
+                payload = {"etag": etag, **self._data}
+                if compact:
+                    text = json.dumps(payload, separators=(',', ':'))
+                else:
+                    text = json.dumps(payload, indent=2)
+                rendered = RenderedResource(text, etag)
+                self._rendered[compact] = rendered
+            return rendered
+
+    def _etag(self, generation: int) -> str:
+        return f"{self._token}-{generation}"
+
+    def _update(self) -> None:
+        """Drop cached output if the registry changed since it was rendered."""
+        # Read the generation before the data: if a refresh lands in between,
+        # the output is newer than its etag and the next read renders again
+        generation = self.registry.generation
+        if generation == self._generation:
+            return
+        self._data = self.registry.to_dict()
+        self._rendered = {}
+        self._generation = generation
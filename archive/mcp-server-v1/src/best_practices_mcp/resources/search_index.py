@@ -0,0 +1,267 @@
+"""BM25 full-text index over pattern documents."""
+
+import heapq
+import math
+import re
+import sys
+import threading
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from how in is it of on or that the this to what when with".split()
+)
+
+# Standard BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Term frequency multipliers for matches in the title and section headings,
+# on top of their occurrence in the body
+TITLE_WEIGHT = 3
+SECTION_WEIGHT = 2
+
+# Ranked postings entries kept between queries, across all terms (about 16
+# bytes each)
+MAX_CACHED_POSTINGS = 2_000_000
+
+SNIPPET_CHARS = 160
+MARKUP_PATTERN = re.compile(r"[#*`>|]+")
+TERM_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric terms of a text, without stopwords."""
+    return [term for term in TOKEN_PATTERN.findall(text.lower()) if term not in STOPWORDS]
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """A document matching a query."""
+    doc_id: str
+    score: float
+    snippet: str
+
+
+@dataclass(frozen=True, slots=True)
+class _Document:
+    title: str
+    sections: tuple[str, ...]
+    body: str
+
+
+class SearchIndex:
+    """In-memory inverted index ranking documents with BM25.
+
+    Documents are added, replaced and removed individually, so the index can
+    follow a registry's incremental refreshes. The first query using a term
+    ranks its postings by score contribution; the ranking is reused until
+    the index changes. Queries walk the ranked postings of their terms in
+    step and stop once no unseen document can reach the top k (Fagin's
+    threshold algorithm), so they rarely touch more than a small prefix of
+    the postings of common terms. Safe to query from one thread while
+    another updates it.
+    """
+
+    def __init__(self, k1: float = K1, b: float = B):
+        self.k1 = k1
+        self.b = b
+        self._documents: dict[str, _Document] = {}
+        self._lengths: dict[str, int] = {}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._total_length = 0
+        # Derived from the above on demand, dropped whenever they change
+        self._norms: Optional[dict[str, float]] = None
+        self._ranked: dict[str, tuple[array, list[str]]] = {}
+        self._ranked_entries = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._documents
+
+    def add(self, doc_id: str, title: str, sections: Iterable[str], body: str) -> None:
+        """Index a document, replacing any previous version with the same id."""
+        document = _Document(title, tuple(sections), body)
+        frequencies = self._frequencies(document)
+        with self._lock:
+            self._remove_locked(doc_id)
+            self._documents[doc_id] = document
+            length = sum(frequencies.values())
+            self._lengths[doc_id] = length
+            self._total_length += length
+            for term, count in frequencies.items():
+                self._postings.setdefault(sys.intern(term), {})[doc_id] = count
+            self._invalidate()
+
+    def remove(self, doc_id: str) -> None:
+        """Drop a document from the index."""
+        with self._lock:
+            if self._remove_locked(doc_id):
+                self._invalidate()
+
+    def search(self, query: str, top_k: int = 10) -> list[SearchHit]:
+        """Return the top_k documents for a free-text query, best first.
+
+        Documents score by BM25 summed over the distinct query terms they
+        contain; documents with none of the terms are not returned.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or top_k < 1:
+            return []
+        with self._lock:
+            top = self._top([term for term in terms if term in self._postings], top_k)
+            documents = [self._documents[doc_id] for _, doc_id in top]
+        return [
+            SearchHit(doc_id, round(score, 4), _snippet(document.body, terms))
+            for (score, doc_id), document in zip(top, documents)
+        ]
+
+    def _top(self, terms: list[str], top_k: int) -> list[tuple[float, str]]:
+        if not terms:
+            return []
+        ranked = [self._ranked_postings(term) for term in terms]
+        if len(ranked) == 1:
+            impacts, doc_ids = ranked[0]
+            return list(zip(impacts[:top_k], doc_ids[:top_k]))
+
+        # Random access: the score a document gets from each term
+        scorers = [self._scorer(term) for term in terms]
+        heap: list[tuple[float, str]] = []
+        seen: set[str] = set()
+        for depth in range(max(len(doc_ids) for _, doc_ids in ranked)):
+            threshold = 0.0
+            for impacts, doc_ids in ranked:
+                if depth >= len(doc_ids):
+                    continue
+                threshold += impacts[depth]
+                doc_id = doc_ids[depth]
+                if doc_id in seen:
+                    continue
+                seen.add(doc_id)
+                total = 0.0
+                for score in scorers:
+                    total += score(doc_id)
+                entry = (total, doc_id)
+                if len(heap) < top_k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+            # A document not seen yet scores at most the threshold
+            if len(heap) == top_k and heap[0][0] >= threshold:
+                break
+        return sorted(heap, key=lambda entry: (-entry[0], entry[1]))
+
+    def _ranked_postings(self, term: str) -> tuple[array, list[str]]:
+        """A term's score contributions and doc ids, best first."""
+        ranked = self._ranked.get(term)
+        if ranked is None:
+            postings = self._postings[term]
+            numerator = self._idf(term) * (self.k1 + 1)
+            norms = self._length_norms()
+            entries = sorted(
+                (-numerator * frequency / (frequency + norms[doc_id]), doc_id)
+                for doc_id, frequency in postings.items()
+            )
+            ranked = (array('d', [-impact for impact, _ in entries]), [doc_id for _, doc_id in entries])
+            if self._ranked_entries + len(entries) > MAX_CACHED_POSTINGS:
+                self._ranked.clear()
+                self._ranked_entries = 0
+            self._ranked[term] = ranked
+            self._ranked_entries += len(entries)
+        return ranked
+
+    def _idf(self, term: str) -> float:
+        count = len(self._documents)
+        frequency = len(self._postings[term])
+        return math.log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+
+    def _scorer(self, term: str):
+        """Function giving a term's BM25 contribution to a document's score."""
+        postings = self._postings[term]
+        numerator = self._idf(term) * (self.k1 + 1)
+        norms = self._length_norms()
+        get = postings.get
+
+        def score(doc_id: str) -> float:
+            frequency = get(doc_id)
+            if frequency is None:
+                return 0.0
+            return numerator * frequency / (frequency + norms[doc_id])
+        return score
+
+    def _length_norms(self) -> dict[str, float]:
+        """k1 * (1 - b + b * length / average_length) for each document."""
+        norms = self._norms
+        if norms is None:
+            base = self.k1 * (1 - self.b)
+            scale = self.k1 * self.b * len(self._lengths) / self._total_length if self._total_length else 0.0
+            norms = self._norms = {
+                doc_id: base + scale * length for doc_id, length in self._lengths.items()
+            }
+        return norms
+
+    def _invalidate(self) -> None:
+        self._norms = None
+        self._ranked.clear()
+        self._ranked_entries = 0
+
+    def _remove_locked(self, doc_id: str) -> bool:
+        document = self._documents.pop(doc_id, None)
+        if document is None:
+            return False
+        self._total_length -= self._lengths.pop(doc_id)
+        for term in self._frequencies(document):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+        return True
+
+    def _frequencies(self, document: _Document) -> Counter:
+        frequencies = Counter(tokenize(document.body))
+        for term in tokenize(document.title):
+            frequencies[term] += TITLE_WEIGHT
+        for section in document.sections:
+            for term in tokenize(section):
+                frequencies[term] += SECTION_WEIGHT
+        return frequencies
+
+
+def _snippet(body: str, terms: list[str]) -> str:
+    """A window of the body around the first query term after the title line."""
+    title_end = body.find('\n') + 1
+    start = title_end
+    position = _first_match(body.lower(), terms, title_end)
+    if position is not None and position - SNIPPET_CHARS // 3 > title_end:
+        start = position - SNIPPET_CHARS // 3
+        # Begin at a word boundary
+        space = body.find(' ', start, position)
+        start = space + 1 if space != -1 else start
+    end = start + SNIPPET_CHARS
+    text = " ".join(MARKUP_PATTERN.sub(" ", body[start:end]).split())
+    if start > title_end:
+        text = "…" + text
+    if end < len(body):
+        text += "…"
+    return text
+
+
+def _first_match(text: str, terms: list[str], start: int) -> Optional[int]:
+    """Position of the earliest whole-term occurrence of any term in lowercased text."""
+    first = None
+    for term in terms:
+        position = text.find(term, start, first)
+        while position != -1:
+            end = position + len(term)
+            if ((position == 0 or text[position - 1] not in TERM_CHARS)
+                    and (end == len(text) or text[end] not in TERM_CHARS)):
+                first = position
+                break
+            position = text.find(term, position + 1, first)
+    return first
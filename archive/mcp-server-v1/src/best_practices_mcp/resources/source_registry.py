@@ -1,54 +1,160 @@
 """Source registry resource."""
 
+import hashlib
+import threading
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urlsplit, urlunsplit
 
-from ..parsers.sources_parser import SourcesParser, SourceEntry
+from ..executor import run_blocking
+from ..parsers.parse_cache import ParseCache
+from ..parsers.sources_parser import PARSER_VERSION, SourcesParser, SourceEntry
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL for lookups.
+
+    Lowercases the scheme and host, drops the fragment and strips a trailing
+    slash from the path so trivially different spellings of a URL match.
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    path = parts.path.rstrip('/')
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ''))
 
 
 class SourceRegistry:
     """Registry of all sources from SOURCES.md."""
 
-    def __init__(self, sources_file: Path):
+    def __init__(self, sources_file: Path, cache: Optional[ParseCache] = None):
         self.sources_file = sources_file
         self.parser = SourcesParser(sources_file)
+        self.cache = cache
         self._sources: list[SourceEntry] = []
+        self._by_id: dict[str, SourceEntry] = {}
+        self._by_tier: dict[str, list[SourceEntry]] = {}
+        self._by_url: dict[str, SourceEntry] = {}
+        self._by_pattern: dict[str, list[SourceEntry]] = {}
+        self._file_state: Optional[tuple[int, int]] = None
+        self._generation = 0
         self._loaded = False
+        self._lock = threading.Lock()
 
     async def refresh(self) -> None:
-        """Reload sources from disk."""
-        self._sources = self.parser.parse()
-        self._loaded = True
+        """Reload sources from disk if SOURCES.md changed.
+
+        The parse runs on the shared executor, off the event loop.
+        """
+        if self._loaded and self._stat() == self._file_state:
+            return
+        await run_blocking(self._load)
+
+    def _stat(self) -> Optional[tuple[int, int]]:
+        """Return (mtime_ns, size) of SOURCES.md, or None if it is missing."""
+        try:
+            stat = self.sources_file.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load(self) -> None:
+        """Parse SOURCES.md and rebuild the lookup indexes."""
+        with self._lock:
+            self._file_state = self._stat()
+            self._sources = self._parse()
+            self._build_indexes()
+            self._generation += 1
+            self._loaded = True
+
+    def _parse(self) -> list[SourceEntry]:
+        """Parse SOURCES.md, reusing the persistent cache when it is unchanged."""
+        if not self.cache or not self.sources_file.exists():
+            return self.parser.parse()
+
+        key = str(self.sources_file)
+        digest = self._digest()
+        cached = self.cache.get("sources", key, digest, PARSER_VERSION)
+        if cached is not None:
+            return [SourceEntry.from_dict(entry) for entry in cached]
+
+        sources = self.parser.parse()
+        self.cache.put("sources", key, digest, PARSER_VERSION, [s.to_dict() for s in sources])
+        self.cache.commit()
+        return sources
+
+    def _digest(self) -> str:
+        """Hash SOURCES.md in fixed-size chunks rather than reading it whole."""
+        sha = hashlib.sha256()
+        with self.sources_file.open('rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha.update(chunk)
+        return sha.hexdigest()
+
+    def _build_indexes(self) -> None:
+        """Index sources by id, tier, normalized URL and referenced pattern."""
+        by_id: dict[str, SourceEntry] = {}
+        by_tier: dict[str, list[SourceEntry]] = {}
+        by_url: dict[str, SourceEntry] = {}
+        by_pattern: dict[str, list[SourceEntry]] = {}
+        for source in self._sources:
+            # First occurrence wins, matching the previous linear scans
+            by_id.setdefault(source.id, source)
+            if source.tier:
+                by_tier.setdefault(source.tier, []).append(source)
+            if source.url:
+                by_url.setdefault(normalize_url(source.url), source)
+            for pattern_id in source.pattern_refs:
+                by_pattern.setdefault(pattern_id, []).append(source)
+        self._by_id = by_id
+        self._by_tier = by_tier
+        self._by_url = by_url
+        self._by_pattern = by_pattern
+
+    @property
+    def generation(self) -> int:
+        """Counter that changes whenever the registry is reloaded."""
+        self.get_all()
+        return self._generation
 
     def get_all(self) -> list[SourceEntry]:
         """Get all sources."""
         if not self._loaded:
-            self._sources = self.parser.parse()
-            self._loaded = True
+            self._load()
         return self._sources
 
     def get_by_id(self, source_id: str) -> Optional[SourceEntry]:
         """Get source by ID."""
-        sources = self.get_all()
-        for source in sources:
-            if source.id == source_id:
-                return source
-        return None
+        self.get_all()
+        return self._by_id.get(source_id)
 
     def get_by_tier(self, tier: str) -> list[SourceEntry]:
         """Get sources by tier."""
-        return [s for s in self.get_all() if s.tier == tier.upper()]
+        self.get_all()
+        return list(self._by_tier.get(tier.upper(), []))
 
     def get_by_url(self, url: str) -> Optional[SourceEntry]:
         """Get source by URL."""
-        for source in self.get_all():
-            if source.url == url:
-                return source
-        return None
+        self.get_all()
+        return self._by_url.get(normalize_url(url))
 
     def get_sources_for_pattern(self, pattern_id: str) -> list[SourceEntry]:
         """Get sources that reference a pattern."""
-        return [s for s in self.get_all() if pattern_id in s.pattern_refs]
+        self.get_all()
+        return list(self._by_pattern.get(pattern_id, []))
+
+    def query(self, tier: Optional[str] = None, pattern: Optional[str] = None) -> list[SourceEntry]:
+        """Get sources matching every given filter, in file order."""
+        if pattern:
+            sources = self.get_sources_for_pattern(pattern)
+            if tier:
+                sources = [s for s in sources if s.tier == tier.upper()]
+            return sources
+        if tier:
+            return self.get_by_tier(tier)
+        return list(self.get_all())
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
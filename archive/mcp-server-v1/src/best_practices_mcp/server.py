@@ -1,23 +1,43 @@
-"""Best Practices MCP Server - Pattern validation and documentation sync."""
+"""Best Practices MCP Server - Pattern validation and documentation sync.
+
+Listing tools and the initialize handshake only need this module and the
+MCP SDK. The tool modules, registries and caches are imported and built on
+the first tool call or resource read, or by a background warm-up started
+once the client sends notifications/initialized.
+"""
 
 import asyncio
+import logging
 import os
+import threading
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
+from urllib.parse import parse_qs, urlsplit
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import (
+    InitializedNotification,
     Resource,
+    ResourceTemplate,
     Tool,
     TextContent,
 )
 from pydantic import AnyUrl
 
-from .tools.validate_patterns import validate_patterns
-from .tools.sync_documentation import sync_documentation
-from .resources.pattern_registry import PatternRegistry
-from .resources.source_registry import SourceRegistry
+from . import executor
+
+if TYPE_CHECKING:
+    from .parsers.parse_cache import ParseCache
+    from .resources.pattern_registry import PatternRegistry
+    from .resources.rendering import ResourceRenderer
+    from .resources.source_registry import SourceRegistry
+    from .tools.check_memo import CheckMemo
+    from .tools.link_checker import LinkStatusCache
+    from .tools.validate_patterns import ValidationResultCache
+    from .watcher import RegistryWatcher
+
+logger = logging.getLogger(__name__)
 
 # Initialize server
 server = Server("best-practices-mcp")
@@ -27,15 +47,186 @@ REPO_ROOT = Path(os.environ.get("REPO_ROOT", Path(__file__).parent.parent.parent
 PATTERNS_DIR = REPO_ROOT / os.environ.get("PATTERNS_DIR", "patterns")
 SOURCES_FILE = REPO_ROOT / os.environ.get("SOURCES_FILE", "SOURCES.md")
 INDEX_FILE = REPO_ROOT / os.environ.get("INDEX_FILE", "INDEX.md")
+PARSE_CACHE_DIR = os.environ.get("PARSE_CACHE_DIR")
+PARSE_WORKERS = int(os.environ.get("PARSE_WORKERS", "1"))
+WATCH_MODE = os.environ.get("WATCH_MODE", "auto")
+WATCH_POLL_INTERVAL = float(os.environ.get("WATCH_POLL_INTERVAL", "2.0"))
+LINK_CACHE_FILE = os.environ.get("LINK_CACHE_FILE")
+LINK_CACHE_TTL = float(os.environ.get("LINK_CACHE_TTL", str(24 * 3600)))
+LINK_CACHE_NEGATIVE_TTL = float(os.environ.get("LINK_CACHE_NEGATIVE_TTL", "3600"))
+VALIDATION_CACHE_DIR = os.environ.get("VALIDATION_CACHE_DIR")
+WARM_UP = os.environ.get("WARM_UP", "1").lower() not in ("0", "false", "no")
+TOOL_SCHEMA = os.environ.get("TOOL_SCHEMA", "full")
+BLOCKING_WORKERS = int(os.environ.get("BLOCKING_WORKERS", str(executor.DEFAULT_WORKERS)))
+
+# Same as tools.link_checker.DEFAULT_MAX_LINKS, repeated so listing tools
+# does not import the tool modules
+DEFAULT_MAX_LINKS = 3
+# Same as tools.search_patterns.DEFAULT_TOP_K and MAX_TOP_K
+DEFAULT_TOP_K = 10
+MAX_TOP_K = 50
+
+# Query parameters that select a page instead of the full registry
+PAGE_PARAMS = {"tier", "phase", "pattern", "fields", "limit", "cursor"}
+PATTERN_FIELDS = (
+    "id", "name", "file_path", "sources", "evidence_tier", "sdd_phase",
+    "related_patterns", "sections", "internal_links", "external_links",
+)
+SOURCE_FIELDS = (
+    "id", "name", "url", "tier", "source_type", "section", "key_insights", "pattern_refs",
+)
+
+# Registries and caches, built by _load() on first use
+parse_cache: Optional["ParseCache"] = None
+pattern_registry: Optional["PatternRegistry"] = None
+source_registry: Optional["SourceRegistry"] = None
+renderers: dict[str, "ResourceRenderer"] = {}
+result_cache: Optional["ValidationResultCache"] = None
+check_memo: Optional["CheckMemo"] = None
+link_cache: Optional["LinkStatusCache"] = None
+watcher: Optional["RegistryWatcher"] = None
+
+_load_lock = threading.Lock()
+# Set by run_server: the watcher is only started for a served session
+_serving = False
+_warm_up_task: Optional[asyncio.Task] = None
+
+
+def _is_loaded() -> bool:
+    return None not in (pattern_registry, source_registry, result_cache, check_memo, link_cache, watcher)
+
+
+def _load() -> None:
+    """Import the tool modules, build whatever is missing and load the registries.
+
+    Safe to call from a worker thread; concurrent callers build each object once.
+    """
+    global parse_cache, pattern_registry, source_registry, result_cache, check_memo, link_cache, watcher
+
+    with _load_lock:
+        from .parsers.parse_cache import ParseCache
+        from .resources.pattern_registry import PatternRegistry
+        from .resources.source_registry import SourceRegistry
+        from .tools.check_memo import CheckMemo
+        from .tools.link_checker import LinkStatusCache
+        from .tools.validate_patterns import ValidationResultCache
+        from .watcher import RegistryWatcher
+
+        if parse_cache is None and PARSE_CACHE_DIR:
+            parse_cache = ParseCache(Path(PARSE_CACHE_DIR) / "parse-cache.sqlite3")
+        if pattern_registry is None:
+            pattern_registry = PatternRegistry(PATTERNS_DIR, cache=parse_cache, parse_workers=PARSE_WORKERS)
+        if source_registry is None:
+            source_registry = SourceRegistry(SOURCES_FILE, cache=parse_cache)
+        if result_cache is None:
+            result_cache = ValidationResultCache()
+        if check_memo is None:
+            check_memo = CheckMemo(
+                Path(VALIDATION_CACHE_DIR) / "check-memo.sqlite3" if VALIDATION_CACHE_DIR else None
+            )
+        if link_cache is None:
+            link_cache = LinkStatusCache(
+                Path(LINK_CACHE_FILE) if LINK_CACHE_FILE else None,
+                ttl=LINK_CACHE_TTL,
+                negative_ttl=LINK_CACHE_NEGATIVE_TTL,
+            )
+        if watcher is None:
+            watcher = RegistryWatcher(
+                pattern_registry,
+                source_registry,
+                mode=WATCH_MODE,
+                poll_interval=WATCH_POLL_INTERVAL,
+            )
+
+        # Parse here, off the event loop, rather than in a tool's first get_all()
+        pattern_registry.get_all()
+        source_registry.get_all()
+
+
+async def _ensure_loaded() -> None:
+    """Load on the executor on first use so the event loop keeps serving."""
+    if not _is_loaded():
+        await executor.run_blocking(_load)
+    if _serving:
+        watcher.start()
+
+
+def _renderer(base_uri: str, registry) -> "ResourceRenderer":
+    """Return the cached renderer for a registry resource."""
+    from .resources.rendering import ResourceRenderer
+
+    renderer = renderers.get(base_uri)
+    if renderer is None or renderer.registry is not registry:
+        renderer = renderers[base_uri] = ResourceRenderer(registry)
+    return renderer
+
+
+async def _warm_up() -> None:
+    """Build the registries and parse the corpus ahead of the first request."""
+    try:
+        await _ensure_loaded()
+        # A running watcher refreshes both registries as it starts
+        if not watcher.running:
+            await pattern_registry.refresh()
+            await source_registry.refresh()
+    except Exception:
+        logger.exception("Warm-up failed; registries will load on first use")
+
+
+async def _on_initialized(notification: InitializedNotification) -> None:
+    """Start the warm-up once the handshake is done, without blocking the session."""
+    global _warm_up_task
+    if WARM_UP and _warm_up_task is None:
+        _warm_up_task = asyncio.create_task(_warm_up())
 
-# Initialize registries
-pattern_registry = PatternRegistry(PATTERNS_DIR)
-source_registry = SourceRegistry(SOURCES_FILE)
+
+server.notification_handlers[InitializedNotification] = _on_initialized
 
 
 @server.list_tools()
 async def list_tools() -> list[Tool]:
-    """List available tools."""
+    """List available tools.
+
+    With TOOL_SCHEMA=compact, parameter descriptions are dropped and a
+    describe_tool tool serves the full definitions on request.
+    """
+    if TOOL_SCHEMA == "compact":
+        return [_compact_tool(tool) for tool in _full_tools()] + [DESCRIBE_TOOL]
+    return _full_tools()
+
+
+# Listed in compact mode in place of the parameter documentation
+DESCRIBE_TOOL = Tool(
+    name="describe_tool",
+    description="Full description and parameter docs of a tool",
+    inputSchema={
+        "type": "object",
+        "properties": {"name": {"type": "string"}},
+        "required": ["name"]
+    }
+)
+
+
+def _compact_tool(tool: Tool) -> Tool:
+    """Copy a tool without descriptions on its parameters."""
+    schema = dict(tool.inputSchema)
+    schema["properties"] = {
+        name: {key: value for key, value in prop.items() if key != "description"}
+        for name, prop in schema.get("properties", {}).items()
+    }
+    return Tool(name=tool.name, description=tool.description, inputSchema=schema)
+
+
+def _describe_tool(name: Optional[str]) -> dict[str, Any]:
+    """Return the full definition of a tool."""
+    for tool in _full_tools():
+        if tool.name == name:
+            return tool.model_dump(mode="json", exclude_none=True)
+    return {"error": f"Unknown tool: {name}"}
+
+
+def _full_tools() -> list[Tool]:
+    """Tool definitions with full parameter documentation."""
     return [
         Tool(
             name="validate_patterns",
@@ -45,18 +236,46 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "action": {
                         "type": "string",
-                        "enum": ["validate_single", "validate_all", "check_links", "check_evidence"],
+                        "enum": ["validate_single", "validate_all", "validate_changed", "check_links", "check_evidence"],
                         "description": "Validation action to perform"
                     },
                     "pattern_id": {
                         "type": "string",
                         "description": "Pattern ID for validate_single action (e.g., 'context-engineering')"
                     },
+                    "pattern_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Pattern IDs or globs (e.g., 'agent-*') to validate in one batch with "
+                                       "validate_single; results are keyed by pattern ID"
+                    },
                     "validation_type": {
                         "type": "string",
                         "enum": ["structure", "links", "evidence", "cross-refs", "full"],
                         "default": "full",
                         "description": "Type of validation to run"
+                    },
+                    "max_links": {
+                        "type": "integer",
+                        "minimum": 0,
+                        "default": DEFAULT_MAX_LINKS,
+                        "description": "Maximum external links to check per pattern (0 checks all)"
+                    },
+                    "revision_range": {
+                        "type": "string",
+                        "description": "Git revisions for validate_changed, e.g. 'origin/main...HEAD' or 'HEAD~1' "
+                                       "(defaults to uncommitted changes)"
+                    },
+                    "changed_paths": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Changed files relative to the repo root for validate_changed, instead of git"
+                    },
+                    "chunk_size": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "description": "Return results as separate content blocks of this many patterns, "
+                                       "after a first block with the summary"
                     }
                 },
                 "required": ["action"]
@@ -87,23 +306,66 @@ async def list_tools() -> list[Tool]:
                 },
                 "required": ["action"]
             }
+        ),
+        Tool(
+            name="search_patterns",
+            description="Ranked full-text search over patterns, with snippets",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "Free-text query, e.g. 'context window compaction'"
+                    },
+                    "top_k": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": MAX_TOP_K,
+                        "default": DEFAULT_TOP_K,
+                        "description": "Number of results to return"
+                    }
+                },
+                "required": ["query"]
+            }
         )
     ]
 
 
-@server.call_tool()
+@server.call_tool(validate_input=False)
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls."""
+    import json
+
+    _validate_arguments(name, arguments)
+    if name == "describe_tool":
+        return [TextContent(type="text", text=json.dumps(_describe_tool(arguments.get("name")), indent=2))]
+
+    await _ensure_loaded()
     if name == "validate_patterns":
+        from .tools.validate_patterns import validate_patterns
+
         result = await validate_patterns(
             action=arguments["action"],
             pattern_id=arguments.get("pattern_id"),
+            pattern_ids=arguments.get("pattern_ids"),
             validation_type=arguments.get("validation_type", "full"),
+            max_links=arguments.get("max_links", DEFAULT_MAX_LINKS) or None,
             pattern_registry=pattern_registry,
             source_registry=source_registry,
-            repo_root=REPO_ROOT
+            repo_root=REPO_ROOT,
+            link_cache=link_cache,
+            revision_range=arguments.get("revision_range"),
+            changed_paths=arguments.get("changed_paths"),
+            result_cache=result_cache,
+            memo=check_memo,
+            on_result=_progress_reporter()
         )
+        chunk_size = arguments.get("chunk_size")
+        if chunk_size and "results" in result:
+            return _chunked_content(result, chunk_size)
     elif name == "sync_documentation":
+        from .tools.sync_documentation import sync_documentation
+
         result = await sync_documentation(
             action=arguments["action"],
             scope=arguments.get("scope", "all"),
@@ -113,13 +375,87 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             repo_root=REPO_ROOT,
             index_file=INDEX_FILE
         )
+    elif name == "search_patterns":
+        from .tools.search_patterns import search_patterns
+
+        result = await search_patterns(
+            query=arguments["query"],
+            top_k=arguments.get("top_k", DEFAULT_TOP_K),
+            pattern_registry=pattern_registry,
+        )
     else:
         result = {"error": f"Unknown tool: {name}"}
 
-    import json
     return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
 
+# Compiled input schema validators by tool name
+_validators: dict[str, Any] = {}
+
+
+def _validate_arguments(name: str, arguments: dict[str, Any]) -> None:
+    """Check tool arguments against the tool's input schema.
+
+    Replaces the SDK's validate_input, which re-checks the schema itself on
+    every call and costs more than most tool calls.
+
+    Raises:
+        ValueError: If the arguments do not match the schema
+    """
+    import jsonschema
+
+    validator = _validators.get(name)
+    if validator is None:
+        tool = next((t for t in _full_tools() + [DESCRIBE_TOOL] if t.name == name), None)
+        if tool is None:
+            return
+        validator_cls = jsonschema.validators.validator_for(tool.inputSchema)
+        validator = _validators[name] = validator_cls(tool.inputSchema)
+    error = jsonschema.exceptions.best_match(validator.iter_errors(arguments))
+    if error is not None:
+        raise ValueError(f"Input validation error: {error.message}")
+
+
+def _progress_reporter() -> Optional[Callable[[dict[str, Any], int, int], Awaitable[None]]]:
+    """Return a callback sending a progress notification per validated pattern.
+
+    Returns None unless the client asked for progress with a progress token.
+    """
+    try:
+        ctx = server.request_context
+    except LookupError:
+        return None
+    token = ctx.meta.progressToken if ctx.meta else None
+    if token is None:
+        return None
+
+    async def report(result: dict[str, Any], completed: int, total: int) -> None:
+        await ctx.session.send_progress_notification(
+            token,
+            completed,
+            total,
+            message=f"{result['pattern_id']}: {result['status']}",
+        )
+
+    return report
+
+
+def _chunked_content(result: dict[str, Any], chunk_size: int) -> list[TextContent]:
+    """Split a validation response into a summary block and blocks of results."""
+    import json
+
+    results = result["results"]
+    keyed = isinstance(results, dict)
+    items = list(results.items()) if keyed else results
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    header = {**result, "results": {} if keyed else [], "result_chunks": len(chunks)}
+    content = [TextContent(type="text", text=json.dumps(header, indent=2))]
+    for chunk in chunks:
+        chunk_results = dict(chunk) if keyed else chunk
+        content.append(TextContent(type="text", text=json.dumps({"results": chunk_results}, indent=2)))
+    return content
+
+
 @server.list_resources()
 async def list_resources() -> list[Resource]:
     """List available resources."""
@@ -127,42 +463,144 @@ async def list_resources() -> list[Resource]:
         Resource(
             uri=AnyUrl("patterns://registry"),
             name="Pattern Registry",
-            description="All documented patterns with metadata",
+            description="All documented patterns with metadata. Add ?compact=1 for unindented JSON "
+                        "and ?etag=<etag> to skip an unchanged registry",
             mimeType="application/json"
         ),
         Resource(
             uri=AnyUrl("sources://registry"),
             name="Source Registry",
-            description="All references from SOURCES.md with tier classification",
+            description="All references from SOURCES.md with tier classification. Supports the same "
+                        "compact and etag query parameters",
             mimeType="application/json"
         )
     ]
 
 
+@server.list_resource_templates()
+async def list_resource_templates() -> list[ResourceTemplate]:
+    """List filtered, paginated views of the registries."""
+    return [
+        ResourceTemplate(
+            uriTemplate="patterns://registry{?tier,phase,fields,limit,cursor}",
+            name="Pattern Registry Page",
+            description="Patterns filtered by evidence tier and/or SDD phase, one page at a time. "
+                        "fields is a comma-separated list of pattern keys; pass next_cursor "
+                        "back as cursor for the following page",
+            mimeType="application/json"
+        ),
+        ResourceTemplate(
+            uriTemplate="sources://registry{?tier,pattern,fields,limit,cursor}",
+            name="Source Registry Page",
+            description="Sources filtered by tier and/or referencing pattern id, one page at a time",
+            mimeType="application/json"
+        ),
+    ]
+
+
 @server.read_resource()
 async def read_resource(uri: AnyUrl) -> str:
-    """Read resource content."""
+    """Read resource content.
+
+    Query parameters:
+        compact: Present and not "0", "false" or "no" for JSON without indentation
+        etag: Etag from a previous read; if the registry is unchanged a short
+            {"etag": ..., "not_modified": true} document is returned instead
+        tier, phase (patterns), pattern (sources): Filters served from the
+            registry indexes
+        fields, limit, cursor: Return one page of matching entries with only
+            the given keys instead of the full registry
+    """
     import json
+    from .resources.pagination import DEFAULT_PAGE_SIZE, parse_fields, render_page
+
+    await _ensure_loaded()
+    parts = urlsplit(str(uri))
+    base_uri = f"{parts.scheme}://{parts.netloc}{parts.path}"
+    params = parse_qs(parts.query, keep_blank_values=True)
 
-    uri_str = str(uri)
-    if uri_str == "patterns://registry":
-        await pattern_registry.refresh()
-        return json.dumps(pattern_registry.to_dict(), indent=2)
-    elif uri_str == "sources://registry":
-        await source_registry.refresh()
-        return json.dumps(source_registry.to_dict(), indent=2)
+    if base_uri == "patterns://registry":
+        registry = pattern_registry
+    elif base_uri == "sources://registry":
+        registry = source_registry
     else:
         raise ValueError(f"Unknown resource: {uri}")
 
+    # The watcher keeps registries current; only refresh on demand without it
+    if not watcher.running:
+        await registry.refresh()
+
+    renderer = _renderer(base_uri, registry)
+    compact = _query_flag(params, "compact")
+    etag = _query_value(params, "etag")
+    if etag is not None and etag.strip('"') == renderer.etag:
+        return json.dumps({"etag": renderer.etag, "not_modified": True})
+
+    if not PAGE_PARAMS.intersection(params):
+        # Serializing a large registry takes long enough to stall other requests
+        rendered = await executor.run_blocking(renderer.render, compact)
+        return rendered.text
+
+    if registry is pattern_registry:
+        items = pattern_registry.query(
+            tier=_query_value(params, "tier"),
+            phase=_query_value(params, "phase"),
+        )
+        allowed_fields = PATTERN_FIELDS
+    else:
+        items = source_registry.query(
+            tier=_query_value(params, "tier"),
+            pattern=_query_value(params, "pattern"),
+        )
+        allowed_fields = SOURCE_FIELDS
+
+    limit = _query_value(params, "limit")
+    try:
+        limit = int(limit) if limit else DEFAULT_PAGE_SIZE
+    except ValueError:
+        raise ValueError(f"Invalid limit: {limit}")
+    return render_page(
+        items,
+        renderer.etag,
+        cursor=_query_value(params, "cursor"),
+        limit=limit,
+        fields=parse_fields(_query_value(params, "fields"), allowed_fields),
+        compact=compact,
+    )
+
+
+def _query_value(params: dict[str, list[str]], name: str) -> Optional[str]:
+    """Read a single-valued query parameter; the last value wins."""
+    values = params.get(name)
+    return values[-1] if values else None
+
+
+def _query_flag(params: dict[str, list[str]], name: str) -> bool:
+    """Read a boolean query parameter."""
+    value = _query_value(params, name)
+    if value is None:
+        return False
+    return value.lower() not in ("0", "false", "no")
+
 
 async def run_server():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
+    global _serving
+    _serving = True
+    executor.configure(BLOCKING_WORKERS)
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
+    finally:
+        if _warm_up_task is not None:
+            _warm_up_task.cancel()
+        if watcher is not None:
+            await watcher.stop()
+        executor.shutdown()
 
 
 def main():
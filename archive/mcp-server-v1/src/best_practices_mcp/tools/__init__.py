@@ -2,5 +2,6 @@
 
 from .validate_patterns import validate_patterns
 from .sync_documentation import sync_documentation
+from .search_patterns import search_patterns
 
-__all__ = ["validate_patterns", "sync_documentation"]
+__all__ = ["validate_patterns", "sync_documentation", "search_patterns"]
@@ -0,0 +1,71 @@
+"""Multi-keyword substring search."""
+
+from collections import deque
+from typing import Iterable
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton over a fixed set of keywords.
+
+    find_all() reports which keywords occur anywhere in a text, as plain
+    case-sensitive substrings, in one pass over the text. The cost is linear
+    in the text length and does not grow with the number of keywords.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[str, ...]] = [()]
+        # The empty string is a substring of every text
+        self._always: set[str] = set()
+        self._keyword_count = 0
+
+        for keyword in set(keywords):
+            self._keyword_count += 1
+            if not keyword:
+                self._always.add(keyword)
+                continue
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = next_state
+            self._out[state] += (keyword,)
+
+        self._build_failure_links()
+
+    def _build_failure_links(self) -> None:
+        """Link each state to its longest proper suffix state, breadth first."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                # A match ending here also ends every suffix match
+                self._out[child] += self._out[self._fail[child]]
+
+    def find_all(self, text: str) -> set[str]:
+        """Return the keywords that occur in text."""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        found = set(self._always)
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+                if len(found) == self._keyword_count:
+                    break
+        return found
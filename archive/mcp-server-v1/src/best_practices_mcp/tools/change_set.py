@@ -0,0 +1,178 @@
+"""Work out which patterns a set of file changes affects."""
+
+import asyncio
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from ..executor import run_blocking
+from ..parsers.sources_parser import SourceEntry, SourcesParser
+from ..resources.pattern_registry import PatternRegistry
+from ..resources.source_registry import SourceRegistry
+
+
+@dataclass
+class ChangeSet:
+    """Changed files and the patterns whose validation results they affect."""
+    paths: list[str]
+    changed_patterns: list[str] = field(default_factory=list)
+    removed_patterns: list[str] = field(default_factory=list)
+    changed_sources: list[str] = field(default_factory=list)
+    affected: set[str] = field(default_factory=set)
+
+    def to_dict(self) -> dict:
+        return {
+            "paths": self.paths,
+            "changed_patterns": self.changed_patterns,
+            "removed_patterns": self.removed_patterns,
+            "changed_sources": self.changed_sources,
+            "affected": sorted(self.affected),
+        }
+
+
+async def compute_change_set(
+    pattern_registry: PatternRegistry,
+    source_registry: SourceRegistry,
+    repo_root: Path,
+    revision_range: Optional[str] = None,
+    changed_paths: Optional[list[str]] = None,
+) -> ChangeSet:
+    """Find the patterns affected by a change.
+
+    The change is either an explicit list of paths relative to repo_root, or
+    the files git reports as changed for revision_range ("A..B", "A...B", or a
+    single revision compared with the working tree). With neither, uncommitted
+    and untracked files are used.
+
+    A pattern is affected when its file changed, when it links to a changed or
+    removed pattern, or when a SOURCES.md entry it cites or is referenced from
+    changed. SOURCES.md changes are found by comparing the working tree with
+    the base revision of the change (HEAD for explicit paths).
+
+    Raises:
+        ValueError: If git fails, e.g. for an unknown revision, or a revision
+            starts with "-"
+    """
+    if changed_paths is not None:
+        paths = list(changed_paths)
+        base = "HEAD"
+    else:
+        paths, base = await _git_changed_paths(repo_root, revision_range)
+
+    patterns_dir = os.path.normpath(os.path.abspath(pattern_registry.patterns_dir))
+    sources_file = os.path.normpath(os.path.abspath(source_registry.sources_file))
+    change_set = ChangeSet(paths=paths)
+
+    sources_changed = False
+    for path in paths:
+        full_path = os.path.normpath(os.path.abspath(os.path.join(repo_root, path)))
+        if full_path == sources_file:
+            sources_changed = True
+        elif os.path.dirname(full_path) == patterns_dir and full_path.endswith('.md'):
+            pattern_id = os.path.basename(full_path)[:-3]
+            if pattern_registry.get_by_id(pattern_id):
+                change_set.changed_patterns.append(pattern_id)
+            else:
+                change_set.removed_patterns.append(pattern_id)
+
+    affected = change_set.affected
+    affected.update(change_set.changed_patterns)
+    for pattern_id in change_set.changed_patterns + change_set.removed_patterns:
+        affected.update(p.id for p in pattern_registry.get_referrers(pattern_id))
+
+    if sources_changed:
+        relative_sources = os.path.relpath(sources_file, os.path.abspath(repo_root))
+        try:
+            old_text = await _git(repo_root, "show", f"{base}:./{relative_sources}")
+        except ValueError:
+            # Not tracked at the base revision: every entry is new
+            old_text = ""
+        changed_entries = await run_blocking(
+            _changed_sources, Path(sources_file), old_text, source_registry.get_all()
+        )
+        change_set.changed_sources = sorted({e.id for e in changed_entries})
+
+        graph = pattern_registry.citation_graph
+        for entry in changed_entries:
+            if entry.url:
+                affected.update(graph.citing(entry.url))
+            affected.update(entry.pattern_refs)
+
+    # Only report patterns that still exist
+    change_set.affected = {
+        pattern_id for pattern_id in affected if pattern_registry.get_by_id(pattern_id)
+    }
+    return change_set
+
+
+def _changed_sources(sources_file: Path, old_text: str, new: list[SourceEntry]) -> list[SourceEntry]:
+    """Entries changed between an old SOURCES.md text and the current entries."""
+    old = SourcesParser(sources_file).parse_lines(old_text.splitlines(keepends=True))
+    return _changed_entries(list(old), new)
+
+
+def _changed_entries(old: list[SourceEntry], new: list[SourceEntry]) -> list[SourceEntry]:
+    """Old and new versions of entries that were added, removed or edited."""
+    old_by_id = {e.id: e for e in old}
+    new_by_id = {e.id: e for e in new}
+    changed = []
+    for entry_id in old_by_id.keys() | new_by_id.keys():
+        before = old_by_id.get(entry_id)
+        after = new_by_id.get(entry_id)
+        if before is not None and after is not None and before.to_dict() == after.to_dict():
+            continue
+        changed.extend(e for e in (before, after) if e is not None)
+    return changed
+
+
+async def _git_changed_paths(repo_root: Path, revision_range: Optional[str]) -> tuple[list[str], str]:
+    """Return paths changed in a revision range and the revision to compare against."""
+    if revision_range is None:
+        diff = await _git(repo_root, "diff", "--name-only", "--no-renames", "--relative", "HEAD")
+        untracked = await _git(repo_root, "ls-files", "--others", "--exclude-standard")
+        return _lines(diff) + _lines(untracked), "HEAD"
+
+    if "..." in revision_range:
+        left, right = revision_range.split("...", 1)
+        _check_revision(left)
+        _check_revision(right)
+        base = (await _git(repo_root, "merge-base", left or "HEAD", right or "HEAD")).strip()
+    elif ".." in revision_range:
+        left, right = revision_range.split("..", 1)
+        _check_revision(left)
+        _check_revision(right)
+        base = left or "HEAD"
+    else:
+        _check_revision(revision_range)
+        base = revision_range
+    # Without --no-renames a rename only lists the new path, and referrers
+    # of the old one would go unchecked
+    diff = await _git(repo_root, "diff", "--name-only", "--no-renames", "--relative", revision_range)
+    return _lines(diff), base
+
+
+def _check_revision(revision: str) -> None:
+    """Refuse revisions git would read as options, e.g. --output=<file>."""
+    if revision.startswith("-"):
+        raise ValueError(f"Invalid revision: {revision}")
+
+
+def _lines(output: str) -> list[str]:
+    return [line for line in output.splitlines() if line]
+
+
+async def _git(repo_root: Path, *args: str) -> str:
+    """Run a git command in repo_root and return its output."""
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "git", "-C", str(repo_root), *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError:
+        raise ValueError("git is not installed")
+    stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise ValueError(f"git {' '.join(args)} failed: {stderr.decode(errors='replace').strip()}")
+    return stdout.decode('utf-8', errors='replace')
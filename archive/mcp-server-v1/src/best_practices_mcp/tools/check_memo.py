@@ -0,0 +1,85 @@
+"""Persistent memo of validation check results."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+# Bump when any check's rules change so memoized results are discarded
+CHECKS_VERSION = "1"
+
+
+def memo_key(inputs: Any) -> str:
+    """Hash the JSON-serializable inputs of a check."""
+    data = json.dumps([CHECKS_VERSION, inputs], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+class CheckMemo:
+    """SQLite-backed store of check results keyed by a hash of their inputs.
+
+    Each check (structure, links, evidence, cross-refs) describes the inputs
+    it actually reads; identical inputs give the stored issues back without
+    running the check. With no db_path the memo lives in memory for the
+    process lifetime.
+
+    Lookups are served from an in-memory copy filled on first access to each
+    key, since most checks cost less than a database round trip.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS check_memo (
+            check_name TEXT NOT NULL,
+            key TEXT NOT NULL,
+            issues TEXT NOT NULL,
+            PRIMARY KEY (check_name, key)
+        )
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = db_path
+        if db_path is not None:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(db_path) if db_path is not None else ":memory:", check_same_thread=False
+        )
+        self._conn.execute(self.SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], list[dict]] = {}
+
+    def get(self, check: str, key: str) -> Optional[list[dict]]:
+        """Return the memoized issues for a check, or None."""
+        issues = self._entries.get((check, key))
+        if issues is not None:
+            return list(issues)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT issues FROM check_memo WHERE check_name = ? AND key = ?", (check, key)
+            ).fetchone()
+        if row is None:
+            return None
+        issues = json.loads(row[0])
+        self._entries[(check, key)] = issues
+        return list(issues)
+
+    def put(self, check: str, key: str, issues: list[dict]) -> None:
+        """Store a check's issues; call commit() to persist a batch of puts."""
+        self._entries[(check, key)] = list(issues)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO check_memo (check_name, key, issues) VALUES (?, ?, ?)",
+                (check, key, json.dumps(issues)),
+            )
+
+    def commit(self) -> None:
+        """Persist pending writes."""
+        with self._lock:
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,205 @@
+"""Pooled, concurrency-limited external link checking."""
+
+import asyncio
+import dataclasses
+import importlib.util
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urldefrag, urlsplit
+
+import httpx
+
+from ..executor import run_blocking
+
+# Default number of external links checked per pattern; None checks every link
+DEFAULT_MAX_LINKS = 3
+
+
+def cache_key(url: str) -> str:
+    """Key for a URL's check result: the URL without its fragment.
+
+    The fragment is never sent to the server, so it cannot change the
+    response. Anything else, including a trailing slash, may.
+    """
+    return urldefrag(url)[0]
+
+
+@dataclass
+class LinkStatus:
+    """Outcome of checking one external URL."""
+    url: str
+    status_code: Optional[int] = None
+    final_url: Optional[str] = None
+    error: Optional[str] = None
+    checked_at: float = 0.0
+
+    @property
+    def is_negative(self) -> bool:
+        """True for request errors and error responses."""
+        return self.status_code is None or self.status_code >= 400
+
+    def to_dict(self) -> dict:
+        return dataclasses.asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LinkStatus":
+        return cls(**data)
+
+
+class LinkStatusCache:
+    """URL-keyed cache of link check results with optional persistence.
+
+    Successful results are reused for ttl seconds, errors and error responses
+    for negative_ttl seconds. When path is set the cache is loaded from and
+    saved to a JSON file so results survive restarts.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl: float = 24 * 3600,
+        negative_ttl: float = 3600,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: dict[str, LinkStatus] = {}
+        if path is not None and path.exists():
+            self._load()
+
+    def get(self, url: str) -> Optional[LinkStatus]:
+        """Return a fresh cached status for url, if any."""
+        status = self._entries.get(cache_key(url))
+        if status is None or not self._is_fresh(status, time.time()):
+            return None
+        return status
+
+    def put(self, status: LinkStatus) -> None:
+        self._entries[cache_key(status.url)] = status
+
+    def _is_fresh(self, status: LinkStatus, now: float) -> bool:
+        ttl = self.negative_ttl if status.is_negative else self.ttl
+        return now - status.checked_at < ttl
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            self._entries = {
+                key: LinkStatus.from_dict(entry)
+                for key, entry in data.get("entries", {}).items()
+            }
+        except (OSError, ValueError, TypeError):
+            # A corrupt cache is only a performance problem; start empty
+            self._entries = {}
+
+    def save(self) -> None:
+        """Write fresh entries to disk, dropping expired ones."""
+        if self.path is None:
+            return
+        now = time.time()
+        entries = {
+            key: status.to_dict()
+            for key, status in list(self._entries.items())
+            if self._is_fresh(status, now)
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps({"entries": entries}), encoding='utf-8')
+        os.replace(tmp_path, self.path)
+
+
+class LinkChecker:
+    """Check external links over one shared connection pool.
+
+    A single client is reused for a whole validation run. A global semaphore
+    bounds the number of in-flight requests and a per-host semaphore keeps us
+    from hammering any one site. HTTP/2 is used when the optional h2 package
+    is installed.
+
+    Results are looked up in a LinkStatusCache first and concurrent checks of
+    the same URL share one request, so each URL is fetched at most once per
+    cache window.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 20,
+        per_host_limit: int = 4,
+        timeout: float = 10.0,
+        http2: Optional[bool] = None,
+        cache: Optional[LinkStatusCache] = None,
+    ):
+        if http2 is None:
+            http2 = importlib.util.find_spec("h2") is not None
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.http2 = http2
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self.cache = cache if cache is not None else LinkStatusCache()
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def __aenter__(self) -> "LinkChecker":
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            follow_redirects=True,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        await run_blocking(self.cache.save)
+
+    async def check(self, url: str) -> LinkStatus:
+        """Return the status of a URL, from the cache or a HEAD request."""
+        if self._client is None:
+            raise RuntimeError("LinkChecker must be used as an async context manager")
+
+        cached = self.cache.get(url)
+        if cached is not None:
+            return dataclasses.replace(cached, url=url)
+
+        key = cache_key(url)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(url))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        status = await asyncio.shield(task)
+        return dataclasses.replace(status, url=url)
+
+    async def _fetch(self, url: str) -> LinkStatus:
+        """HEAD a URL and cache the status or request error."""
+        host = urlsplit(url).netloc.lower()
+        host_semaphore = self._host_semaphores.setdefault(
+            host, asyncio.Semaphore(self.per_host_limit)
+        )
+        # Wait for the host first, so checks queued on a busy host do not
+        # hold global slots that other hosts could use
+        async with host_semaphore, self._semaphore:
+            try:
+                response = await self._client.head(url)
+            except httpx.RequestError as e:
+                status = LinkStatus(url=url, error=type(e).__name__, checked_at=time.time())
+            else:
+                status = LinkStatus(
+                    url=url,
+                    status_code=response.status_code,
+                    final_url=str(response.url),
+                    checked_at=time.time(),
+                )
+        self.cache.put(status)
+        return status
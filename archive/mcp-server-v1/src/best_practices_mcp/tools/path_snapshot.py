@@ -0,0 +1,56 @@
+"""Per-run cache of filesystem lookups for link checks."""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+
+class PathSnapshot:
+    """Answer path existence checks from cached directory listings.
+
+    The first check under a directory lists it once with os.scandir; later
+    checks for any file in that directory are set lookups. Resolved link
+    targets are memoized per (base directory, link), since most links in a
+    corpus point at the same few files.
+
+    A snapshot does not notice files created or deleted after their
+    directory was listed, so use a new one for each validation run.
+    """
+
+    def __init__(self):
+        self._listings: dict[str, frozenset[str]] = {}
+        self._resolved: dict[tuple[str, str], Path] = {}
+
+    def resolve(self, base: Path, link: str) -> Path:
+        """Return (base / link).resolve(), memoized."""
+        key = (str(base), link)
+        resolved = self._resolved.get(key)
+        if resolved is None:
+            resolved = (base / link).resolve()
+            self._resolved[key] = resolved
+        return resolved
+
+    def exists(self, path: Path) -> bool:
+        """Whether a path exists, from the listing of its parent directory."""
+        parent, name = os.path.split(str(path))
+        if name in ('', '.', '..'):
+            # Roots and relative components have no entry of their own
+            return os.path.exists(path)
+        return name in self._listing(parent or '.')
+
+    def _listing(self, directory: str) -> frozenset[str]:
+        names = self._listings.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = frozenset(entry.name for entry in entries)
+            except OSError:
+                # Missing or unreadable directories contain nothing we can link to
+                names = frozenset()
+            self._listings[directory] = names
+        return names
+
+
+def path_exists(path: Path, paths: Optional[PathSnapshot] = None) -> bool:
+    """Check a path through the snapshot when one is given."""
+    return paths.exists(path) if paths is not None else path.exists()
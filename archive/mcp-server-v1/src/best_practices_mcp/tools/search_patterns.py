@@ -0,0 +1,43 @@
+"""Full-text pattern search tool."""
+
+from typing import Any
+
+from ..executor import run_blocking
+from ..resources.pattern_registry import PatternRegistry
+
+DEFAULT_TOP_K = 10
+MAX_TOP_K = 50
+
+
+async def search_patterns(
+    query: str,
+    top_k: int,
+    pattern_registry: PatternRegistry,
+) -> dict[str, Any]:
+    """Find the patterns best matching a free-text query.
+
+    Results are ranked by BM25 over titles, section headings and full text,
+    and carry a snippet around the first matching term. The first search
+    builds the index from the pattern files, so it runs on the shared
+    executor rather than on the event loop.
+    """
+    if not query.strip():
+        return {"error": "query must not be empty"}
+    top_k = max(1, min(top_k, MAX_TOP_K))
+
+    hits = await run_blocking(pattern_registry.search, query, top_k)
+    return {
+        "query": query,
+        "results": [
+            {
+                "pattern_id": pattern.id,
+                "name": pattern.name,
+                "file_path": pattern.file_path,
+                "evidence_tier": pattern.evidence_tier,
+                "sdd_phase": pattern.sdd_phase,
+                "score": hit.score,
+                "snippet": hit.snippet,
+            }
+            for pattern, hit in hits
+        ],
+    }
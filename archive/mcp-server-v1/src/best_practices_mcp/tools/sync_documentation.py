@@ -1,11 +1,14 @@
 """Documentation sync tool."""
 
 import re
+from collections import Counter
 from pathlib import Path
 from typing import Any, Optional
 
+from ..executor import run_blocking
 from ..resources.pattern_registry import PatternRegistry
 from ..resources.source_registry import SourceRegistry
+from .aho_corasick import AhoCorasick
 
 
 async def sync_documentation(
@@ -17,25 +20,29 @@ async def sync_documentation(
     repo_root: Path,
     index_file: Path,
 ) -> dict[str, Any]:
-    """Check and sync documentation consistency."""
+    """Check and sync documentation consistency.
+
+    The checks are blocking file reads and registry scans, so they run on the
+    shared executor rather than on the event loop.
+    """
 
     if action == "check_consistency":
-        return await _check_consistency(scope, pattern_registry, source_registry, repo_root)
+        return await run_blocking(_check_consistency, scope, pattern_registry, source_registry, repo_root)
 
     elif action == "update_index":
-        return await _check_index_updates(pattern_registry, repo_root, index_file, auto_fix)
+        return await run_blocking(_check_index_updates, pattern_registry, repo_root, index_file, auto_fix)
 
     elif action == "verify_cross_refs":
-        return await _verify_cross_refs(scope, pattern_registry, source_registry, repo_root)
+        return await run_blocking(_verify_cross_refs, scope, pattern_registry, source_registry, repo_root)
 
     elif action == "generate_report":
-        return await _generate_report(pattern_registry, source_registry, repo_root, index_file)
+        return await run_blocking(_generate_report, pattern_registry, source_registry, repo_root, index_file)
 
     else:
         return {"error": f"Unknown action: {action}"}
 
 
-async def _check_consistency(
+def _check_consistency(
     scope: str,
     pattern_registry: PatternRegistry,
     source_registry: SourceRegistry,
@@ -55,9 +62,12 @@ async def _check_consistency(
             claude_content = claude_md.read_text()
             files_checked += 1
 
+            # Scan CLAUDE.md once for every pattern id and name
+            mentioned = AhoCorasick(term for p in patterns for term in (p.id, p.name)).find_all(claude_content)
+
             for pattern in patterns:
                 # Check if pattern is in key files table
-                if pattern.id not in claude_content and pattern.name not in claude_content:
+                if pattern.id not in mentioned and pattern.name not in mentioned:
                     # Only flag if it's a foundational or cross-phase pattern
                     if pattern.sdd_phase in ("foundational", "cross-phase"):
                         inconsistencies.append({
@@ -75,7 +85,7 @@ async def _check_consistency(
         # Check sources referenced in patterns exist in SOURCES.md
         for pattern in patterns:
             for source in pattern.sources:
-                url = source.get("url")
+                url = source.url
                 if url:
                     source_entry = source_registry.get_by_url(url)
                     if not source_entry:
@@ -96,7 +106,7 @@ async def _check_consistency(
     }
 
 
-async def _check_index_updates(
+def _check_index_updates(
     pattern_registry: PatternRegistry,
     repo_root: Path,
     index_file: Path,
@@ -121,9 +131,12 @@ async def _check_index_updates(
     index_content = index_file.read_text()
     patterns = pattern_registry.get_all()
 
+    # Scan INDEX.md once for every pattern id and name
+    listed = AhoCorasick(term for p in patterns for term in (p.id, p.name)).find_all(index_content)
+
     for pattern in patterns:
         # Check if pattern is listed in INDEX.md
-        if pattern.id not in index_content and pattern.name not in index_content:
+        if pattern.id not in listed and pattern.name not in listed:
             index_updates_needed.append({
                 "index_file": str(index_file),
                 "update_type": "add",
@@ -149,7 +162,7 @@ async def _check_index_updates(
     }
 
 
-async def _verify_cross_refs(
+def _verify_cross_refs(
     scope: str,
     pattern_registry: PatternRegistry,
     source_registry: SourceRegistry,
@@ -157,32 +170,26 @@ async def _verify_cross_refs(
 ) -> dict[str, Any]:
     """Verify cross-references between patterns."""
     missing_cross_refs = []
-    patterns = pattern_registry.get_all()
+
+    # Patterns sharing sources are found through the registry's URL index,
+    # read from one snapshot so the graph matches the pattern list
+    snapshot = pattern_registry.snapshot
+    patterns, graph = snapshot.patterns, snapshot.graph
 
     # Build a map of which patterns reference which
-    refs_to = {p.id: set(p.related_patterns) for p in patterns}
-    refs_from = {p.id: set() for p in patterns}
-    for pattern_id, refs in refs_to.items():
-        for ref in refs:
-            if ref in refs_from:
-                refs_from[ref].add(pattern_id)
-
-    # Find patterns that should reference each other but don't
-    # Based on shared sources or topics
+    refs_to = {p.id: dict.fromkeys(p.related_patterns) for p in patterns}
+    position = {p.id: i for i, p in enumerate(patterns)}
+
     for pattern in patterns:
-        # Check if patterns with same SDD phase reference each other
-        same_phase = [p for p in patterns if p.sdd_phase == pattern.sdd_phase and p.id != pattern.id]
-        for other in same_phase:
-            # If they share sources, they should probably reference each other
-            pattern_urls = {s.get("url") for s in pattern.sources}
-            other_urls = {s.get("url") for s in other.sources}
-            shared_sources = pattern_urls & other_urls - {None}
-
-            if shared_sources and other.id not in refs_to[pattern.id]:
+        # Patterns in the same SDD phase that share sources should probably
+        # reference each other
+        shared = graph.shared_sources(pattern.id, same_phase=True)
+        for other_id in sorted(shared, key=position.__getitem__):
+            if other_id not in refs_to[pattern.id]:
                 missing_cross_refs.append({
                     "pattern": pattern.id,
-                    "should_reference": other.id,
-                    "reason": f"Patterns share {len(shared_sources)} source(s) and same SDD phase"
+                    "should_reference": other_id,
+                    "reason": f"Patterns share {shared[other_id]} source(s) and same SDD phase"
                 })
 
         # Check bidirectional references
@@ -203,47 +210,51 @@ async def _verify_cross_refs(
     }
 
 
-async def _generate_report(
+def _generate_report(
     pattern_registry: PatternRegistry,
     source_registry: SourceRegistry,
     repo_root: Path,
     index_file: Path,
 ) -> dict[str, Any]:
-    """Generate a comprehensive documentation status report."""
-    patterns = pattern_registry.get_all()
+    """Generate a comprehensive documentation status report.
+
+    Counts are aggregated over the registry's columnar table rather than
+    by scanning the pattern list once per figure.
+    """
+    table = pattern_registry.to_table()
     sources = source_registry.get_all()
+    columns = table.patterns
+    total_patterns = len(table)
 
     # Count by tier
-    patterns_by_tier = {
-        "A": len([p for p in patterns if p.evidence_tier == "A"]),
-        "B": len([p for p in patterns if p.evidence_tier == "B"]),
-        "C": len([p for p in patterns if p.evidence_tier == "C"]),
-        "D": len([p for p in patterns if p.evidence_tier == "D"]),
-        "None": len([p for p in patterns if not p.evidence_tier]),
-    }
+    tiers = table.value_counts("evidence_tier")
+    patterns_by_tier = {tier: tiers[tier] for tier in ("A", "B", "C", "D")}
+    patterns_by_tier["None"] = sum(count for tier, count in tiers.items() if not tier)
 
     # Count by phase
-    patterns_by_phase = {}
-    for pattern in patterns:
-        phase = pattern.sdd_phase or "unspecified"
-        patterns_by_phase[phase] = patterns_by_phase.get(phase, 0) + 1
+    patterns_by_phase: Counter = Counter()
+    for phase, count in table.value_counts("sdd_phase").items():
+        patterns_by_phase[phase or "unspecified"] += count
 
     # Patterns without sources
-    patterns_without_sources = [p.id for p in patterns if not p.sources]
+    patterns_without_sources = [
+        pattern_id for pattern_id, count in zip(columns["id"], columns["source_count"]) if not count
+    ]
 
     # Cross-reference stats
-    total_cross_refs = sum(len(p.related_patterns) for p in patterns)
-    avg_cross_refs = total_cross_refs / len(patterns) if patterns else 0
+    total_cross_refs = sum(map(len, columns["related_patterns"]))
+    avg_cross_refs = total_cross_refs / total_patterns if total_patterns else 0
 
     return {
         "action": "generate_report",
-        "files_checked": len(patterns) + len(sources),
+        "files_checked": total_patterns + len(sources),
         "report": {
-            "total_patterns": len(patterns),
+            "total_patterns": total_patterns,
             "total_sources": len(sources),
             "patterns_by_tier": patterns_by_tier,
-            "patterns_by_phase": patterns_by_phase,
+            "patterns_by_phase": dict(patterns_by_phase),
             "patterns_without_sources": patterns_without_sources,
+            "orphan_patterns": table.orphans(),
             "cross_reference_stats": {
                 "total": total_cross_refs,
                 "average_per_pattern": round(avg_cross_refs, 2)
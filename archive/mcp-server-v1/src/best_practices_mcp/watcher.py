@@ -0,0 +1,155 @@
+"""Filesystem watcher that keeps the registries up to date."""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Optional
+
+from .executor import run_blocking
+from .resources.pattern_registry import PatternRegistry
+from .resources.source_registry import SourceRegistry
+
+logger = logging.getLogger(__name__)
+
+try:
+    # Optional: watchfiles uses inotify on Linux (FSEvents/ReadDirectoryChangesW elsewhere)
+    import watchfiles
+except ImportError:
+    watchfiles = None
+
+WATCH_MODES = ("auto", "inotify", "poll", "off")
+
+
+class RegistryWatcher:
+    """Apply incremental registry updates when pattern files or SOURCES.md change.
+
+    Uses watchfiles when it is installed and falls back to polling file
+    mtimes otherwise. Bursts of edits are debounced into a single refresh.
+    """
+
+    def __init__(
+        self,
+        pattern_registry: PatternRegistry,
+        source_registry: SourceRegistry,
+        mode: str = "auto",
+        debounce: float = 0.2,
+        poll_interval: float = 2.0,
+    ):
+        if mode not in WATCH_MODES:
+            raise ValueError(f"Unknown watch mode: {mode}")
+        if mode == "inotify" and watchfiles is None:
+            raise ValueError("Watch mode 'inotify' requires the watchfiles package")
+
+        self.pattern_registry = pattern_registry
+        self.source_registry = source_registry
+        self.patterns_dir = pattern_registry.patterns_dir.resolve()
+        self.sources_file = source_registry.sources_file.resolve()
+        self.mode = mode
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def backend(self) -> Optional[str]:
+        """The watch backend in use, or None when watching is disabled."""
+        if self.mode == "off":
+            return None
+        if self.mode == "poll" or watchfiles is None:
+            return "poll"
+        return "inotify"
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> Optional[asyncio.Task]:
+        """Start watching in a background task."""
+        if self.backend is None:
+            return None
+        if not self.running:
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """Cancel the background task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run(self) -> None:
+        """Load both registries, then apply updates until cancelled."""
+        await self._apply(patterns=True, sources=True)
+        if self.backend == "inotify":
+            await self._run_watchfiles()
+        else:
+            await self._run_polling()
+
+    async def _run_watchfiles(self) -> None:
+        watch_dirs = {self.patterns_dir, self.sources_file.parent}
+        async for changes in watchfiles.awatch(
+            *[d for d in watch_dirs if d.exists()],
+            debounce=int(self.debounce * 1000),
+            recursive=False,
+        ):
+            paths = [Path(path) for _, path in changes]
+            await self._apply(
+                patterns=any(self._is_pattern_file(p) for p in paths),
+                sources=any(p == self.sources_file for p in paths),
+            )
+
+    async def _run_polling(self) -> None:
+        previous = await run_blocking(self._snapshot)
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            current = await run_blocking(self._snapshot)
+            if current == previous:
+                continue
+
+            # Wait for the burst of edits to settle before refreshing
+            while True:
+                await asyncio.sleep(self.debounce)
+                settled = await run_blocking(self._snapshot)
+                if settled == current:
+                    break
+                current = settled
+
+            changed = {
+                path for path in current.keys() | previous.keys()
+                if current.get(path) != previous.get(path)
+            }
+            previous = current
+            await self._apply(
+                patterns=any(self._is_pattern_file(p) for p in changed),
+                sources=self.sources_file in changed,
+            )
+
+    def _snapshot(self) -> dict[Path, tuple[int, int]]:
+        """Stat every watched file."""
+        snapshot = {}
+        paths = list(self.patterns_dir.glob('*.md')) + [self.sources_file]
+        for path in paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _is_pattern_file(self, path: Path) -> bool:
+        return path.parent == self.patterns_dir and path.suffix == '.md'
+
+    async def _apply(self, patterns: bool, sources: bool) -> None:
+        """Refresh the affected registries, keeping the watcher alive on errors."""
+        try:
+            if patterns:
+                delta = await self.pattern_registry.refresh()
+                if not delta.is_empty:
+                    logger.info("Pattern registry updated: %s", delta.to_dict())
+            if sources:
+                await self.source_registry.refresh()
+        except Exception:
+            logger.exception("Failed to apply registry update")
@@ -0,0 +1,14 @@
+"""Shared test helpers."""
+
+import os
+
+
+def write_file(path, text):
+    """Write text to path and move its mtime forward.
+
+    Forces a distinct mtime so change detection doesn't depend on clock
+    resolution.
+    """
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
@@ -0,0 +1,21 @@
+"""Tests for the Aho-Corasick keyword matcher."""
+
+from best_practices_mcp.tools.aho_corasick import AhoCorasick
+
+
+def test_finds_overlapping_and_nested_keywords():
+    """Keywords that overlap or end inside others are all reported."""
+    matcher = AhoCorasick(["he", "she", "his", "hers", "memory", "memory-architecture"])
+
+    assert matcher.find_all("ushers") == {"he", "she", "hers"}
+    assert matcher.find_all("see patterns/memory-architecture.md") == {"memory", "memory-architecture"}
+    assert matcher.find_all("nothing here") == {"he"}
+
+
+def test_matches_substring_semantics():
+    """Results agree with the `in` operator, including case and empty strings."""
+    keywords = ["Context Engineering", "context-engineering", "", "plan", "planning"]
+    text = "# Index\n\n- [Context engineering](patterns/context-engineering.md) for planning"
+
+    assert AhoCorasick(keywords).find_all(text) == {k for k in keywords if k in text}
+    assert AhoCorasick([]).find_all(text) == set()
@@ -0,0 +1,178 @@
+"""Tests for incremental validation with validate_changed."""
+
+import subprocess
+
+import pytest
+
+from best_practices_mcp.resources.pattern_registry import PatternRegistry
+from best_practices_mcp.resources.source_registry import SourceRegistry
+from best_practices_mcp.tools.change_set import compute_change_set
+from best_practices_mcp.tools.validate_patterns import ValidationResultCache, validate_patterns
+
+from .conftest import write_file
+
+
+SOURCES_MD = """# Sources
+
+## Primary Sources (Tier A)
+
+### Alpha Source
+
+**URL**: https://alpha.example.com
+
+### Gamma Source
+
+**URL**: https://gamma.example.com
+"""
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo, check=True, capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create a git repo where beta links to alpha and gamma cites a source."""
+    patterns = tmp_path / "patterns"
+    patterns.mkdir()
+    write_file(patterns / "alpha.md", "# Alpha\n\n**Evidence Tier**: B\n")
+    write_file(patterns / "beta.md", "# Beta\n\nSee [Alpha](./alpha.md).\n")
+    write_file(patterns / "gamma.md", "# Gamma\n\n## Sources\n\n- [Gamma](https://gamma.example.com/)\n")
+    write_file(patterns / "delta.md", "# Delta\n")
+    write_file(tmp_path / "SOURCES.md", SOURCES_MD)
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+@pytest.fixture
+def registries(repo):
+    return PatternRegistry(repo / "patterns"), SourceRegistry(repo / "SOURCES.md")
+
+
+@pytest.mark.asyncio
+async def test_changed_pattern_affects_referrers(repo, registries):
+    """Editing a pattern also affects the patterns that link to it."""
+    write_file(repo / "patterns" / "alpha.md", "# Alpha Revised\n")
+
+    change_set = await compute_change_set(*registries, repo)
+
+    assert change_set.paths == ["patterns/alpha.md"]
+    assert change_set.changed_patterns == ["alpha"]
+    assert change_set.affected == {"alpha", "beta"}
+
+
+@pytest.mark.asyncio
+async def test_removed_pattern_and_explicit_paths(repo, registries):
+    """Referrers of a deleted pattern are affected; the pattern itself is not."""
+    (repo / "patterns" / "alpha.md").unlink()
+
+    change_set = await compute_change_set(*registries, repo, changed_paths=["patterns/alpha.md"])
+
+    assert change_set.removed_patterns == ["alpha"]
+    assert change_set.affected == {"beta"}
+
+
+@pytest.mark.asyncio
+async def test_renamed_pattern_affects_referrers_of_old_path(repo, registries):
+    """A rename is a removal of the old path, so patterns linking to it are affected."""
+    pattern_registry, source_registry = registries
+    _git(repo, "mv", "patterns/alpha.md", "patterns/alpha2.md")
+    _git(repo, "commit", "-q", "-m", "rename alpha")
+    await pattern_registry.refresh()
+
+    change_set = await compute_change_set(pattern_registry, source_registry, repo, revision_range="HEAD~1..HEAD")
+
+    assert sorted(change_set.paths) == ["patterns/alpha.md", "patterns/alpha2.md"]
+    assert change_set.removed_patterns == ["alpha"]
+    assert change_set.affected == {"alpha2", "beta"}
+
+
+@pytest.mark.asyncio
+async def test_sources_change_affects_citing_patterns(repo, registries):
+    """Only patterns citing edited SOURCES.md entries are affected."""
+    write_file(repo / "SOURCES.md", SOURCES_MD.replace("https://gamma.example.com", "https://gamma.example.com\n**Evidence Tier**: B"))
+    _git(repo, "commit", "-q", "-am", "edit sources")
+
+    change_set = await compute_change_set(*registries, repo, revision_range="HEAD~1..HEAD")
+
+    assert change_set.changed_sources == ["gamma-source"]
+    assert change_set.affected == {"gamma"}
+
+
+@pytest.mark.asyncio
+async def test_bad_revision_is_reported(repo, registries):
+    result = await validate_patterns(
+        action="validate_changed",
+        pattern_id=None,
+        validation_type="structure",
+        pattern_registry=registries[0],
+        source_registry=registries[1],
+        repo_root=repo,
+        revision_range="no-such-rev",
+    )
+
+    assert "no-such-rev" in result["error"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("revision_range", ["--output=written.txt", "HEAD..--output=written.txt", "--output=written.txt...HEAD"])
+async def test_option_like_revision_is_rejected(repo, registries, revision_range):
+    """Revisions starting with "-" never reach git as options."""
+    with pytest.raises(ValueError, match="Invalid revision"):
+        await compute_change_set(*registries, repo, revision_range=revision_range)
+
+    assert not (repo / "written.txt").exists()
+
+
+@pytest.mark.asyncio
+async def test_validate_changed_sees_new_files(repo, registries):
+    """Patterns added since the registries last loaded are validated."""
+    pattern_registry, source_registry = registries
+    pattern_registry.get_all()
+    write_file(repo / "patterns" / "epsilon.md", "# Epsilon\n\nSee [Alpha](./alpha.md).\n")
+
+    result = await validate_patterns(
+        action="validate_changed",
+        pattern_id=None,
+        validation_type="structure",
+        pattern_registry=pattern_registry,
+        source_registry=source_registry,
+        repo_root=repo,
+    )
+
+    assert result["changes"]["affected"] == ["epsilon"]
+    assert [r["pattern_id"] for r in result["results"]] == ["epsilon"]
+
+
+@pytest.mark.asyncio
+async def test_validate_changed_reuses_cached_results(repo, registries):
+    """Unaffected patterns keep their cached results."""
+    pattern_registry, source_registry = registries
+    cache = ValidationResultCache()
+    kwargs = dict(
+        pattern_id=None,
+        validation_type="structure",
+        pattern_registry=pattern_registry,
+        source_registry=source_registry,
+        repo_root=repo,
+        result_cache=cache,
+    )
+    full = await validate_patterns(action="validate_all", **kwargs)
+
+    write_file(repo / "patterns" / "alpha.md", "# Alpha\n\n**Evidence Tier**: A\n")
+    await pattern_registry.refresh()
+    result = await validate_patterns(action="validate_changed", **kwargs)
+
+    assert result["changes"]["affected"] == ["alpha", "beta"]
+    assert result["changes"]["validated"] == 2
+    assert result["changes"]["reused"] == 2
+    assert [r["pattern_id"] for r in result["results"]] == ["alpha", "beta", "delta", "gamma"]
+    assert result["results"][2] is full["results"][2]
+
+    uncached = await validate_patterns(action="validate_changed", **{**kwargs, "result_cache": None})
+    assert [r["pattern_id"] for r in uncached["results"]] == ["alpha", "beta"]
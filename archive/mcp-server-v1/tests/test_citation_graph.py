@@ -0,0 +1,50 @@
+"""Tests for CitationGraph."""
+
+import pytest
+
+from best_practices_mcp.resources.pattern_registry import PatternRegistry
+
+from .conftest import write_file
+
+
+def _pattern(phase, *urls):
+    sources = "".join(f"- [Source]({url})\n" for url in urls)
+    return f"# Pattern\n\n**SDD Phase**: {phase}\n\n## Sources\n\n{sources}"
+
+
+@pytest.fixture
+def patterns_dir(tmp_path):
+    """Create patterns that cite overlapping sources."""
+    write_file(tmp_path / "alpha.md", _pattern("Plan", "https://a.example.com", "https://b.example.com"))
+    write_file(tmp_path / "beta.md", _pattern("Plan", "https://a.example.com", "https://b.example.com"))
+    write_file(tmp_path / "gamma.md", _pattern("Tasks", "https://a.example.com"))
+    return tmp_path
+
+
+def test_shared_sources(patterns_dir):
+    """Shared source counts come from the URL index."""
+    graph = PatternRegistry(patterns_dir).citation_graph
+
+    assert graph.citing("https://a.example.com") == {"alpha", "beta", "gamma"}
+    assert graph.shared_sources("alpha") == {"beta": 2, "gamma": 1}
+    assert graph.shared_sources("alpha", same_phase=True) == {"beta": 2}
+    assert graph.shared_sources("missing") == {}
+
+
+@pytest.mark.asyncio
+async def test_graph_follows_refreshes(patterns_dir):
+    """Changed and removed patterns update a copy of the graph."""
+    registry = PatternRegistry(patterns_dir)
+    old_graph = registry.citation_graph
+    old_citing = old_graph.citing("https://a.example.com")
+
+    write_file(patterns_dir / "beta.md", _pattern("Plan", "https://c.example.com"))
+    (patterns_dir / "gamma.md").unlink()
+    await registry.refresh()
+
+    graph = registry.citation_graph
+    assert graph is not old_graph
+    assert old_graph.citing("https://a.example.com") == old_citing
+    assert graph.citing("https://a.example.com") == {"alpha"}
+    assert graph.citing("https://c.example.com") == {"beta"}
+    assert graph.shared_sources("alpha") == {}
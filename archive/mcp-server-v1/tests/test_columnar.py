@@ -0,0 +1,105 @@
+"""Tests for the columnar registry export."""
+
+import json
+import os
+
+import pytest
+
+from best_practices_mcp.parsers.markdown_parser import PatternMetadata
+from best_practices_mcp.resources.columnar import RegistryTable, read_table, write_table
+from best_practices_mcp.resources.pattern_registry import PatternRegistry
+
+
+def _pattern(pattern_id, tier=None, phase=None, urls=(), related=()):
+    return PatternMetadata(
+        id=pattern_id,
+        name=pattern_id.title(),
+        file_path=f"patterns/{pattern_id}.md",
+        sources=[{"title": f"Source {url}", "url": url, "tier": "A"} for url in urls],
+        evidence_tier=tier,
+        sdd_phase=phase,
+        related_patterns=list(related),
+        sections=["Overview"],
+    )
+
+
+@pytest.fixture
+def patterns():
+    return [
+        _pattern("alpha", "A", "plan", ["https://Example.com/a/", "https://example.com/b"], ["beta"]),
+        _pattern("beta", "B", "plan", ["https://example.com/a"], ["alpha"]),
+        _pattern("gamma", None, None, [], ["alpha", "gamma"]),
+    ]
+
+
+def test_table_round_trips_patterns(patterns):
+    table = RegistryTable.from_patterns(patterns)
+
+    assert len(table) == 3
+    assert table.patterns["source_count"] == (2, 1, 0)
+    assert table.sources["pattern_id"] == ("alpha", "alpha", "beta")
+    assert table.sources["position"] == (0, 1, 0)
+    assert table.to_patterns() == patterns
+
+
+def test_aggregates(patterns):
+    table = RegistryTable.from_patterns(patterns)
+
+    assert table.value_counts("evidence_tier") == {"A": 1, "B": 1, None: 1}
+    assert table.citation_counts() == {"https://example.com/a": 2, "https://example.com/b": 1}
+    assert table.orphans() == ["gamma"]
+    with pytest.raises(ValueError, match="Unknown column"):
+        table.value_counts("missing")
+
+
+def test_json_export_round_trips(patterns, tmp_path):
+    table = RegistryTable.from_patterns(patterns)
+
+    written = write_table(table, tmp_path / "export")
+
+    assert [p.name for p in written] == ["patterns.json", "sources.json"]
+    assert read_table(tmp_path / "export") == table
+
+
+def test_read_rejects_other_versions(patterns, tmp_path):
+    write_table(RegistryTable.from_patterns(patterns), tmp_path)
+    data = json.loads((tmp_path / "sources.json").read_text())
+    data["version"] = "0"
+    (tmp_path / "sources.json").write_text(json.dumps(data))
+
+    with pytest.raises(ValueError, match="version"):
+        read_table(tmp_path)
+    with pytest.raises(ValueError, match="No registry export"):
+        read_table(tmp_path / "missing")
+
+
+def test_parquet_export_round_trips(patterns, tmp_path):
+    pytest.importorskip("pyarrow")
+    table = RegistryTable.from_patterns(patterns)
+
+    write_table(table, tmp_path, format="parquet")
+
+    assert read_table(tmp_path).to_patterns() == patterns
+
+
+def test_unknown_format(patterns, tmp_path):
+    with pytest.raises(ValueError, match="Unknown format"):
+        write_table(RegistryTable.from_patterns(patterns), tmp_path, format="csv")
+
+
+@pytest.mark.asyncio
+async def test_registry_table_follows_refreshes(tmp_path):
+    (tmp_path / "alpha.md").write_text("# Alpha\n\n**Evidence Tier**: A\n")
+    registry = PatternRegistry(tmp_path)
+    await registry.refresh()
+
+    table = registry.to_table()
+    assert registry.to_table() is table
+
+    path = tmp_path / "beta.md"
+    path.write_text("# Beta\n\n**Evidence Tier**: B\n")
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+    await registry.refresh()
+
+    assert registry.to_table().patterns["id"] == ("alpha", "beta")
+    assert table.patterns["id"] == ("alpha",)
@@ -0,0 +1,276 @@
+"""Tests for external link checking against a local stub server."""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+
+from best_practices_mcp.parsers.markdown_parser import PatternMetadata
+from best_practices_mcp.tools.link_checker import LinkChecker, LinkStatus, LinkStatusCache
+from best_practices_mcp.tools.validate_patterns import validate_patterns
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answer HEAD requests with a status derived from the path."""
+
+    def do_HEAD(self):
+        stats = self.server.stats
+        with stats["lock"]:
+            stats["requests"].append(self.path)
+            stats["active"] += 1
+            stats["max_active"] = max(stats["max_active"], stats["active"])
+        time.sleep(self.server.delay)
+        with stats["lock"]:
+            stats["active"] -= 1
+
+        if self.path.startswith("/missing"):
+            status = 404
+        elif self.path.startswith("/error"):
+            status = 500
+        else:
+            status = 200
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    server.delay = 0.0
+    server.stats = {"lock": threading.Lock(), "requests": [], "active": 0, "max_active": 0}
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    return server
+
+
+def _stop(server):
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stub_server():
+    """Run a stub HTTP server on localhost."""
+    server = _serve()
+    yield server
+    _stop(server)
+
+
+@pytest.fixture
+def other_server():
+    """Run a second stub server, which counts as a different host."""
+    server = _serve()
+    yield server
+    _stop(server)
+
+
+def _base_url(server):
+    host, port = server.server_address
+    return f"http://{host}:{port}"
+
+
+def _pattern(pattern_id, external_links):
+    return PatternMetadata(
+        id=pattern_id,
+        name=pattern_id.title(),
+        file_path=f"patterns/{pattern_id}.md",
+        external_links=external_links,
+    )
+
+
+@pytest.fixture
+def link_registry(stub_server):
+    """Registry with two patterns linking to the stub server."""
+    base = _base_url(stub_server)
+    patterns = [
+        _pattern("alpha", [f"{base}/ok/1", f"{base}/missing", f"{base}/error", f"{base}/ok/2"]),
+        _pattern("beta", [f"{base}/ok/3"]),
+    ]
+    registry = MagicMock()
+    registry.get_all.return_value = patterns
+    return registry
+
+
+@pytest.mark.asyncio
+async def test_check_links_reports_broken_links(link_registry, stub_server, tmp_path):
+    """Every external link is checked when max_links is None."""
+    result = await validate_patterns(
+        action="check_links",
+        pattern_id=None,
+        validation_type="full",
+        pattern_registry=link_registry,
+        source_registry=MagicMock(),
+        repo_root=tmp_path,
+        max_links=None,
+    )
+
+    alpha = result["results"][0]
+    assert [i["type"] for i in alpha["issues"]] == [
+        "broken_external_link", "external_link_server_error"
+    ]
+    assert result["results"][1]["status"] == "valid"
+    assert len(stub_server.stats["requests"]) == 5
+
+
+@pytest.mark.asyncio
+async def test_check_links_zero_checks_all(link_registry, stub_server, tmp_path):
+    """max_links=0 checks every external link, as None does."""
+    await validate_patterns(
+        action="check_links",
+        pattern_id=None,
+        validation_type="full",
+        pattern_registry=link_registry,
+        source_registry=MagicMock(),
+        repo_root=tmp_path,
+        max_links=0,
+    )
+
+    assert len(stub_server.stats["requests"]) == 5
+
+
+@pytest.mark.asyncio
+async def test_check_links_samples_by_default(link_registry, stub_server, tmp_path):
+    """By default only the first three external links per pattern are checked."""
+    await validate_patterns(
+        action="check_links",
+        pattern_id=None,
+        validation_type="full",
+        pattern_registry=link_registry,
+        source_registry=MagicMock(),
+        repo_root=tmp_path,
+    )
+
+    assert "/ok/2" not in stub_server.stats["requests"]
+    assert len(stub_server.stats["requests"]) == 4
+
+
+@pytest.mark.asyncio
+async def test_link_checker_limits_per_host_concurrency(stub_server):
+    """No more than per_host_limit requests hit one host at a time."""
+    stub_server.delay = 0.05
+    base = _base_url(stub_server)
+    async with LinkChecker(max_concurrency=10, per_host_limit=2) as checker:
+        statuses = await asyncio.gather(*[checker.check(f"{base}/ok/{i}") for i in range(8)])
+
+    assert all(s.status_code == 200 for s in statuses)
+    assert stub_server.stats["max_active"] <= 2
+
+
+@pytest.mark.asyncio
+async def test_slow_host_does_not_block_other_hosts(stub_server, other_server):
+    """Checks queued on one busy host leave global slots for other hosts."""
+    stub_server.delay = 0.2
+    slow, fast = _base_url(stub_server), _base_url(other_server)
+
+    async with LinkChecker(max_concurrency=4, per_host_limit=2) as checker:
+        async def timed_check(url):
+            await asyncio.sleep(0.05)
+            start = time.perf_counter()
+            status = await checker.check(url)
+            return status, time.perf_counter() - start
+
+        *slow_statuses, (status, elapsed) = await asyncio.gather(
+            *[checker.check(f"{slow}/ok/{i}") for i in range(20)], timed_check(f"{fast}/ok/1")
+        )
+
+    assert all(s.status_code == 200 for s in slow_statuses)
+    assert status.status_code == 200
+    assert elapsed < 0.15
+    assert stub_server.stats["max_active"] <= 2
+
+
+@pytest.mark.asyncio
+async def test_link_checker_reports_connection_errors():
+    """Unreachable hosts produce an error status rather than raising."""
+    async with LinkChecker(timeout=1.0) as checker:
+        status = await checker.check("http://127.0.0.1:9/unreachable")
+
+    assert status.status_code is None
+    assert status.error
+
+
+@pytest.mark.asyncio
+async def test_link_cache_dedups_and_persists(stub_server, tmp_path):
+    """Duplicate URLs share one request and a warm cache makes no requests."""
+    stub_server.delay = 0.05
+    base = _base_url(stub_server)
+    urls = [f"{base}/ok/1", f"{base}/ok/1#intro", f"{base}/ok/1#section", f"{base}/missing"]
+    cache_file = tmp_path / "link-cache.json"
+
+    async with LinkChecker(cache=LinkStatusCache(cache_file)) as checker:
+        statuses = await asyncio.gather(*[checker.check(url) for url in urls])
+
+    assert [s.status_code for s in statuses] == [200, 200, 200, 404]
+    assert [s.url for s in statuses] == urls
+    assert len(stub_server.stats["requests"]) == 2
+
+    async with LinkChecker(cache=LinkStatusCache(cache_file)) as checker:
+        await asyncio.gather(*[checker.check(url) for url in urls])
+
+    assert len(stub_server.stats["requests"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_link_cache_keeps_trailing_slash_distinct(stub_server):
+    """Only the fragment is ignored; a trailing slash can change the response."""
+    base = _base_url(stub_server)
+
+    async with LinkChecker() as checker:
+        await checker.check(f"{base}/ok/1")
+        await checker.check(f"{base}/ok/1/")
+        await checker.check(f"{base}/ok/1/#top")
+
+    assert stub_server.stats["requests"] == ["/ok/1", "/ok/1/"]
+
+
+def test_link_cache_negative_window():
+    """Error results expire after the negative TTL, successes after the TTL."""
+    cache = LinkStatusCache(ttl=100, negative_ttl=10)
+    now = time.time()
+    cache.put(LinkStatus(url="https://ok.example.com", status_code=200, checked_at=now - 50))
+    cache.put(LinkStatus(url="https://gone.example.com", status_code=404, checked_at=now - 50))
+    cache.put(LinkStatus(url="https://down.example.com", error="ConnectError", checked_at=now - 5))
+
+    assert cache.get("https://ok.example.com").status_code == 200
+    assert cache.get("https://gone.example.com") is None
+    assert cache.get("https://down.example.com").error == "ConnectError"
+
+
+@pytest.mark.asyncio
+async def test_link_memo_keys_on_cached_statuses(link_registry, stub_server, tmp_path):
+    """Link results are memoized only while every URL status is cached."""
+    from best_practices_mcp.tools.check_memo import CheckMemo
+
+    memo = CheckMemo()
+    cache = LinkStatusCache()
+    kwargs = dict(
+        action="check_links",
+        pattern_id=None,
+        validation_type="links",
+        pattern_registry=link_registry,
+        source_registry=MagicMock(),
+        repo_root=tmp_path,
+        link_cache=cache,
+        memo=memo,
+    )
+
+    first = await validate_patterns(**kwargs)
+    second = await validate_patterns(**kwargs)
+
+    assert first["summary"]["cache"]["by_check"]["links"] == {"hits": 0, "misses": 2}
+    assert second["summary"]["cache"]["by_check"]["links"] == {"hits": 2, "misses": 0}
+    assert second["results"] == first["results"]
+    assert len(stub_server.stats["requests"]) == 4
+
+    # Expired statuses make the memo miss and those URLs are fetched again
+    cache.ttl = 0
+    third = await validate_patterns(**kwargs)
+    assert third["summary"]["cache"]["by_check"]["links"]["misses"] == 2
+    assert sorted(stub_server.stats["requests"][4:]) == ["/ok/1", "/ok/3"]
@@ -0,0 +1,147 @@
+"""Tests for MarkdownParser."""
+
+import pytest
+
+from best_practices_mcp.parsers.markdown_parser import MarkdownParser, SourceRef
+
+
+PATTERN_MD = """# Context Engineering
+
+**Source**: [Anthropic Engineering](https://www.anthropic.com/engineering/context)
+**Evidence Tier**: A
+
+**SDD Phase**: Plan
+
+## Overview
+
+See [Memory](./memory-architecture.md) and `[not a link](./ignored.md)`.
+
+```markdown
+# Not A Title
+## Not A Section
+[Fenced](https://fenced.example.com)
+```
+
+## Implementation
+
+**Tier B Sources**:
+
+- [Practitioner Post](https://blog.example.com/post)
+- Jane Doe: Conference talk
+
+## Sources
+
+- [Anthropic Engineering](https://www.anthropic.com/engineering/context) (Evidence Tier A)
+- Internal production notes
+
+## Further Reading
+
+- [Deep Dive](https://deep.example.com/dive)
+- [Related](../analysis/harness-engineering.md)
+"""
+
+
+@pytest.fixture
+def parser(tmp_path):
+    """Create a parser over a temporary patterns directory."""
+    patterns_dir = tmp_path / "patterns"
+    patterns_dir.mkdir()
+    return MarkdownParser(patterns_dir)
+
+
+def _parse(parser, text, name="context-engineering.md"):
+    path = parser.patterns_dir / name
+    path.write_text(text)
+    return parser.parse_file(path)
+
+
+def test_parse_metadata(parser):
+    """Title, markers, sections and links are extracted outside code fences."""
+    pattern = _parse(parser, PATTERN_MD)
+
+    assert pattern.id == "context-engineering"
+    assert pattern.name == "Context Engineering"
+    assert pattern.file_path == "patterns/context-engineering.md"
+    assert pattern.evidence_tier == "A"
+    assert pattern.sdd_phase == "plan"
+    assert pattern.sections == ("Overview", "Implementation", "Sources", "Further Reading")
+    assert pattern.related_patterns == ("memory-architecture", "harness-engineering")
+    assert "https://fenced.example.com" not in pattern.external_links
+    assert "./ignored.md" not in pattern.internal_links
+    assert "./memory-architecture.md" in pattern.internal_links
+
+
+def test_parse_sources_in_priority_order(parser):
+    """Source formats are merged in order with duplicate URLs dropped."""
+    pattern = _parse(parser, PATTERN_MD)
+
+    assert pattern.sources == (
+        SourceRef("Anthropic Engineering", "https://www.anthropic.com/engineering/context", "A"),
+        SourceRef("Internal production notes", None, None),
+        SourceRef("Practitioner Post", "https://blog.example.com/post", "B"),
+        SourceRef("Jane Doe: Conference talk", None, "B"),
+        SourceRef("Deep Dive", "https://deep.example.com/dive", None),
+    )
+
+
+def test_header_source_fallback(parser):
+    """A plain **Source** header is used only when nothing else is found."""
+    pattern = _parse(parser, "# Minimal\n\n**Source**: Production experience\n", "minimal.md")
+
+    assert pattern.sources == (SourceRef("Production experience"),)
+    assert pattern.evidence_tier is None
+
+
+def test_parse_text_matches_parse_file(parser):
+    """Parsing in-memory content gives the same result as reading the file."""
+    path = parser.patterns_dir / "context-engineering.md"
+    path.write_text(PATTERN_MD)
+
+    assert parser.parse_text(path, PATTERN_MD.replace("\n", "\r\n")) == parser.parse_file(path)
+
+
+def test_parallel_parse_matches_serial_order(tmp_path):
+    """Parsing in worker processes returns the same results, in file order."""
+    for i, size in enumerate([1, 40, 3, 25, 2, 60, 8]):
+        (tmp_path / f"pattern-{i}.md").write_text(
+            f"# Pattern {i}\n\n**Evidence Tier**: B\n\n## Overview\n\n" + "Body text.\n" * size * 50,
+            encoding='utf-8',
+        )
+
+    serial = MarkdownParser(tmp_path).parse_all()
+    parallel = MarkdownParser(tmp_path, workers=2, parallel_threshold=0).parse_all()
+
+    assert [p.id for p in parallel] == [f"pattern-{i}" for i in range(7)]
+    assert [p.to_dict() for p in parallel] == [p.to_dict() for p in serial]
+
+    items = [(p, p.read_text(encoding='utf-8')) for p in reversed(sorted(tmp_path.glob('*.md')))]
+    texts = MarkdownParser(tmp_path, workers=2, parallel_threshold=0).parse_texts(items)
+    assert [p.id for p in texts] == [path.stem for path, _ in items]
+
+
+def test_chunk_by_size_balances_totals():
+    from best_practices_mcp.parsers.markdown_parser import _chunk_by_size
+
+    sizes = [100, 1, 1, 1, 50, 50]
+    chunks = _chunk_by_size(sizes, 2)
+
+    assert sorted(i for chunk in chunks for i in chunk) == list(range(6))
+    assert sorted(sum(sizes[i] for i in chunk) for chunk in chunks) == [101, 102]
+
+
+def test_metadata_is_immutable_and_round_trips():
+    import dataclasses
+    from best_practices_mcp.parsers.markdown_parser import PatternMetadata
+
+    pattern = PatternMetadata(
+        id="p", name="P", file_path="patterns/p.md",
+        sources=[{"title": "Post", "url": "https://example.com/" + "post", "tier": "A"}],
+        related_patterns=["other"],
+    )
+
+    assert pattern.sources == (SourceRef("Post", "https://example.com/post", "A"),)
+    assert pattern.related_patterns == ("other",)
+    assert pattern.sources[0].url is SourceRef("Other", "https://example.com/post").url
+    assert PatternMetadata.from_dict(pattern.to_dict()) == pattern
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        pattern.sections = ()
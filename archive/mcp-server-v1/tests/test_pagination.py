@@ -0,0 +1,71 @@
+"""Tests for paged registry views."""
+
+import json
+
+import pytest
+
+from best_practices_mcp.resources.pagination import (
+    decode_cursor,
+    encode_cursor,
+    parse_fields,
+    render_page,
+)
+from best_practices_mcp.resources.pattern_registry import PatternRegistry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """Create a registry with patterns across tiers and phases."""
+    patterns = {
+        "alpha": ("A", "Plan"),
+        "beta": ("A", "Tasks"),
+        "gamma": ("B", "Plan"),
+        "delta": ("A", "Plan"),
+    }
+    for name, (tier, phase) in patterns.items():
+        (tmp_path / f"{name}.md").write_text(
+            f"# {name.title()}\n\n**Evidence Tier**: {tier}\n\n**SDD Phase**: {phase}\n"
+        )
+    return PatternRegistry(tmp_path)
+
+
+def test_query_uses_filters(registry):
+    """Tier and phase filters combine."""
+    assert [p.id for p in registry.query(tier="a")] == ["alpha", "beta", "delta"]
+    assert [p.id for p in registry.query(phase="PLAN")] == ["alpha", "delta", "gamma"]
+    assert [p.id for p in registry.query(tier="A", phase="plan")] == ["alpha", "delta"]
+    assert len(registry.query()) == 4
+
+
+def test_pages_follow_cursor(registry):
+    """Pages cover every item once and only include requested fields."""
+    items = registry.query()
+    seen = []
+    cursor = None
+    while True:
+        page = json.loads(render_page(items, "etag1", cursor=cursor, limit=3, fields=["id", "name"]))
+        assert page["total"] == 4
+        assert all(set(item) == {"id", "name"} for item in page["items"])
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == ["alpha", "beta", "delta", "gamma"]
+
+
+def test_cursor_is_bound_to_etag():
+    """A cursor from an older registry version is rejected."""
+    cursor = encode_cursor(10, "etag1")
+    assert decode_cursor(cursor, "etag1") == 10
+    with pytest.raises(ValueError, match="Registry changed"):
+        decode_cursor(cursor, "etag2")
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor("not-a-cursor", "etag1")
+
+
+def test_parse_fields_rejects_unknown():
+    assert parse_fields("id, name", ("id", "name")) == ["id", "name"]
+    assert parse_fields(None, ("id",)) is None
+    with pytest.raises(ValueError, match="Unknown fields: bogus"):
+        parse_fields("id,bogus", ("id", "name"))
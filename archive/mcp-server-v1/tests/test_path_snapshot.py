@@ -0,0 +1,42 @@
+"""Tests for the per-run path snapshot."""
+
+from unittest.mock import patch
+
+from best_practices_mcp.tools.path_snapshot import PathSnapshot
+
+
+def test_exists_answers_from_one_listing(tmp_path):
+    (tmp_path / "a.md").write_text("a")
+    (tmp_path / "b.md").write_text("b")
+    paths = PathSnapshot()
+
+    with patch("best_practices_mcp.tools.path_snapshot.os.scandir", wraps=__import__("os").scandir) as scandir:
+        assert paths.exists(tmp_path / "a.md")
+        assert paths.exists(tmp_path / "b.md")
+        assert not paths.exists(tmp_path / "c.md")
+
+    assert scandir.call_count == 1
+
+
+def test_missing_directory(tmp_path):
+    paths = PathSnapshot()
+    assert not paths.exists(tmp_path / "missing" / "a.md")
+
+
+def test_resolve_is_memoized(tmp_path):
+    (tmp_path / "patterns").mkdir()
+    paths = PathSnapshot()
+
+    first = paths.resolve(tmp_path / "patterns", "../SOURCES.md")
+    second = paths.resolve(tmp_path / "patterns", "../SOURCES.md")
+
+    assert first == (tmp_path / "SOURCES.md").resolve()
+    assert first is second
+
+
+def test_snapshot_is_fixed_once_listed(tmp_path):
+    paths = PathSnapshot()
+    assert not paths.exists(tmp_path / "late.md")
+    (tmp_path / "late.md").write_text("x")
+    assert not paths.exists(tmp_path / "late.md")
+    assert PathSnapshot().exists(tmp_path / "late.md")
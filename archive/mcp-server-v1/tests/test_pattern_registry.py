@@ -0,0 +1,197 @@
+"""Tests for PatternRegistry."""
+
+import pytest
+
+from best_practices_mcp.parsers.parse_cache import ParseCache
+from best_practices_mcp.resources.pattern_registry import PatternRegistry
+
+from .conftest import write_file
+
+
+@pytest.fixture
+def patterns_dir(tmp_path):
+    """Create a patterns directory with two patterns."""
+    patterns = tmp_path / "patterns"
+    patterns.mkdir()
+    write_file(patterns / "alpha.md", "# Alpha\n\n**Evidence Tier**: A\n")
+    write_file(patterns / "beta.md", "# Beta\n\n**Evidence Tier**: B\n")
+    return patterns
+
+
+@pytest.mark.asyncio
+async def test_initial_refresh_adds_all(patterns_dir):
+    """First refresh reports every pattern as added."""
+    registry = PatternRegistry(patterns_dir)
+    delta = await registry.refresh()
+
+    assert [p.id for p in delta.added] == ["alpha", "beta"]
+    assert not delta.changed and not delta.removed
+    assert [p.id for p in registry.get_all()] == ["alpha", "beta"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_reports_changes(patterns_dir):
+    """Refresh reparses only added, modified and deleted files."""
+    registry = PatternRegistry(patterns_dir)
+    registry.get_all()
+
+    write_file(patterns_dir / "alpha.md", "# Alpha Revised\n\n**Evidence Tier**: C\n")
+    write_file(patterns_dir / "gamma.md", "# Gamma\n")
+    (patterns_dir / "beta.md").unlink()
+
+    delta = await registry.refresh()
+
+    assert [p.id for p in delta.added] == ["gamma"]
+    assert [p.name for p in delta.changed] == ["Alpha Revised"]
+    assert delta.removed == ["beta"]
+    assert [p.id for p in registry.get_all()] == ["alpha", "gamma"]
+    assert registry.get_by_id("alpha").evidence_tier == "C"
+
+
+@pytest.mark.asyncio
+async def test_touch_without_edit_is_not_a_change(patterns_dir):
+    """A new mtime with identical content does not reparse the file."""
+    registry = PatternRegistry(patterns_dir)
+    registry.get_all()
+    original = registry.get_by_id("alpha")
+
+    write_file(patterns_dir / "alpha.md", (patterns_dir / "alpha.md").read_text())
+    delta = await registry.refresh()
+
+    assert delta.is_empty
+    assert registry.get_by_id("alpha") is original
+
+
+@pytest.mark.asyncio
+async def test_indexes_follow_refresh(patterns_dir):
+    """Id, tier and phase lookups reflect the latest refresh."""
+    registry = PatternRegistry(patterns_dir)
+    assert [p.id for p in registry.get_by_tier("a")] == ["alpha"]
+
+    write_file(patterns_dir / "beta.md", "# Beta\n\n**Evidence Tier**: A\n**SDD Phase**: Plan\n")
+    await registry.refresh()
+
+    assert [p.id for p in registry.get_by_tier("A")] == ["alpha", "beta"]
+    assert [p.id for p in registry.get_by_phase("plan")] == ["beta"]
+    assert registry.get_by_id("beta").sdd_phase == "plan"
+    assert registry.get_by_id("missing") is None
+
+
+def test_parse_cache_skips_unchanged_files(patterns_dir, tmp_path, monkeypatch):
+    """A second registry over a warm cache only parses modified files."""
+    cache = ParseCache(tmp_path / "cache" / "parse-cache.sqlite3")
+    warm = PatternRegistry(patterns_dir, cache=cache)
+    expected = [p.to_dict() for p in warm.get_all()]
+
+    write_file(patterns_dir / "beta.md", "# Beta Revised\n")
+    cold = PatternRegistry(patterns_dir, cache=cache)
+    parsed = []
+    original = cold.parser.parse_texts
+    monkeypatch.setattr(
+        cold.parser, "parse_texts",
+        lambda items: parsed.extend(path.stem for path, _ in items) or original(items),
+    )
+
+    patterns = cold.get_all()
+
+    assert parsed == ["beta"]
+    assert patterns[0].to_dict() == expected[0]
+    assert patterns[1].name == "Beta Revised"
+
+
+@pytest.mark.asyncio
+async def test_refresh_publishes_new_snapshot(patterns_dir):
+    """A refresh replaces the snapshot and leaves earlier ones untouched."""
+    registry = PatternRegistry(patterns_dir)
+    before = registry.snapshot
+
+    write_file(patterns_dir / "gamma.md", "# Gamma\n\n**Evidence Tier**: A\n")
+    await registry.refresh()
+    after = registry.snapshot
+
+    assert after is not before and after.generation == before.generation + 1
+    assert [p.id for p in before.patterns] == ["alpha", "beta"]
+    assert [p.id for p in before.by_tier["A"]] == ["alpha"]
+    assert [p.id for p in after.by_tier["A"]] == ["alpha", "gamma"]
+
+
+def test_concurrent_refreshes_coalesce(patterns_dir):
+    """Refreshes requested during a scan share one follow-up scan; reads never wait."""
+    import threading
+    import time
+
+    registry = PatternRegistry(patterns_dir)
+    registry.get_all()
+    scanning = threading.Event()
+    release = threading.Event()
+    scans = []
+    original = registry._sync_locked
+
+    def blocking_scan():
+        scans.append(threading.get_ident())
+        if len(scans) == 1:
+            scanning.set()
+            release.wait(5)
+        return original()
+
+    registry._sync_locked = blocking_scan
+    first = threading.Thread(target=registry._sync)
+    first.start()
+    assert scanning.wait(5)
+
+    write_file(patterns_dir / "gamma.md", "# Gamma\n")
+    waiters = [threading.Thread(target=registry._sync) for _ in range(4)]
+    for thread in waiters:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while registry._requested < 6 and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+    # The scan holds the refresh lock, but readers use the published snapshot
+    assert [p.id for p in registry.get_all()] == ["alpha", "beta"]
+
+    release.set()
+    for thread in [first] + waiters:
+        thread.join(5)
+
+    assert len(scans) == 2
+    assert [p.id for p in registry.get_all()] == ["alpha", "beta", "gamma"]
+
+
+@pytest.mark.asyncio
+async def test_undecodable_file_is_retried_and_can_be_deleted(patterns_dir):
+    """A file that fails to decode is skipped until fixed, and deleting it is harmless."""
+    registry = PatternRegistry(patterns_dir)
+    bad = patterns_dir / "gamma.md"
+    bad.write_bytes(b"# Gamma\n\n\xff\xfe\n")
+    await registry.refresh()
+    assert registry.get_by_id("gamma") is None
+
+    write_file(bad, "# Gamma\n")
+    delta = await registry.refresh()
+    assert [p.id for p in delta.added] == ["gamma"]
+
+    bad.write_bytes(b"# Gamma\n\n\xff\xfe\n")
+    await registry.refresh()
+    bad.unlink()
+    delta = await registry.refresh()
+    assert delta.removed == ["gamma"]
+    assert [p.id for p in registry.get_all()] == ["alpha", "beta"]
+
+
+@pytest.mark.asyncio
+async def test_failed_parse_is_retried(patterns_dir, monkeypatch):
+    """Files are not marked as seen when parsing them fails."""
+    registry = PatternRegistry(patterns_dir)
+    parse_texts = registry.parser.parse_texts
+
+    def failing(items):
+        raise RuntimeError("parser bug")
+
+    monkeypatch.setattr(registry.parser, "parse_texts", failing)
+    with pytest.raises(RuntimeError):
+        await registry.refresh()
+
+    monkeypatch.setattr(registry.parser, "parse_texts", parse_texts)
+    delta = await registry.refresh()
+    assert [p.id for p in delta.added] == ["alpha", "beta"]
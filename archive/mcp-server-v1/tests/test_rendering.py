@@ -0,0 +1,77 @@
+"""Tests for ResourceRenderer."""
+
+import json
+
+import pytest
+
+from best_practices_mcp.resources.pattern_registry import PatternRegistry
+from best_practices_mcp.resources.rendering import ResourceRenderer
+
+from .conftest import write_file
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """Create a pattern registry over one pattern."""
+    write_file(tmp_path / "alpha.md", "# Alpha\n\n**Evidence Tier**: A\n")
+    return PatternRegistry(tmp_path)
+
+
+def test_render_is_cached_per_generation(registry, monkeypatch):
+    """Unchanged registries are serialized once."""
+    renderer = ResourceRenderer(registry)
+    calls = []
+    original = registry.to_dict
+    monkeypatch.setattr(registry, "to_dict", lambda: calls.append(1) or original())
+
+    first = renderer.render()
+    assert renderer.render() is first
+    assert len(calls) == 1
+    assert json.loads(first.text)["etag"] == first.etag
+    assert json.loads(first.text)["total_patterns"] == 1
+
+
+def test_compact_shares_etag(registry):
+    """Compact output has no indentation but the same content and etag."""
+    renderer = ResourceRenderer(registry)
+    indented = renderer.render()
+    compact = renderer.render(compact=True)
+
+    assert "\n" not in compact.text
+    assert compact.etag == indented.etag
+    assert json.loads(compact.text) == json.loads(indented.text)
+
+
+@pytest.mark.asyncio
+async def test_etag_changes_with_content(registry, tmp_path):
+    """Edits produce a new etag; touching a file does not."""
+    renderer = ResourceRenderer(registry)
+    etag = renderer.render().etag
+
+    write_file(tmp_path / "alpha.md", "# Alpha\n\n**Evidence Tier**: A\n")
+    await registry.refresh()
+    assert renderer.etag == etag
+
+    write_file(tmp_path / "beta.md", "# Beta\n")
+    await registry.refresh()
+    assert renderer.etag != etag
+    assert json.loads(renderer.render().text)["total_patterns"] == 2
+
+
+@pytest.mark.asyncio
+async def test_etag_does_not_render(registry, tmp_path, monkeypatch):
+    """Checking the etag after a change never serializes the registry."""
+    renderer = ResourceRenderer(registry)
+    etag = renderer.etag
+    monkeypatch.setattr(registry, "to_dict", lambda: pytest.fail("etag rendered the registry"))
+
+    write_file(tmp_path / "beta.md", "# Beta\n")
+    await registry.refresh()
+
+    assert renderer.etag != etag
+    assert renderer.etag == renderer.etag
+
+
+def test_etag_differs_between_renderers(registry):
+    """A restarted server does not accept etags issued by the previous one."""
+    assert ResourceRenderer(registry).etag != ResourceRenderer(registry).etag
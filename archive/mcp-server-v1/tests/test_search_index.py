@@ -0,0 +1,131 @@
+"""Tests for the BM25 search index."""
+
+import math
+import random
+import threading
+from collections import Counter
+
+import pytest
+
+from best_practices_mcp.resources.pattern_registry import PatternRegistry
+from best_practices_mcp.resources.search_index import SearchIndex, tokenize
+
+from .conftest import write_file
+
+
+def test_tokenize_drops_stopwords_and_case():
+    assert tokenize("The Context-Window of an Agent") == ["context", "window", "agent"]
+
+
+def test_title_and_sections_outrank_body():
+    index = SearchIndex()
+    index.add("body", "Other", ["Overview"], "# Other\n\nMentions memory once among many other words here.\n")
+    index.add("title", "Memory", ["Overview"], "# Memory\n\nSome text about other things entirely here.\n")
+
+    assert [hit.doc_id for hit in index.search("memory")] == ["title", "body"]
+    assert index.search("the of and") == []
+    assert index.search("absent") == []
+
+
+def test_replace_and_remove():
+    index = SearchIndex()
+    index.add("a", "A", [], "# A\n\nalpha text\n")
+    index.add("a", "A", [], "# A\n\nbeta text\n")
+
+    assert index.search("alpha") == []
+    assert [hit.doc_id for hit in index.search("beta")] == ["a"]
+
+    index.remove("a")
+    assert len(index) == 0 and index.search("beta") == []
+
+
+def test_snippet_surrounds_first_match():
+    index = SearchIndex()
+    body = "# Title\n\n" + "filler " * 60 + "the **needle** is here. " + "tail " * 60
+    index.add("doc", "Title", [], body)
+
+    snippet = index.search("needle")[0].snippet
+    assert snippet.startswith("…") and snippet.endswith("…")
+    assert "needle is here." in snippet
+
+
+def test_top_k_matches_exhaustive_bm25():
+    rng = random.Random(3)
+    words = [f"w{i}" for i in range(60)]
+    index = SearchIndex()
+    docs = {}
+    for i in range(300):
+        body = " ".join(rng.choices(words, weights=[1 / (r + 1) for r in range(60)], k=rng.randint(5, 80)))
+        docs[f"d{i:03d}"] = body
+        index.add(f"d{i:03d}", "", [], "\n" + body)
+
+    counts = {doc_id: Counter(body.split()) for doc_id, body in docs.items()}
+    lengths = {doc_id: sum(terms.values()) for doc_id, terms in counts.items()}
+    average = sum(lengths.values()) / len(lengths)
+
+    def bm25(doc_id, terms):
+        score = 0.0
+        for term in terms:
+            frequency = counts[doc_id][term]
+            if not frequency:
+                continue
+            df = sum(1 for doc_terms in counts.values() if term in doc_terms)
+            idf = math.log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+            norm = 1.2 * (1 - 0.75 + 0.75 * lengths[doc_id] / average)
+            score += idf * frequency * 2.2 / (frequency + norm)
+        return score
+
+    for _ in range(20):
+        terms = rng.sample(words, rng.randint(1, 3))
+        expected = sorted((bm25(doc_id, terms) for doc_id in docs), reverse=True)
+        hits = index.search(" ".join(terms), top_k=5)
+        # Which of several tied documents makes the cut is unspecified
+        assert [hit.score for hit in hits] == pytest.approx([s for s in expected if s > 0][:5], abs=1e-4)
+        assert [hit.score for hit in hits] == pytest.approx([bm25(hit.doc_id, terms) for hit in hits], abs=1e-4)
+
+
+@pytest.mark.asyncio
+async def test_registry_index_follows_refreshes(tmp_path):
+    write_file(tmp_path / "alpha.md", "# Alpha\n\n## Overview\n\nRetrieval augmented generation.\n")
+    write_file(tmp_path / "beta.md", "# Beta\n\n## Overview\n\nTool design.\n")
+    registry = PatternRegistry(tmp_path)
+
+    assert [(p.id, hit.doc_id) for p, hit in registry.search("retrieval")] == [("alpha", "alpha")]
+
+    write_file(tmp_path / "beta.md", "# Beta\n\n## Overview\n\nRetrieval for tools.\n")
+    (tmp_path / "alpha.md").unlink()
+    await registry.refresh()
+
+    assert [p.id for p, _ in registry.search("retrieval")] == ["beta"]
+
+
+@pytest.mark.asyncio
+async def test_search_during_refresh_sees_one_version(tmp_path, monkeypatch):
+    """A search racing a refresh gets a full top_k from a single version."""
+    for name in "abcde":
+        write_file(tmp_path / f"{name}.md", f"# {name.upper()}\n\n## Overview\n\nRetrieval notes {name}.\n")
+    registry = PatternRegistry(tmp_path)
+    registry.search("retrieval")
+
+    for name in "abc":
+        (tmp_path / f"{name}.md").unlink()
+    for name in "fg":
+        write_file(tmp_path / f"{name}.md", f"# {name.upper()}\n\n## Overview\n\nRetrieval retrieval {name}.\n")
+
+    results = []
+    searcher = threading.Thread(target=lambda: results.append(registry.search("retrieval", top_k=4)))
+    original = registry._publish
+
+    def publish(delta):
+        # Search while the refresh is between updating its state and publishing
+        searcher.start()
+        searcher.join(0.2)
+        original(delta)
+
+    monkeypatch.setattr(registry, "_publish", publish)
+    await registry.refresh()
+    searcher.join()
+
+    hits = results[0]
+    assert sorted(p.id for p, _ in hits) == ["d", "e", "f", "g"]
+    assert all(p.id == hit.doc_id for p, hit in hits)
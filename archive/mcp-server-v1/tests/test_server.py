@@ -0,0 +1,279 @@
+"""Tests for the MCP server over an in-memory client session."""
+
+import asyncio
+import json
+import subprocess
+import sys
+
+import pytest
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from best_practices_mcp import server as server_module
+from best_practices_mcp.resources.pattern_registry import PatternRegistry
+from best_practices_mcp.resources.source_registry import SourceRegistry
+from best_practices_mcp.tools.check_memo import CheckMemo
+from best_practices_mcp.tools.validate_patterns import ValidationResultCache
+
+
+@pytest.fixture
+def configured_server(tmp_path, monkeypatch):
+    """Point the server at a small pattern tree."""
+    patterns = tmp_path / "patterns"
+    patterns.mkdir()
+    for name in ("alpha", "beta", "gamma"):
+        (patterns / f"{name}.md").write_text(f"# {name.title()}\n\n**Evidence Tier**: A\n")
+    monkeypatch.setattr(server_module, "REPO_ROOT", tmp_path)
+    monkeypatch.setattr(server_module, "pattern_registry", PatternRegistry(patterns))
+    monkeypatch.setattr(server_module, "source_registry", SourceRegistry(tmp_path / "SOURCES.md"))
+    monkeypatch.setattr(server_module, "result_cache", ValidationResultCache())
+    monkeypatch.setattr(server_module, "check_memo", CheckMemo())
+    _reset_lazy_state(monkeypatch)
+    return server_module.server
+
+
+def _reset_lazy_state(monkeypatch, warm_up=False):
+    """Let each test build its own watcher, link cache and renderers."""
+    monkeypatch.setattr(server_module, "link_cache", None)
+    monkeypatch.setattr(server_module, "watcher", None)
+    monkeypatch.setattr(server_module, "renderers", {})
+    monkeypatch.setattr(server_module, "WARM_UP", warm_up)
+    monkeypatch.setattr(server_module, "_warm_up_task", None)
+
+
+@pytest.mark.asyncio
+async def test_validate_all_reports_progress(configured_server):
+    """Each validated pattern produces a progress notification."""
+    progress = []
+
+    async def on_progress(value, total, message):
+        progress.append((value, total, message))
+
+    async with create_connected_server_and_client_session(configured_server) as client:
+        result = await client.call_tool(
+            "validate_patterns",
+            {"action": "validate_all", "validation_type": "structure"},
+            progress_callback=on_progress,
+        )
+
+    assert [(value, total) for value, total, _ in progress] == [(1, 3), (2, 3), (3, 3)]
+    assert sorted(message.split(":")[0] for _, _, message in progress) == ["alpha", "beta", "gamma"]
+    assert json.loads(result.content[0].text)["patterns_checked"] == 3
+
+
+@pytest.mark.asyncio
+async def test_validate_all_chunked_results(configured_server):
+    """chunk_size splits results into separate content blocks."""
+    async with create_connected_server_and_client_session(configured_server) as client:
+        result = await client.call_tool(
+            "validate_patterns",
+            {"action": "validate_all", "validation_type": "structure", "chunk_size": 2},
+        )
+
+    header, *chunks = [json.loads(block.text) for block in result.content]
+    assert header["results"] == [] and header["result_chunks"] == 2
+    assert header["summary"]["needs_update"] == 3
+    assert [[r["pattern_id"] for r in chunk["results"]] for chunk in chunks] == [["alpha", "beta"], ["gamma"]]
+
+
+@pytest.mark.asyncio
+async def test_validate_batch_chunked_by_pattern(configured_server):
+    """Batch results stay keyed by pattern when chunked."""
+    async with create_connected_server_and_client_session(configured_server) as client:
+        result = await client.call_tool(
+            "validate_patterns",
+            {
+                "action": "validate_single",
+                "pattern_ids": ["gamma", "a*"],
+                "validation_type": "structure",
+                "chunk_size": 1,
+            },
+        )
+
+    header, *chunks = [json.loads(block.text) for block in result.content]
+    assert header["results"] == {} and header["not_found"] == []
+    assert [list(chunk["results"]) for chunk in chunks] == [["gamma"], ["alpha"]]
+
+
+def test_import_defers_tool_modules():
+    """Importing the server does not import the tools, registries or watcher."""
+    code = (
+        "import sys, best_practices_mcp.server\n"
+        "loaded = [m for m in sys.modules if m.startswith(('best_practices_mcp.tools', "
+        "'best_practices_mcp.resources', 'best_practices_mcp.parsers', 'best_practices_mcp.watcher'))]\n"
+        "print(loaded)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == "[]"
+
+
+def test_default_max_links_matches_link_checker():
+    """The server's max_links default mirrors the link checker's."""
+    from best_practices_mcp.tools.link_checker import DEFAULT_MAX_LINKS
+
+    assert server_module.DEFAULT_MAX_LINKS == DEFAULT_MAX_LINKS
+
+
+def test_search_limits_match_tool():
+    """The advertised top_k default and maximum mirror the search tool's."""
+    from best_practices_mcp.tools.search_patterns import DEFAULT_TOP_K, MAX_TOP_K
+
+    assert (server_module.DEFAULT_TOP_K, server_module.MAX_TOP_K) == (DEFAULT_TOP_K, MAX_TOP_K)
+
+
+@pytest.mark.asyncio
+async def test_handshake_and_list_tools_do_not_load(tmp_path, monkeypatch):
+    """Registries are built on the first tool call, not during the handshake."""
+    (tmp_path / "patterns").mkdir()
+    (tmp_path / "patterns" / "alpha.md").write_text("# Alpha\n")
+    monkeypatch.setattr(server_module, "PATTERNS_DIR", tmp_path / "patterns")
+    monkeypatch.setattr(server_module, "SOURCES_FILE", tmp_path / "SOURCES.md")
+    for name in ("pattern_registry", "source_registry", "result_cache", "check_memo"):
+        monkeypatch.setattr(server_module, name, None)
+    _reset_lazy_state(monkeypatch)
+
+    async with create_connected_server_and_client_session(server_module.server) as client:
+        tools = await client.list_tools()
+        assert {tool.name for tool in tools.tools} == {"validate_patterns", "sync_documentation", "search_patterns"}
+        assert server_module.pattern_registry is None
+
+        result = await client.call_tool(
+            "validate_patterns", {"action": "validate_all", "validation_type": "structure"}
+        )
+        assert json.loads(result.content[0].text)["patterns_checked"] == 1
+        assert server_module.pattern_registry is not None
+
+
+@pytest.mark.asyncio
+async def test_warm_up_after_initialized(configured_server, monkeypatch):
+    """With warm-up enabled the registries are parsed after the handshake."""
+    monkeypatch.setattr(server_module, "WARM_UP", True)
+
+    async with create_connected_server_and_client_session(configured_server):
+        for _ in range(100):
+            if server_module._warm_up_task is not None:
+                break
+            await asyncio.sleep(0.01)
+        await server_module._warm_up_task
+
+    assert server_module.watcher is not None
+    assert server_module.pattern_registry._snapshot is not None
+    assert server_module.source_registry._loaded
+
+
+# Keep in step with DEFAULT_BUDGETS in benchmarks/bench_tools_list.py
+TOOLS_LIST_BUDGETS = {"full": 2900, "compact": 1800}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["full", "compact"])
+async def test_tools_list_within_budget(monkeypatch, mode):
+    """The tools/list payload stays under its size budget."""
+    monkeypatch.setattr(server_module, "TOOL_SCHEMA", mode)
+    _reset_lazy_state(monkeypatch)
+
+    async with create_connected_server_and_client_session(server_module.server) as client:
+        tools = (await client.list_tools()).tools
+
+    payload = json.dumps([tool.model_dump(mode="json", exclude_none=True, by_alias=True) for tool in tools])
+    assert len(payload) <= TOOLS_LIST_BUDGETS[mode]
+    assert ("describe_tool" in {tool.name for tool in tools}) == (mode == "compact")
+
+
+@pytest.mark.asyncio
+async def test_compact_schema_and_describe_tool(monkeypatch):
+    """Compact mode drops parameter docs, which describe_tool serves in full."""
+    monkeypatch.setattr(server_module, "TOOL_SCHEMA", "compact")
+    _reset_lazy_state(monkeypatch)
+
+    async with create_connected_server_and_client_session(server_module.server) as client:
+        tools = {tool.name: tool for tool in (await client.list_tools()).tools}
+        described = await client.call_tool("describe_tool", {"name": "validate_patterns"})
+        unknown = await client.call_tool("describe_tool", {"name": "nope"})
+
+    compact_action = tools["validate_patterns"].inputSchema["properties"]["action"]
+    assert "description" not in compact_action and "validate_all" in compact_action["enum"]
+    full = json.loads(described.content[0].text)
+    assert full["inputSchema"]["properties"]["action"]["description"] == "Validation action to perform"
+    assert "error" in json.loads(unknown.content[0].text)
+
+
+@pytest.mark.asyncio
+async def test_search_patterns(configured_server, tmp_path):
+    """search_patterns returns ranked hits with snippets and honours top_k."""
+    (tmp_path / "patterns" / "beta.md").write_text(
+        "# Beta\n\n## Overview\n\nCompaction keeps the context window small.\n"
+    )
+    async with create_connected_server_and_client_session(configured_server) as client:
+        result = await client.call_tool("search_patterns", {"query": "context compaction", "top_k": 1})
+        empty = await client.call_tool("search_patterns", {"query": "  "})
+
+    hits = json.loads(result.content[0].text)["results"]
+    assert [hit["pattern_id"] for hit in hits] == ["beta"]
+    assert "Compaction keeps the context window small." in hits[0]["snippet"]
+    assert "error" in json.loads(empty.content[0].text)
+
+
+@pytest.mark.asyncio
+async def test_invalid_arguments_rejected(configured_server):
+    """Arguments are checked against the input schema before the tool runs."""
+    async with create_connected_server_and_client_session(configured_server) as client:
+        result = await client.call_tool("validate_patterns", {"action": "nope"})
+
+    assert result.isError
+    assert "Input validation error" in result.content[0].text
+
+
+@pytest.mark.asyncio
+async def test_blocking_work_runs_off_the_event_loop(configured_server, monkeypatch):
+    """The loop keeps running while a sync_documentation check blocks."""
+    import importlib
+    import threading
+    import time
+
+    # The tools package re-exports the function under the module's name
+    sync_module = importlib.import_module("best_practices_mcp.tools.sync_documentation")
+
+    loop_thread = threading.get_ident()
+    check_threads = []
+
+    def slow_report(*args):
+        check_threads.append(threading.get_ident())
+        time.sleep(0.2)
+        return {"action": "generate_report"}
+
+    monkeypatch.setattr(sync_module, "_generate_report", slow_report)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    async with create_connected_server_and_client_session(configured_server) as client:
+        task = asyncio.create_task(ticker())
+        await client.call_tool("sync_documentation", {"action": "generate_report"})
+        task.cancel()
+
+    assert check_threads and check_threads[0] != loop_thread
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_registry_resource_renders_off_the_event_loop(configured_server, monkeypatch):
+    """The full registry is serialized on the shared executor."""
+    import threading
+
+    from pydantic import AnyUrl
+
+    registry = server_module.pattern_registry
+    loop_thread = threading.get_ident()
+    render_threads = []
+    original = registry.to_dict
+    monkeypatch.setattr(registry, "to_dict", lambda: render_threads.append(threading.get_ident()) or original())
+
+    async with create_connected_server_and_client_session(configured_server) as client:
+        result = await client.read_resource(AnyUrl("patterns://registry"))
+
+    assert json.loads(result.contents[0].text)["total_patterns"] == 3
+    assert render_threads and render_threads[0] != loop_thread
@@ -0,0 +1,93 @@
+"""Tests for SourceRegistry."""
+
+import pytest
+
+from best_practices_mcp.parsers.parse_cache import ParseCache
+from best_practices_mcp.resources.source_registry import SourceRegistry, normalize_url
+
+
+SOURCES_MD = """# Sources
+
+## Primary Sources (Tier A)
+
+### Anthropic Docs
+
+**URL**: https://docs.example.com/guide/
+**Key Insights**:
+  - Keep context small
+
+Referenced by patterns/context-engineering.md and patterns/memory.md
+
+### Engineering Blog
+
+**URL**: https://Blog.Example.com/post#intro
+
+Referenced by patterns/memory.md
+
+## Community Sources (Tier C)
+
+### Forum Thread
+
+**URL**: https://forum.example.com/t/1
+"""
+
+
+@pytest.fixture
+def source_registry(tmp_path):
+    """Create a registry over a small SOURCES.md."""
+    sources_file = tmp_path / "SOURCES.md"
+    sources_file.write_text(SOURCES_MD)
+    return SourceRegistry(sources_file)
+
+
+def test_normalize_url():
+    """Scheme, host, fragment and trailing slash differences are ignored."""
+    assert normalize_url("HTTPS://Example.com/a/#frag") == "https://example.com/a"
+    assert normalize_url(" https://example.com/a?x=1 ") == "https://example.com/a?x=1"
+
+
+def test_get_by_url_uses_normalized_index(source_registry):
+    """URL lookups match normalized spellings."""
+    assert source_registry.get_by_url("https://docs.example.com/guide").id == "anthropic-docs"
+    assert source_registry.get_by_url("https://blog.example.com/post").id == "engineering-blog"
+    assert source_registry.get_by_url("https://unknown.example.com") is None
+
+
+def test_lookup_indexes(source_registry):
+    """Id, tier and pattern reference lookups are served from indexes."""
+    assert source_registry.get_by_id("forum-thread").tier == "C"
+    assert [s.id for s in source_registry.get_by_tier("a")] == ["anthropic-docs", "engineering-blog"]
+    assert [s.id for s in source_registry.get_sources_for_pattern("memory")] == [
+        "anthropic-docs", "engineering-blog"
+    ]
+    assert source_registry.get_sources_for_pattern("unknown") == []
+
+
+def test_parse_cache_round_trip(tmp_path, monkeypatch):
+    """Unchanged SOURCES.md is loaded from the cache without parsing."""
+    sources_file = tmp_path / "SOURCES.md"
+    sources_file.write_text(SOURCES_MD)
+    cache = ParseCache(tmp_path / "parse-cache.sqlite3")
+    expected = [s.to_dict() for s in SourceRegistry(sources_file, cache=cache).get_all()]
+
+    registry = SourceRegistry(sources_file, cache=cache)
+    monkeypatch.setattr(registry.parser, "parse", lambda: pytest.fail("cache miss"))
+
+    assert [s.to_dict() for s in registry.get_all()] == expected
+
+
+def test_parser_streams_entries(tmp_path):
+    """Entries are yielded as headings close them, in document order."""
+    from best_practices_mcp.parsers.sources_parser import SourcesParser
+
+    lines = iter((SOURCES_MD + "### Trailing\n\n**URL**: https://x.example.com\n").splitlines(keepends=True))
+    entries = SourcesParser(tmp_path / "unused.md").parse_lines(lines)
+
+    first = next(entries)
+    assert first.id == "anthropic-docs"
+    assert first.key_insights == ("Keep context small",)
+    assert first.pattern_refs == ("context-engineering", "memory")
+    # Reading stopped at the heading that closed the first entry
+    assert next(lines) == "\n"
+    assert next(lines).startswith("**URL**: https://Blog")
+    assert [e.id for e in entries] == ["engineering-blog", "forum-thread", "trailing"]
@@ -1,37 +1,52 @@
 """Tests for sync_documentation tool."""
 
 import pytest
-from pathlib import Path
 from unittest.mock import MagicMock
 
+from best_practices_mcp.resources.pattern_registry import PatternRegistry
 from best_practices_mcp.tools.sync_documentation import sync_documentation
-from best_practices_mcp.parsers.markdown_parser import PatternMetadata
+
+
+TEST_PATTERN_MD = """# Test Pattern
+
+**Evidence Tier**: A
+**SDD Phase**: Specify
+
+## Implementation
+
+Details.
+
+## Sources
+
+- [Test Source](https://example.com)
+"""
+
+OTHER_PATTERN_MD = """# Other Pattern
+
+**Evidence Tier**: A
+**SDD Phase**: Specify
+
+Builds on [Test Pattern](./test-pattern.md).
+
+## Sources
+
+- [Test Source](https://example.com)
+"""
 
 
 @pytest.fixture
-def mock_pattern():
-    """Create a mock pattern for testing."""
-    return PatternMetadata(
-        id="test-pattern",
-        name="Test Pattern",
-        file_path="patterns/test-pattern.md",
-        sources=[{"title": "Test Source", "url": "https://example.com", "tier": "A"}],
-        evidence_tier="A",
-        sdd_phase="specify",
-        related_patterns=[],
-        sections=["Implementation"],
-        internal_links=[],
-        external_links=["https://example.com"],
-    )
+def patterns_dir(tmp_path):
+    """Create a patterns directory holding a single pattern."""
+    directory = tmp_path / "patterns"
+    directory.mkdir()
+    (directory / "test-pattern.md").write_text(TEST_PATTERN_MD)
+    return directory
 
 
 @pytest.fixture
-def mock_pattern_registry(mock_pattern):
-    """Create a mock pattern registry."""
-    registry = MagicMock()
-    registry.get_all.return_value = [mock_pattern]
-    registry.get_by_id.return_value = mock_pattern
-    return registry
+def pattern_registry(patterns_dir):
+    """Create a pattern registry over the patterns directory."""
+    return PatternRegistry(patterns_dir)
 
 
 @pytest.fixture
@@ -44,7 +59,7 @@ def mock_source_registry():
 
 
 @pytest.mark.asyncio
-async def test_check_consistency(mock_pattern_registry, mock_source_registry, tmp_path):
+async def test_check_consistency(pattern_registry, mock_source_registry, tmp_path):
     """Test consistency checking."""
     # Create mock CLAUDE.md
     claude_dir = tmp_path / ".claude"
@@ -55,7 +70,7 @@ async def test_check_consistency(mock_pattern_registry, mock_source_registry, tm
         action="check_consistency",
         scope="patterns",
         auto_fix=False,
-        pattern_registry=mock_pattern_registry,
+        pattern_registry=pattern_registry,
         source_registry=mock_source_registry,
         repo_root=tmp_path,
         index_file=tmp_path / "INDEX.md",
@@ -67,13 +82,13 @@ async def test_check_consistency(mock_pattern_registry, mock_source_registry, tm
 
 
 @pytest.mark.asyncio
-async def test_update_index_missing_file(mock_pattern_registry, mock_source_registry, tmp_path):
+async def test_update_index_missing_file(pattern_registry, mock_source_registry, tmp_path):
     """Test INDEX.md update detection when file doesn't exist."""
     result = await sync_documentation(
         action="update_index",
         scope="all",
         auto_fix=False,
-        pattern_registry=mock_pattern_registry,
+        pattern_registry=pattern_registry,
         source_registry=mock_source_registry,
         repo_root=tmp_path,
         index_file=tmp_path / "INDEX.md",
@@ -84,13 +99,13 @@ async def test_update_index_missing_file(mock_pattern_registry, mock_source_regi
 
 
 @pytest.mark.asyncio
-async def test_verify_cross_refs(mock_pattern_registry, mock_source_registry, tmp_path):
+async def test_verify_cross_refs(pattern_registry, mock_source_registry, tmp_path):
     """Test cross-reference verification."""
     result = await sync_documentation(
         action="verify_cross_refs",
         scope="patterns",
         auto_fix=False,
-        pattern_registry=mock_pattern_registry,
+        pattern_registry=pattern_registry,
         source_registry=mock_source_registry,
         repo_root=tmp_path,
         index_file=tmp_path / "INDEX.md",
@@ -101,13 +116,13 @@ async def test_verify_cross_refs(mock_pattern_registry, mock_source_registry, tm
 
 
 @pytest.mark.asyncio
-async def test_generate_report(mock_pattern_registry, mock_source_registry, tmp_path):
+async def test_generate_report(pattern_registry, mock_source_registry, tmp_path):
     """Test report generation."""
     result = await sync_documentation(
         action="generate_report",
         scope="all",
         auto_fix=False,
-        pattern_registry=mock_pattern_registry,
+        pattern_registry=pattern_registry,
         source_registry=mock_source_registry,
         repo_root=tmp_path,
         index_file=tmp_path / "INDEX.md",
@@ -116,16 +131,21 @@ async def test_generate_report(mock_pattern_registry, mock_source_registry, tmp_
     assert result["action"] == "generate_report"
     assert "report" in result
     assert "total_patterns" in result["report"]
+    report = result["report"]
+    assert report["patterns_by_tier"] == {"A": 1, "B": 0, "C": 0, "D": 0, "None": 0}
+    assert report["patterns_by_phase"] == {"specify": 1}
+    assert report["patterns_without_sources"] == []
+    assert report["orphan_patterns"] == ["test-pattern"]
 
 
 @pytest.mark.asyncio
-async def test_unknown_action(mock_pattern_registry, mock_source_registry, tmp_path):
+async def test_unknown_action(pattern_registry, mock_source_registry, tmp_path):
     """Test unknown action returns error."""
     result = await sync_documentation(
         action="unknown_action",
         scope="all",
         auto_fix=False,
-        pattern_registry=mock_pattern_registry,
+        pattern_registry=pattern_registry,
         source_registry=mock_source_registry,
         repo_root=tmp_path,
         index_file=tmp_path / "INDEX.md",
@@ -133,3 +153,32 @@ async def test_unknown_action(mock_pattern_registry, mock_source_registry, tmp_p
 
     assert "error" in result
     assert "Unknown action" in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_verify_cross_refs_shared_sources(patterns_dir, mock_source_registry, tmp_path):
+    """Patterns in one phase that share sources should reference each other."""
+    (patterns_dir / "other-pattern.md").write_text(OTHER_PATTERN_MD)
+
+    result = await sync_documentation(
+        action="verify_cross_refs",
+        scope="patterns",
+        auto_fix=False,
+        pattern_registry=PatternRegistry(patterns_dir),
+        source_registry=mock_source_registry,
+        repo_root=tmp_path,
+        index_file=tmp_path / "INDEX.md",
+    )
+
+    assert result["missing_cross_refs"] == [
+        {
+            "pattern": "test-pattern",
+            "should_reference": "other-pattern",
+            "reason": "other-pattern references test-pattern, but not vice versa",
+        },
+        {
+            "pattern": "test-pattern",
+            "should_reference": "other-pattern",
+            "reason": "Patterns share 1 source(s) and same SDD phase",
+        },
+    ]
@@ -1,11 +1,14 @@
 """Tests for validate_patterns tool."""
 
+import dataclasses
+
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock
 
 from best_practices_mcp.tools.validate_patterns import validate_patterns
 from best_practices_mcp.parsers.markdown_parser import PatternMetadata
+from best_practices_mcp.resources.pattern_registry import PatternRegistry
 
 
 @pytest.fixture
@@ -118,3 +121,106 @@ async def test_validate_unknown_action(mock_pattern_registry, mock_source_regist
 
     assert "error" in result
     assert "Unknown action" in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_check_memo_hits_on_repeat_run(mock_pattern_registry, mock_source_registry, tmp_path):
+    """A second run over unchanged inputs is served from the memo."""
+    from best_practices_mcp.tools.check_memo import CheckMemo
+
+    patterns_dir = tmp_path / "patterns"
+    patterns_dir.mkdir()
+    (patterns_dir / "context-engineering.md").write_text("# Context Engineering")
+    memo = CheckMemo(tmp_path / "memo" / "check-memo.sqlite3")
+    kwargs = dict(
+        action="validate_all",
+        pattern_id=None,
+        validation_type="cross-refs",
+        pattern_registry=mock_pattern_registry,
+        source_registry=mock_source_registry,
+        repo_root=tmp_path,
+        memo=memo,
+    )
+
+    first = await validate_patterns(**kwargs)
+    second = await validate_patterns(**kwargs)
+    assert first["summary"]["cache"]["misses"] == 1
+    assert second["summary"]["cache"] == {
+        "hits": 1, "misses": 0, "by_check": {"cross-refs": {"hits": 1, "misses": 0}},
+    }
+    assert second["results"] == first["results"]
+
+    # Removing a target changes the cross-ref inputs
+    (patterns_dir / "context-engineering.md").unlink()
+    third = await validate_patterns(**kwargs)
+    assert third["summary"]["cache"]["misses"] == 1
+    assert third["results"][0]["status"] == "broken"
+
+    # The memo persists across instances
+    memo.close()
+    kwargs["memo"] = CheckMemo(tmp_path / "memo" / "check-memo.sqlite3")
+    assert (await validate_patterns(**kwargs))["summary"]["cache"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_internal_links_checked_against_snapshot(mock_pattern, mock_pattern_registry, mock_source_registry, tmp_path):
+    """Internal links resolve from the pattern directory or the repo root."""
+    patterns_dir = tmp_path / "patterns"
+    patterns_dir.mkdir()
+    (patterns_dir / "context-engineering.md").write_text("# Context Engineering")
+    mock_pattern_registry.get_by_id.return_value = dataclasses.replace(mock_pattern, external_links=[], internal_links=[
+        "patterns/context-engineering.md",
+        "./context-engineering.md",
+        "../patterns/missing.md",
+    ])
+
+    result = await validate_patterns(
+        action="validate_single",
+        pattern_id="test-pattern",
+        validation_type="links",
+        pattern_registry=mock_pattern_registry,
+        source_registry=mock_source_registry,
+        repo_root=tmp_path,
+    )
+
+    messages = [issue["description"] for issue in result["results"][0]["issues"]]
+    assert len(messages) == 1
+    assert "../patterns/missing.md" in messages[0]
+
+
+@pytest.mark.asyncio
+async def test_validate_single_batch(mock_source_registry, tmp_path):
+    """pattern_ids accepts IDs and globs and keys results by pattern."""
+    patterns_dir = tmp_path / "patterns"
+    patterns_dir.mkdir()
+    for pattern_id in ("agent-loop", "agent-memory", "context-engineering"):
+        (patterns_dir / f"{pattern_id}.md").write_text(
+            f"# {pattern_id}\n\n**Evidence Tier**: B\n\n## Implementation\n\nDetails.\n"
+        )
+    registry = PatternRegistry(patterns_dir)
+
+    result = await validate_patterns(
+        action="validate_single",
+        pattern_id=None,
+        pattern_ids=["context-engineering", "agent-*", "agent-loop", "missing"],
+        validation_type="structure",
+        pattern_registry=registry,
+        source_registry=mock_source_registry,
+        repo_root=tmp_path,
+    )
+
+    assert list(result["results"]) == ["context-engineering", "agent-loop", "agent-memory"]
+    assert result["results"]["agent-loop"]["pattern_id"] == "agent-loop"
+    assert result["patterns_checked"] == 3
+    assert result["not_found"] == ["missing"]
+
+    result = await validate_patterns(
+        action="validate_single",
+        pattern_id=None,
+        pattern_ids=["nope-*"],
+        validation_type="structure",
+        pattern_registry=registry,
+        source_registry=mock_source_registry,
+        repo_root=tmp_path,
+    )
+    assert "error" in result
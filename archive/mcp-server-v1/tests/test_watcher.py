@@ -0,0 +1,84 @@
+"""Tests for RegistryWatcher."""
+
+import asyncio
+import threading
+
+import pytest
+
+from best_practices_mcp.resources.pattern_registry import PatternRegistry
+from best_practices_mcp.resources.source_registry import SourceRegistry
+from best_practices_mcp.watcher import RegistryWatcher, watchfiles
+
+
+async def _wait_for(condition, timeout=5.0):
+    """Poll until condition() is true or the timeout expires."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met before timeout")
+        await asyncio.sleep(0.02)
+
+
+@pytest.fixture
+def registries(tmp_path):
+    """Create registries over a temporary repo."""
+    patterns_dir = tmp_path / "patterns"
+    patterns_dir.mkdir()
+    (patterns_dir / "alpha.md").write_text("# Alpha\n")
+    sources_file = tmp_path / "SOURCES.md"
+    sources_file.write_text("# Sources\n")
+    return PatternRegistry(patterns_dir), SourceRegistry(sources_file)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", [
+    "poll",
+    pytest.param("inotify", marks=pytest.mark.skipif(watchfiles is None, reason="watchfiles not installed")),
+])
+async def test_watcher_applies_updates(registries, mode):
+    """Pattern and source edits reach the registries without a read."""
+    pattern_registry, source_registry = registries
+    watcher = RegistryWatcher(
+        pattern_registry, source_registry, mode=mode, debounce=0.05, poll_interval=0.05
+    )
+    watcher.start()
+    try:
+        await _wait_for(lambda: pattern_registry.get_by_id("alpha") is not None)
+        await asyncio.sleep(0.1)
+
+        (pattern_registry.patterns_dir / "beta.md").write_text("# Beta\n")
+        source_registry.sources_file.write_text(
+            "# Sources\n\n## Primary Sources (Tier A)\n\n### Docs\n\n**URL**: https://example.com\n"
+        )
+
+        await _wait_for(lambda: pattern_registry.get_by_id("beta") is not None)
+        await _wait_for(lambda: source_registry.get_by_id("docs") is not None)
+    finally:
+        await watcher.stop()
+
+    assert not watcher.running
+
+
+@pytest.mark.asyncio
+async def test_polling_stats_files_off_the_event_loop(registries, monkeypatch):
+    """Each poll scans the watched files on the shared executor."""
+    watcher = RegistryWatcher(*registries, mode="poll", debounce=0.05, poll_interval=0.02)
+    loop_thread = threading.get_ident()
+    scan_threads = []
+    original = watcher._snapshot
+    monkeypatch.setattr(watcher, "_snapshot", lambda: scan_threads.append(threading.get_ident()) or original())
+
+    watcher.start()
+    try:
+        await _wait_for(lambda: len(scan_threads) >= 3)
+    finally:
+        await watcher.stop()
+
+    assert loop_thread not in scan_threads
+
+
+def test_watcher_off_does_not_start(registries):
+    """Watch mode 'off' never starts a task."""
+    watcher = RegistryWatcher(*registries, mode="off")
+    assert watcher.start() is None
+    assert not watcher.running